@@ -19,6 +19,7 @@ from flask import request, jsonify, render_template
 from document_processing import extract_text_from_pdf, extract_text_from_docx
 from gemini_analyzer import analyze_compliance_summary, answer_syllabus_question
 
+from detectors import get_detector
 from detectors.slo_detector import SLODetector
 from detectors.grading_scale_detection import GradingScaleDetector
 from detectors.online_detection import (
@@ -47,7 +48,7 @@ _last_syllabus_text: dict[str, str] = {}
 # -----------------------------------------------------------------------------
 
 def detect_slos_with_regex(text: str) -> tuple[bool, str | None]:
-    slo_detector = SLODetector()
+    slo_detector = get_detector(SLODetector)
     result = slo_detector.detect(text)
     has_slos = bool(result.get("found"))
     slo_content = result.get("content")
@@ -172,7 +173,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
         result["slos"] = _format_slo_card_from_info(has_slos, slo_content)
 
         # --- Instructor detection ---
-        instructor_detector = InstructorDetector()
+        instructor_detector = get_detector(InstructorDetector)
         instructor_info = instructor_detector.detect(extracted_text)
         result["instructor"] = {
             "found": bool(instructor_info.get("found")),
@@ -182,7 +183,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
         }
 
         # --- Grading scale detection ---
-        grading_detector = GradingScaleDetector()
+        grading_detector = get_detector(GradingScaleDetector)
         grading_info = grading_detector.detect(extracted_text)
         result['grading_scale'] = {
             'found': bool(grading_info.get('found')),
@@ -213,7 +214,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Office Information detection ---
         if OfficeInformationDetector:
-            office_detector = OfficeInformationDetector()
+            office_detector = get_detector(OfficeInformationDetector)
             office_info = office_detector.detect(extracted_text)
             result["office_information"] = {
                 "location": office_info.get("office_location", {}).get("content"),
@@ -226,7 +227,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Email detection ---
         if EmailDetector:
-            email_detector = EmailDetector()
+            email_detector = get_detector(EmailDetector)
             email_info = email_detector.detect(extracted_text)
             result["email_information"] = {
                 "email": email_info.get("content"),
@@ -238,7 +239,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Preferred Contact detection ---
         if PreferredDetector:
-            preferred_detector = PreferredDetector()
+            preferred_detector = get_detector(PreferredDetector)
             preferred_info = preferred_detector.detect(extracted_text)
             result["preferred_information"] = {
                 "preferred": preferred_info.get("content"),
@@ -250,7 +251,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Late detection ---
         if LateDetector:
-            late_detector = LateDetector()
+            late_detector = get_detector(LateDetector)
             late_info = late_detector.detect(extracted_text)
             result["late_information"] = {
                 "late": late_info.get("content"),
@@ -262,7 +263,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Credit Hours detection ---
         if CreditHoursDetector:
-            credit_detector = CreditHoursDetector()
+            credit_detector = get_detector(CreditHoursDetector)
             credit_info = credit_detector.detect(extracted_text)
             result["credit_hours"] = {
                 "hours": credit_info.get("content"),
@@ -273,7 +274,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Workload detection ---
         if WorkloadDetector:
-            workload_detector = WorkloadDetector()
+            workload_detector = get_detector(WorkloadDetector)
             workload_info = workload_detector.detect(extracted_text)
             result["workload_information"] = {
                 "description": workload_info.get("content"),
@@ -283,7 +284,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
             result["workload_information"] = {"description": None, "found": False}
 
         # --- Assignment Delivery detection ---
-        assignment_delivery_detector = AssignmentDeliveryDetector()
+        assignment_delivery_detector = get_detector(AssignmentDeliveryDetector)
         ad_info = assignment_delivery_detector.detect(extracted_text)
         result["assignment_delivery"] = {
             "found": bool(ad_info.get("found")),
@@ -292,7 +293,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
         }
 
         # --- Assignment Types detection ---
-        assignment_types_detector = AssignmentTypesDetector()
+        assignment_types_detector = get_detector(AssignmentTypesDetector)
         at_info = assignment_types_detector.detect(extracted_text)
         result["assignment_types"] = {
             "found": bool(at_info.get("found")),
@@ -301,7 +302,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Grading Process detection ---
         try:
-            grading_process_detector = GradingProcessDetector()
+            grading_process_detector = get_detector(GradingProcessDetector)
             gp_info = grading_process_detector.detect(extracted_text)
             result["grading_process"] = {
                 "found": bool(gp_info.get("found")),
@@ -313,7 +314,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Response Time detection ---
         try:
-            response_time_detector = ResponseTimeDetector()
+            response_time_detector = get_detector(ResponseTimeDetector)
             rt_info = response_time_detector.detect(extracted_text)
             result["response_time"] = {
                 "found": bool(rt_info.get("found")),
@@ -325,7 +326,7 @@ def _process_single_file(file, temp_dir: str) -> dict:
 
         # --- Class Location detection ---
         try:
-            class_location_detector = ClassLocationDetector()
+            class_location_detector = get_detector(ClassLocationDetector)
             cl_info = class_location_detector.detect(extracted_text)
             result["class_location"] = {
                 "found": bool(cl_info.get("found")),
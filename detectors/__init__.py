@@ -1 +1,11 @@
+import functools
 
+
+@functools.lru_cache(maxsize=None)
+def get_detector(cls):
+    """
+    Shared instance of a detector class, built on first use.
+    Detectors keep no per-document state, so one instance per process
+    serves every document instead of being rebuilt for each one.
+    """
+    return cls()
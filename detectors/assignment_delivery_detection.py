@@ -19,6 +19,8 @@ Example:
 import re
 from typing import Dict, Any, List, Set
 
+from detectors import get_detector
+
 
 class AssignmentDeliveryDetector:
     """Finds where students submit assignments in syllabi"""
@@ -202,7 +204,7 @@ class AssignmentDeliveryDetector:
 
 def detect_assignment_delivery(text: str) -> str:
     """Simple wrapper - returns platform name or empty string"""
-    detector = AssignmentDeliveryDetector()
+    detector = get_detector(AssignmentDeliveryDetector)
     result = detector.detect(text)
     return result.get('content', '') if result.get('found') else ''
 
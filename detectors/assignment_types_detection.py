@@ -16,110 +16,145 @@ Example:
     Output: "Homework Assignments:" (confidence: high)
 """
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from detectors import get_detector
+
+# Every header pattern below starts with one of these words, so a single
+# multiline sweep over the whole document finds all candidate lines at once.
+# No keyword is a prefix of another, so at most one can match a line.
+HEADER_KEYWORDS = (
+    'assign', 'textbook', 'method', 'course', 'required', 'summary', 'homework',
+    'reading', 'lab', 'class', 'assessment', 'major', 'quizzes', 'student', 'evaluation',
+)
+HEADER_START_RX = re.compile(r'(?im)^[^\S\n]*(' + '|'.join(HEADER_KEYWORDS) + ')')
+
+# Exact patterns - complete phrases that must be standalone
+# Format: (pattern, score)
+EXACT_PATTERNS = (
+    ('assign', re.compile(r'(?i)^\s*assignments?\s*&\s*grades?\s*:?\s*$'), 150),
+    ('assign', re.compile(r'(?i)^\s*assignments?\s*&\s*grading\s*:?\s*$'), 150),
+    ('textbook', re.compile(r'(?i)^\s*textbook\s+chapter\s+quizzes\s*,?\s*discussions'), 140),
+    ('method', re.compile(r'(?i)^\s*methods\s+of\s+testing\s+/\s+evaluation\s*:?\s*$'), 135),
+    ('course', re.compile(r'(?i)^\s*course\s+requirements?\s+and\s+assessments?\s+overview\s*:?\s*$'), 135),
+    ('required', re.compile(r'(?i)^\s*required\s+paperwork\s+and\s+submissions?\s*\.?\s*$'), 130),
+    ('assign', re.compile(r'(?i)^\s*assignments?\s+and\s+course\s+specific\s+policies\s*:?\s*$'), 130),
+    ('assign', re.compile(r'(?i)^\s*assignment\s+and\s+grading\s+details?\s+lab\s*:?\s*$'), 125),
+    ('summary', re.compile(r'(?i)^\s*summary\s+of\s+student\s+evaluation\s*:?\s*$'), 120),
+    ('method', re.compile(r'(?i)^\s*methods\s*,\s*grade\s+components'), 115),
+)
+
+# Multiword standalone - phrases on their own line (higher scores)
+# Can include weight info like "(10%)" which we'll remove later
+MULTIWORD_STANDALONE = (
+    ('homework', re.compile(r'(?i)^\s*homework\s+assignments?\s+and\s+projects?\s*(?:\([^)]+\))?\s*:?\s*$'), 112),
+    ('reading', re.compile(r'(?i)^\s*reading\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 110),
+    ('lab', re.compile(r'(?i)^\s*laboratory\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 110),
+    ('lab', re.compile(r'(?i)^\s*lab\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 110),
+    ('homework', re.compile(r'(?i)^\s*homework\s+problems\s*(?:\([^)]+\))?\s*:?\s*$'), 110),
+    ('homework', re.compile(r'(?i)^\s*homework\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 110),
+    ('course', re.compile(r'(?i)^\s*course\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 108),
+    ('class', re.compile(r'(?i)^\s*class\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$'), 108),
+    ('assessment', re.compile(r'(?i)^\s*assessment\s+overview\s*:?\s*$'), 106),
+    ('major', re.compile(r'(?i)^\s*major\s+projects?\s*:?\s*$'), 105),
+    ('course', re.compile(r'(?i)^\s*course\s+activities\s*:?\s*$'), 105),
+    ('assign', re.compile(r'(?i)^\s*assignment\s+details?\s*:?\s*$'), 102),
+    ('quizzes', re.compile(r'(?i)^\s*quizzes\s+and\s+exams?\s*:?\s*$'), 100),
+    ('assign', re.compile(r'(?i)^\s*assignments?\s+and\s+grading\s*:?\s*$'), 98),
+    ('student', re.compile(r'(?i)^\s*student\s+evaluation\s*:?\s*$'), 90),
+    ('assessment', re.compile(r'(?i)^\s*assessment\s*,\s*participation\s+assignments?\s*:?\s*$'), 88),
+)
+
+# Multiword with content - header followed by text on same line (lower scores)
+# We extract just the header part using capture group
+MULTIWORD_WITH_CONTENT = (
+    ('homework', re.compile(r'(?i)^\s*(homework\s+assignments?\s+and\s+projects?)\s*(?:\([^)]+\))?\s*:'), 87),
+    ('reading', re.compile(r'(?i)^\s*(reading\s+assignments?)\s*(?:\([^)]+\))?\s*:'), 85),
+    ('lab', re.compile(r'(?i)^\s*(laboratory\s+assignments?)\s*(?:\([^)]+\))?\s*:'), 85),
+    ('lab', re.compile(r'(?i)^\s*(lab\s+assignments?)\s*(?:\([^)]+\))?\s*:'), 85),
+    ('homework', re.compile(r'(?i)^\s*(homework\s+problems)\s*(?:\([^)]+\))?\s*:'), 85),
+    ('homework', re.compile(r'(?i)^\s*(homework\s+assignments?)\s*(?:\([^)]+\))?\s*:'), 85),
+    ('course', re.compile(r'(?i)^\s*(course\s+assignments?)\s*:'), 83),
+    ('class', re.compile(r'(?i)^\s*(class\s+assignments?)\s*:'), 83),
+    ('assessment', re.compile(r'(?i)^\s*(assessment\s+overview)\s*:'), 81),
+    ('major', re.compile(r'(?i)^\s*(major\s+projects?)\s*:'), 80),
+    ('course', re.compile(r'(?i)^\s*(course\s+activities)\s*:'), 80),
+    ('assign', re.compile(r'(?i)^\s*(assignment\s+details?)\s*:'), 77),
+    ('quizzes', re.compile(r'(?i)^\s*(quizzes\s+and\s+exams?)\s*:'), 75),
+    ('assign', re.compile(r'(?i)^\s*(assignments?\s+and\s+grading)\s*:'), 73),
+    ('method', re.compile(r'(?i)^\s*(methods\s+of\s+testing\s*/\s*evaluation)\s*:'), 130),
+)
+
+# Singleword standalone - one word on its own line (higher scores)
+SINGLEWORD_STANDALONE = (
+    ('assessment', re.compile(r'(?i)^\s*assessment\s*:?\s*$'), 70),
+    ('homework', re.compile(r'(?i)^\s*homework\s*(?:\([^)]+\))?\s*:?\s*$'), 65),
+    ('assign', re.compile(r'(?i)^\s*assignments?\s*:?\s*$'), 60),
+    ('evaluation', re.compile(r'(?i)^\s*evaluation\s*:?\s*$'), 50),
+)
+
+# Singleword with content - one word followed by text (lower scores)
+SINGLEWORD_WITH_CONTENT = (
+    ('assessment', re.compile(r'(?i)^\s*(assessment)\s*:'), 55),
+    ('homework', re.compile(r'(?i)^\s*(homework)\s*(?:\([^)]+\))?\s*:'), 50),
+    ('assign', re.compile(r'(?i)^\s*(assignments?)\s*:'), 45),
+)
+
+# Schedule indicators - patterns that suggest this is a weekly schedule, not a section header
+SCHEDULE_PATTERNS = (
+    re.compile(r'(?i)week\s*#?\d+'),
+    re.compile(r'(?i)homework\s*:\s*(reading|complete|work\s+on|finish|continue|start)'),
+    re.compile(r'(?i)due\s+(by\s+)?next\s+week'),
+    re.compile(r'(?i)lecture\s*[-–]\s*review'),
+)
+
+# Exclude patterns - these belong to grading_procedures_title, NOT assignment_types_title
+# Important: Skip anything about grading policies/procedures/scales
+EXCLUDE_PATTERNS = (
+    re.compile(r'(?i)grading\s+and\s+evaluation\s+of\s+student\s+work'),
+    re.compile(r'(?i)evaluation\s+of\s+student\s+work'),
+    re.compile(r'(?i)grading\s+policy'),
+    re.compile(r'(?i)grading\s+procedure'),
+    re.compile(r'(?i)grading\s+distribution'),
+    re.compile(r'(?i)grading\s+scale'),
+    re.compile(r'(?i)grade\s+distribution'),
+    re.compile(r'(?i)final\s+grade\s+(calculation|scale)'),
+    re.compile(r'(?i)course\s+grading'),
+    re.compile(r'(?i)rubric\s+and\s+evaluation'),
+)
+
+# Schedule-like wording that invalidates a "header: content" line
+CONTENT_GUARD_PATTERN = re.compile(r'(?i)(reading|complete|work\s+on|due|week\s+\d+)')
+
+
+# Score tables as (pattern, score) pairs, and the same split by leading
+# keyword (order kept), so a line only tries the few patterns that can match
+# the keyword it starts with
+KEYED_TIERS = (
+    EXACT_PATTERNS, MULTIWORD_STANDALONE, MULTIWORD_WITH_CONTENT,
+    SINGLEWORD_STANDALONE, SINGLEWORD_WITH_CONTENT,
+)
+PATTERN_TIERS = tuple(tuple((pattern, score) for _, pattern, score in tier) for tier in KEYED_TIERS)
+PATTERNS_BY_KEYWORD = {
+    kw: tuple(tuple((pattern, score) for key, pattern, score in tier if key == kw) for tier in KEYED_TIERS)
+    for kw in HEADER_KEYWORDS
+}
+
 
 class AssignmentTypesDetector:
     """Finds assignment types section titles in syllabi"""
     
     def __init__(self):
-        # Exact patterns - complete phrases that must be standalone
-        # Format: (pattern, score)
-        self.exact_patterns = [
-            (r'(?i)^\s*assignments?\s*&\s*grades?\s*:?\s*$', 150),
-            (r'(?i)^\s*assignments?\s*&\s*grading\s*:?\s*$', 150),
-            (r'(?i)^\s*textbook\s+chapter\s+quizzes\s*,?\s*discussions', 140),
-            (r'(?i)^\s*methods\s+of\s+testing\s+/\s+evaluation\s*:?\s*$', 135),
-            (r'(?i)^\s*course\s+requirements?\s+and\s+assessments?\s+overview\s*:?\s*$', 135),
-            (r'(?i)^\s*required\s+paperwork\s+and\s+submissions?\s*\.?\s*$', 130),
-            (r'(?i)^\s*assignments?\s+and\s+course\s+specific\s+policies\s*:?\s*$', 130),
-            (r'(?i)^\s*assignment\s+and\s+grading\s+details?\s+lab\s*:?\s*$', 125),
-            (r'(?i)^\s*summary\s+of\s+student\s+evaluation\s*:?\s*$', 120),
-            (r'(?i)^\s*methods\s*,\s*grade\s+components', 115),
-        ]
-        
-        # Multiword standalone - phrases on their own line (higher scores)
-        # Can include weight info like "(10%)" which we'll remove later
-        self.multiword_standalone = [
-            (r'(?i)^\s*homework\s+assignments?\s+and\s+projects?\s*(?:\([^)]+\))?\s*:?\s*$', 112),
-            (r'(?i)^\s*reading\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 110),
-            (r'(?i)^\s*laboratory\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 110),
-            (r'(?i)^\s*lab\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 110),
-            (r'(?i)^\s*homework\s+problems\s*(?:\([^)]+\))?\s*:?\s*$', 110),
-            (r'(?i)^\s*homework\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 110),
-            (r'(?i)^\s*course\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 108),
-            (r'(?i)^\s*class\s+assignments?\s*(?:\([^)]+\))?\s*:?\s*$', 108),
-            (r'(?i)^\s*assessment\s+overview\s*:?\s*$', 106),
-            (r'(?i)^\s*major\s+projects?\s*:?\s*$', 105),
-            (r'(?i)^\s*course\s+activities\s*:?\s*$', 105),
-            (r'(?i)^\s*assignment\s+details?\s*:?\s*$', 102),
-            (r'(?i)^\s*quizzes\s+and\s+exams?\s*:?\s*$', 100),
-            (r'(?i)^\s*assignments?\s+and\s+grading\s*:?\s*$', 98),
-            (r'(?i)^\s*student\s+evaluation\s*:?\s*$', 90),
-            (r'(?i)^\s*assessment\s*,\s*participation\s+assignments?\s*:?\s*$', 88),
-        ]
-        
-        # Multiword with content - header followed by text on same line (lower scores)
-        # We extract just the header part using capture group
-        self.multiword_with_content = [
-            (r'(?i)^\s*(homework\s+assignments?\s+and\s+projects?)\s*(?:\([^)]+\))?\s*:', 87),
-            (r'(?i)^\s*(reading\s+assignments?)\s*(?:\([^)]+\))?\s*:', 85),
-            (r'(?i)^\s*(laboratory\s+assignments?)\s*(?:\([^)]+\))?\s*:', 85),
-            (r'(?i)^\s*(lab\s+assignments?)\s*(?:\([^)]+\))?\s*:', 85),
-            (r'(?i)^\s*(homework\s+problems)\s*(?:\([^)]+\))?\s*:', 85),
-            (r'(?i)^\s*(homework\s+assignments?)\s*(?:\([^)]+\))?\s*:', 85),
-            (r'(?i)^\s*(course\s+assignments?)\s*:', 83),
-            (r'(?i)^\s*(class\s+assignments?)\s*:', 83),
-            (r'(?i)^\s*(assessment\s+overview)\s*:', 81),
-            (r'(?i)^\s*(major\s+projects?)\s*:', 80),
-            (r'(?i)^\s*(course\s+activities)\s*:', 80),
-            (r'(?i)^\s*(assignment\s+details?)\s*:', 77),
-            (r'(?i)^\s*(quizzes\s+and\s+exams?)\s*:', 75),
-            (r'(?i)^\s*(assignments?\s+and\s+grading)\s*:', 73),
-            (r'(?i)^\s*(methods\s+of\s+testing\s*/\s*evaluation)\s*:', 130),
-        ]
-        
-        # Singleword standalone - one word on its own line (higher scores)
-        self.singleword_standalone = [
-            (r'(?i)^\s*assessment\s*:?\s*$', 70),
-            (r'(?i)^\s*homework\s*(?:\([^)]+\))?\s*:?\s*$', 65),
-            (r'(?i)^\s*assignments?\s*:?\s*$', 60),
-            (r'(?i)^\s*evaluation\s*:?\s*$', 50),
-        ]
-        
-        # Singleword with content - one word followed by text (lower scores)
-        self.singleword_with_content = [
-            (r'(?i)^\s*(assessment)\s*:', 55),
-            (r'(?i)^\s*(homework)\s*(?:\([^)]+\))?\s*:', 50),
-            (r'(?i)^\s*(assignments?)\s*:', 45),
-        ]
-        
-        # Schedule indicators - patterns that suggest this is a weekly schedule, not a section header
-        self.schedule_patterns = [
-            r'(?i)week\s*#?\d+',
-            r'(?i)homework\s*:\s*(reading|complete|work\s+on|finish|continue|start)',
-            r'(?i)due\s+(by\s+)?next\s+week',
-            r'(?i)lecture\s*[-–]\s*review',
-        ]
-        
-        # Exclude patterns - these belong to grading_procedures_title, NOT assignment_types_title
-        # Important: Skip anything about grading policies/procedures/scales
-        self.exclude_patterns = [
-            r'(?i)grading\s+and\s+evaluation\s+of\s+student\s+work',
-            r'(?i)evaluation\s+of\s+student\s+work',
-            r'(?i)grading\s+policy',
-            r'(?i)grading\s+procedure',
-            r'(?i)grading\s+distribution',
-            r'(?i)grading\s+scale',
-            r'(?i)grade\s+distribution',
-            r'(?i)final\s+grade\s+(calculation|scale)',
-            r'(?i)course\s+grading',
-            r'(?i)rubric\s+and\s+evaluation',
-        ]
+        # Pattern tables are compiled once at import and shared by all instances
+        self.schedule_patterns = SCHEDULE_PATTERNS
+        self.exclude_patterns = EXCLUDE_PATTERNS
+        self.content_guard_pattern = CONTENT_GUARD_PATTERN
+        self.patterns_by_keyword = PATTERNS_BY_KEYWORD
     
     def _is_in_schedule(self, line: str, context: str) -> bool:
         """Check if line is part of a weekly schedule section"""
         for p in self.schedule_patterns:
-            if re.search(p, line):
+            if p.search(line):
                 return True
         context_lower = context.lower()
         for kw in ['week #', 'homework: reading', 'due by next week']:
@@ -135,7 +170,7 @@ class AssignmentTypesDetector:
         line_lower = line.lower().strip()
         
         for pattern in self.exclude_patterns:
-            if re.search(pattern, line_lower):
+            if pattern.search(line_lower):
                 return True
         
         # If contains both "grading" and "evaluation", likely a grading procedures header
@@ -157,10 +192,46 @@ class AssignmentTypesDetector:
         """Check if line with content after header is valid (not schedule-like)"""
         if len(line) > 200:
             return False
-        if re.search(r'(?i)(reading|complete|work\s+on|due|week\s+\d+)', line):
+        if self.content_guard_pattern.search(line):
             return False
         return True
     
+    def _classify(self, l: str, tiers: Tuple[tuple, ...]) -> Optional[Tuple[int, str]]:
+        """
+        Try the score tiers in order of specificity.
+        Returns (score, title) for the first pattern that matches, or None.
+        """
+        exact, multi_standalone, multi_content, single_standalone, single_content = tiers
+        
+        # 1. Exact patterns (highest scores)
+        for pat, score in exact:
+            if pat.match(l):
+                return score, l
+        
+        # 2. Multiword standalone
+        for pat, score in multi_standalone:
+            if pat.match(l):
+                return score, self._normalize_title(l)
+        
+        # 3. Multiword with content
+        for pat, score in multi_content:
+            match = pat.match(l)
+            if match and self._is_valid_with_content(l):
+                return score, match.group(1) + ":"
+        
+        # 4. Singleword standalone
+        for pat, score in single_standalone:
+            if pat.match(l):
+                return score, self._normalize_title(l)
+        
+        # 5. Singleword with content
+        for pat, score in single_content:
+            match = pat.match(l)
+            if match and self._is_valid_with_content(l):
+                return score, match.group(1) + ":"
+        
+        return None
+    
     def detect(self, text: str) -> Dict[str, Any]:
         """
         Find assignment types section title in syllabus.
@@ -171,16 +242,32 @@ class AssignmentTypesDetector:
         if not text:
             return {"found": False, "content": ""}
         
-        lines = text.split("\n")
+        lines = None
         candidates = []
         
-        for i, line in enumerate(lines):
-            l = line.strip()
+        # Only visit lines that start with a header keyword; the line index is
+        # tracked by counting newlines between consecutive matches
+        i, pos = 0, 0
+        for m in HEADER_START_RX.finditer(text):
+            i += text.count("\n", pos, m.start())
+            pos = m.start()
+            if lines is None:
+                # Split on "\n" only (not splitlines) so indexes match the count above
+                lines = text.split("\n")
+            l = lines[i].strip()
             
             if len(l) < 2 or len(l) > 250:
                 continue
             
-            # CRITICAL: Skip grading-related headers first
+            # Match the header patterns first: they only look at this one line,
+            # while the exclusion and schedule checks below are much costlier.
+            # Unusual case-folded matches (e.g. the long s) fall back to all patterns
+            tiers = self.patterns_by_keyword.get(m.group(1).lower()) or PATTERN_TIERS
+            found = self._classify(l, tiers)
+            if found is None:
+                continue
+            
+            # CRITICAL: Skip grading-related headers
             if self._should_exclude(l):
                 continue
             
@@ -191,58 +278,19 @@ class AssignmentTypesDetector:
             if self._is_in_schedule(l, context):
                 continue
             
-            # Try patterns in order of specificity
-            # 1. Exact patterns (highest scores)
-            for pat, score in self.exact_patterns:
-                if re.match(pat, l):
-                    candidates.append({"content": l, "score": score, "line": i})
-                    break
-            else:
-                # 2. Multiword standalone
-                for pat, score in self.multiword_standalone:
-                    if re.match(pat, l):
-                        normalized = self._normalize_title(l)
-                        candidates.append({"content": normalized, "score": score, "line": i})
-                        break
-                else:
-                    # 3. Multiword with content
-                    matched = False
-                    for pat, score in self.multiword_with_content:
-                        match = re.match(pat, l)
-                        if match and self._is_valid_with_content(l):
-                            header = match.group(1) + ":"
-                            candidates.append({"content": header, "score": score, "line": i})
-                            matched = True
-                            break
-                    
-                    if not matched:
-                        # 4. Singleword standalone
-                        for pat, score in self.singleword_standalone:
-                            if re.match(pat, l):
-                                normalized = self._normalize_title(l)
-                                candidates.append({"content": normalized, "score": score, "line": i})
-                                matched = True
-                                break
-                        
-                        if not matched:
-                            # 5. Singleword with content
-                            for pat, score in self.singleword_with_content:
-                                match = re.match(pat, l)
-                                if match and self._is_valid_with_content(l):
-                                    header = match.group(1) + ":"
-                                    candidates.append({"content": header, "score": score, "line": i})
-                                    break
+            score, content = found
+            candidates.append((score, -i, content))
         
         if candidates:
-            # Return highest scoring candidate (earlier line breaks ties)
-            best = max(candidates, key=lambda x: (x["score"], -x["line"]))
-            return {"found": True, "content": best["content"]}
+            # Candidates are (score, -line, content) so earlier lines win ties
+            best = max(candidates)
+            return {"found": True, "content": best[2]}
         
         return {"found": False, "content": ""}
 
 
 def detect_assignment_types_title(text: str) -> str:
     """Simple wrapper - returns title or 'Missing'"""
-    detector = AssignmentTypesDetector()
+    detector = get_detector(AssignmentTypesDetector)
     result = detector.detect(text)
     return result.get("content", "") if result.get("found") else "Missing"
\ No newline at end of file
@@ -40,6 +40,67 @@ HIGH_CONFIDENCE = 0.95
 MEDIUM_CONFIDENCE = 0.85
 LOW_CONFIDENCE = 0.70
 
+# Words just before a match that mark it as a product/model number (e.g., "MegaFix P1135")
+PRODUCT_KEYWORDS = ('megafix', 'model', 'product', 'part', 'item', 'catalog', 'screw')
+
+# POSITIVE indicators: class location section keywords
+CLASS_LOCATION_KEYWORDS = (
+    r'class\s+location',
+    r'class\s+meets?',
+    r'class\s+meeting',
+    r'meeting\s+location',
+    r'meeting\s+place',
+    r'meeting\s+time\s+and\s+place',
+    r'location\s+and\s+time',
+    r'time\s+and\s+location',
+    r'where\s+we\s+meet',
+    r'where\s+the\s+class\s+meets',
+    r'course\s+location',
+    r'course\s+room',
+    r'lecture\s+location',
+    r'when\s+and\s+where',
+    r'schedule\s+and\s+location',
+    r'classroom',
+    r'lecture\s+room',
+    r'\(lecture[;,]',  # "(Lecture;" or "(Lecture," indicates class context
+)
+
+# NEGATIVE indicators: non-class location contexts (REJECT these)
+NON_CLASS_KEYWORDS = (
+    r'office\s+hours?',
+    r'office\s+location',
+    r'instructor\s+office',
+    r'professor\s+office',
+    r'my\s+office',
+    r'office\s+address',
+    r'\boffice:',  # Simple "Office:" label
+    r'instructor\s+location',
+    r'contact\s+information',
+    r'contact\s+info',
+    r'tutoring\s+center',
+    r'writing\s+center',
+    r'help\s+center',
+    r'support\s+center',
+    r'academic\s+support',
+    r'drop[-\s]in\s+hours',
+    r'consultation\s+hours',
+    r'availability',
+    r'\blab:',  # Lab location (different from class)
+    r'lab\s+location',
+    r'lab\s+sessions?',
+    # Support/Admin offices
+    r'tech\s+consultancy',
+    r'tech\s+consultant',
+    r'workroom',
+    r'student\s+tech',
+    r'title\s+ix',
+    r'deputy\s+intake',
+    r'coordinator.*room',
+    r'advisors?\s+office',
+    r'loan.*laptop',
+    r'borrow.*laptop',
+)
+
 
 class ContextType(Enum):
     """Enumeration for context types to avoid magic strings."""
@@ -48,6 +109,10 @@ class ContextType(Enum):
     NEUTRAL = 'neutral'
 
 
+# Ranking of candidate context types (lower is better): CLASS > NEUTRAL > other
+CONTEXT_PRIORITY = {ContextType.CLASS: 0, ContextType.NEUTRAL: 1, ContextType.OFFICE: 2}
+
+
 @dataclass
 class LocationCandidate:
     """Data class for location candidates to improve maintainability."""
@@ -73,224 +138,207 @@ class ClassLocationDetector:
     - Support/admin offices (reject)
     """
 
+    # Compiled patterns are class attributes, built once at import time and
+    # shared by every instance, so constructing a detector per document is cheap.
+
+    # ONLINE/REMOTE/VIRTUAL location patterns (checked FIRST before physical rooms)
+    # These patterns detect online/remote course locations with high confidence
+    # IMPORTANT: Only match when there's an explicit location label to avoid false positives
+    online_location_patterns = [
+        # Pattern 1: Simple "Online" after location label (most common)
+        # Include standalone "Location:" label
+        # Allow periods in text to handle cases like "Tuesday 1:10pm-4pm. Online"
+        (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|class\s+meetings?|^location)[\s:]+[^\n]{0,100}?\b(online)\b',
+                   re.IGNORECASE | re.MULTILINE), 0.98),
+
+        # Pattern 1b: "Course Format: Online" or "Meeting Times/Locations" + "online asynchronous"
+        (re.compile(r'(?:course\s+format|class\s+format|modality)[\s:]+[^\n]{0,50}?\b(online(?:\s+asynchronous)?)',
+                   re.IGNORECASE), 0.98),
+        (re.compile(r'meeting\s+times?/locations?[^\n]{0,200}?\b(online\s+asynchronous)',
+                   re.IGNORECASE), 0.98),
+        # Pattern 1c: Time info followed by pipe/bar and "Online" (e.g., "Wed, 6:10-9:00 PM | Online, Synchronous")
+        (re.compile(r'(?:mon|tue|wed|thu|fri|sat|sun)[^\n]{0,50}?\|\s*(online(?:,?\s+synchronous)?)',
+                   re.IGNORECASE), 0.98),
+        # Pattern 1d: Standalone "Asynchronous online" (handles reversed order)
+        (re.compile(r'\b(asynchronous\s+online)\b', re.IGNORECASE), 0.98),
+        # Pattern 1e: "As an online class/course" format
+        (re.compile(r'(?:as|is)\s+an?\s+(online\s+(?:class|course))', re.IGNORECASE), 0.98),
+
+        # Pattern 2: "Online" with context in parentheses
+        (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|where|^location)[\s:]+[^\n]{0,50}?\b(online\s*\([^)]{0,100}\))',
+                   re.IGNORECASE | re.MULTILINE), 0.98),
+
+        # Pattern 3: Remote with context
+        (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|where|^location)[\s:]+[^\n]{0,50}?\b(remote(?:\s+through\s+zoom)?)',
+                   re.IGNORECASE | re.MULTILINE), 0.98),
+
+        # Pattern 4: Canvas/MyCourses with "online" context
+        (re.compile(r'\b(canvas\s*\([^)]*(?:online|learning\s+management\s+system|my\s+courses)[^)]*\))',
+                   re.IGNORECASE), 0.98),
+        (re.compile(r'\b((?:unh\s+)?mycourses\s*\([^)]*online[^)]*\))',
+                   re.IGNORECASE), 0.98),
+        # Pattern for "use/will use UNH MyCourses"
+        (re.compile(r'(?:students?\s+)?(?:will\s+)?use\s+((?:unh\s+)?mycourses)',
+                   re.IGNORECASE), 0.98),
+        # CPRM-style: "in Canvas, our learning management system (LMS)"
+        # Special marker pattern - will be handled specially in code
+        (re.compile(r'\basynchronous(?:ly)?\s+online[^\n]{0,100}?\bin\s+(canvas)[,\s]+(?:our\s+)?learning\s+management\s+system',
+                   re.IGNORECASE), 0.98),
+        # Broader Canvas LMS pattern: "Canvas is the learning management system"
+        (re.compile(r'\b(canvas)\s+is\s+(?:the\s+)?learning\s+management\s+system',
+                   re.IGNORECASE), 0.98),
+        # Pattern for "online course" + "course site on Canvas"
+        (re.compile(r'(?:in\s+this|this\s+is\s+an?)\s+online\s+course[^\n]{0,100}?\bcourse\s+site\s+on\s+(canvas)',
+                   re.IGNORECASE), 0.98),
+
+        # Pattern 5: Zoom/Teams in location field
+        (re.compile(r'(?:location|where)[\s:]+[^\n]{0,50}?\b((?:remote\s+)?\(?\s*zoom\s*\))',
+                   re.IGNORECASE), 0.95),
+
+        # Pattern 5b: Zoom/online platform used for class meetings
+        # Capture "online" when Zoom is mentioned for online meetings
+        (re.compile(r'\b(?:zoom|teams)\s+used\s+to\s+hold\s+(?:weekly\s+)?(online)\s+class\s+meetings?',
+                   re.IGNORECASE), 0.98),
+        (re.compile(r'(?:location|where)[\s:]+[^\n]{0,50}?\b(zoom/teams[^\n]{0,60})',
+                   re.IGNORECASE), 0.95),
+
+        # Pattern 6: "By appointment" (for thesis/project courses)
+        (re.compile(r'(?:location|where)[\s:]+[^\n]{0,30}?\b(by\s+appointment(?:\s+\([^)]{0,60}\))?)',
+                   re.IGNORECASE), 0.95),
+
+        # Pattern 7: Hybrid patterns
+        (re.compile(r'(?:location|where|modality)[\s:]+[^\n]{0,50}?\b(hybrid[^\n]{0,100})',
+                   re.IGNORECASE), 0.93),
+
+        # Pattern 8: TBD with remote indicator
+        (re.compile(r'\b(tbd\s*\(\s*remote\s*\))',
+                   re.IGNORECASE), 0.92),
+
+        # Pattern 9: Field sites
+        (re.compile(r'(?:location|where)[\s:]+[^\n]{0,30}?\b(field\s+sites?[^\n]{0,80})',
+                   re.IGNORECASE), 0.90),
+
+        # Pattern 10: Zoom room provided in Canvas
+        (re.compile(r'\b(zoom\s+room\s+provided\s+in\s+canvas)',
+                   re.IGNORECASE), 0.95),
+    ]
+
+    # Each keyword list unioned into one alternation, so a line is checked
+    # with a single search instead of one per keyword (inputs are lowercased).
+    # These stay on stdlib re: the branches are plain keywords without nested
+    # quantifiers, so there is no runaway backtracking for a DFA engine to
+    # remove, and RE2's ASCII-only \b and \s would change matches on
+    # non-ASCII syllabi.
+    class_keyword_pattern = re.compile('|'.join(f'(?:{p})' for p in CLASS_LOCATION_KEYWORDS))
+    non_class_keyword_pattern = re.compile('|'.join(f'(?:{p})' for p in NON_CLASS_KEYWORDS))
+
+    # PRE-COMPILED regex patterns for performance (compiled once at import)
+    # Course codes: COMP 405, BIOL 413A, COMP-405 or COMP405 (only a yes/no
+    # answer is needed, so the three forms share one pattern)
+    course_code_pattern = re.compile(r'\b[A-Z]{2,4}(?:\s+|-)?\d{3,4}[A-Z]?\b')
+
+    # PRE-COMPILED room extraction patterns (performance optimization)
+    # Format: (compiled_pattern, confidence_level)
+    room_patterns = [
+        # Pattern 0: Explicit class meeting formats "in ROOM" or "Section X: ... Room Y"
+        (re.compile(r'\b(?:class\s+meetings?|section\s+\w+).*?\b((?:in|room|rm\.?)\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE | re.DOTALL),
+         HIGH_CONFIDENCE + 0.01),  # Slightly higher than other high confidence
+
+        # Pattern 0b: "Course Room Number: X" format
+        (re.compile(r'\bcourse\s+room\s+(?:number)?[\s:]+([A-Za-z]?\d{2,4})\b', re.IGNORECASE),
+         HIGH_CONFIDENCE + 0.01),
+
+        # Pattern 1: "Room/Rm [Number]" possibly followed by building
+        (re.compile(r'\b((?:room|rm\.?)\s+[A-Za-z]?\d{2,4}(?:\s*[,\-]?\s*[\w\s]+?(?:hall|building|bldg|mill|lab))?)\b', re.IGNORECASE),
+         HIGH_CONFIDENCE),
+
+        # Pattern 2: Known building name followed by room number
+        # Allow parenthetical content like "(UNHM)" between building and room
+        (re.compile(r'\b((?:pandora|pandra|hamilton\s+smith|dimond|parsons|kingsbury|morse|rudman|murkland)'
+                   r'(?:\s+mill|\s+hall|\s+building|\s+lab)?(?:\s*\([^)]{1,20}\))?\s*[,\-]?\s*(?:room|rm\.?)?\s*[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
+         HIGH_CONFIDENCE),
+
+        # Pattern 3: Just "Room [Number]" or "Rm [Number]"
+        (re.compile(r'\b((?:room|rm\.?)\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
+         LOW_CONFIDENCE),
+
+        # Pattern 4: "Classroom: [Number]" or "Classroom [Number]"
+        (re.compile(r'\b(classroom:?\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
+         MEDIUM_CONFIDENCE),
+
+        # Pattern 5: "Rm" or "Room" directly attached to number (no space)
+        (re.compile(r'\b((?:room|rm)\.?[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
+         MEDIUM_CONFIDENCE),
+
+        # Pattern 6: Single letter + 3-4 digits (like P380, R540)
+        # Must NOT be preceded by alphanumeric (avoids "MegaFix P1135")
+        (re.compile(r'(?<![A-Za-z0-9])([A-Z]\d{3,4})\b'),
+         MEDIUM_CONFIDENCE),
+
+        # Pattern 6b: Single letter + space + 3-4 digits (like "P 146")
+        (re.compile(r'(?<![A-Za-z0-9])([A-Z]\s+\d{3,4})\b'),
+         MEDIUM_CONFIDENCE),
+
+        # Pattern 7: Bare 3-digit number followed by "(Lecture" context
+        # e.g., "380 (Lecture; MW 2:10-3:30 pm)"
+        (re.compile(r'\b(\d{3})\s*\(\s*lecture[;,]', re.IGNORECASE),
+         HIGH_CONFIDENCE),
+
+        # Pattern 8: Room number in "Room P380" format (P prefix with Room)
+        (re.compile(r'\b(room\s+p\s*\d{3,4})\b', re.IGNORECASE),
+         HIGH_CONFIDENCE),
+
+        # Pattern 9: "Pandora Building (UNHM) P 146" - building + optional parens + P-room
+        (re.compile(r'\b((?:pandora|pandra)\s+(?:building|mill|hall)?\s*(?:\([^)]+\))?\s*p\s*\d{3,4})\b', re.IGNORECASE),
+         HIGH_CONFIDENCE),
+
+        # Pattern 10: Lab room format "Lab (Rm 560)"
+        (re.compile(r'\blab\s*\(\s*(rm\.?\s*\d{3,4})\s*\)', re.IGNORECASE),
+         MEDIUM_CONFIDENCE),
+    ]
+
+    # Cheap gate for room extraction: every room pattern above needs two
+    # digits in a row, plus one of these words (at a word boundary) or a
+    # capital letter followed by a 3-digit number
+    room_digits_pattern = re.compile(r'\d\d')
+    room_signal_pattern = re.compile(
+        r'(?i:\b(?:room|rm|class|section|lecture|pandora|pandra|hamilton|dimond|parsons'
+        r'|kingsbury|morse|rudman|murkland))|[A-Z]\s*\d{3}'
+    )
+
+    # PRE-COMPILED patterns for context checking
+    explicit_location_pattern = re.compile(r'\b(?:class\s+)?location\s*:', re.IGNORECASE)
+    year_pattern = re.compile(r'\b20\d{2}\b')
+    course_code_context_pattern = re.compile(r'[A-Z]{2,4}\s*$')
+    room_normalize_pattern = re.compile(r'((?:room|rm)\.?)([A-Za-z]?\d)', re.IGNORECASE)
+
+    # PRE-COMPILED explicit class meeting patterns (PRIORITY 0 header check)
+    explicit_class_patterns = [
+        # "Class Time & Location: ... P146" or "Class Time & Location: ... Pandora Building (UNHM) P146"
+        re.compile(r'class\s+time\s*[&]\s*location\s*:[^\n]*\b((?:pandora|pandra)?\s*(?:building)?\s*(?:\([^)]+\))?\s*P\s*\d{3,4})\b', re.IGNORECASE),
+        re.compile(r'class\s+time\s*[&]\s*location\s*:[^\n]*\b(room\s*\d{2,4})\b', re.IGNORECASE),
+        # "Class meetings: Tuesday, 9:00 - 11:50 AM. P149" or "Class meetings: ... Room 105"
+        re.compile(r'class\s+meetings?\s*[:\s][^P\n]*\b(P\d{3,4})\b', re.IGNORECASE),
+        re.compile(r'class\s+meetings?\s*[:\s][^\n]*\b(room\s*\d{2,4})\b', re.IGNORECASE),
+        # "Class Meeting Room 341"
+        re.compile(r'class\s+meeting\s+room\s*[:\s]*([A-Za-z]?\d{2,4})', re.IGNORECASE),
+        # "Class meets in Room 105" or "Class meets in P149"
+        re.compile(r'class\s+meets?\s+(?:in\s+)?((?:room\s+)?[A-Za-z]?\d{2,4})', re.IGNORECASE),
+        # "Lecture: P502" or "Lecture – P502"
+        re.compile(r'lecture\s*[:\-–]\s*(P\d{3,4})', re.IGNORECASE),
+        # "Location and Times: Lecture – P502"
+        re.compile(r'location[^:]*:\s*lecture\s*[:\-–]\s*(P\d{3,4})', re.IGNORECASE),
+    ]
+
+    # Every explicit class pattern needs one of these words, so a header
+    # without them skips the pattern loop
+    explicit_class_gate = re.compile(r'class|lecture', re.IGNORECASE)
+
     def __init__(self):
         """Initialize the class location detector with disambiguation rules."""
         self.field_name = 'class_location'
         self.logger = logging.getLogger('detector.class_location')
 
-        # ONLINE/REMOTE/VIRTUAL location patterns (checked FIRST before physical rooms)
-        # These patterns detect online/remote course locations with high confidence
-        # IMPORTANT: Only match when there's an explicit location label to avoid false positives
-        self.online_location_patterns = [
-            # Pattern 1: Simple "Online" after location label (most common)
-            # Include standalone "Location:" label
-            # Allow periods in text to handle cases like "Tuesday 1:10pm-4pm. Online"
-            (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|class\s+meetings?|^location)[\s:]+[^\n]{0,100}?\b(online)\b',
-                       re.IGNORECASE | re.MULTILINE), 0.98),
-
-            # Pattern 1b: "Course Format: Online" or "Meeting Times/Locations" + "online asynchronous"
-            (re.compile(r'(?:course\s+format|class\s+format|modality)[\s:]+[^\n]{0,50}?\b(online(?:\s+asynchronous)?)',
-                       re.IGNORECASE), 0.98),
-            (re.compile(r'meeting\s+times?/locations?[^\n]{0,200}?\b(online\s+asynchronous)',
-                       re.IGNORECASE), 0.98),
-            # Pattern 1c: Time info followed by pipe/bar and "Online" (e.g., "Wed, 6:10-9:00 PM | Online, Synchronous")
-            (re.compile(r'(?:mon|tue|wed|thu|fri|sat|sun)[^\n]{0,50}?\|\s*(online(?:,?\s+synchronous)?)',
-                       re.IGNORECASE), 0.98),
-            # Pattern 1d: Standalone "Asynchronous online" (handles reversed order)
-            (re.compile(r'\b(asynchronous\s+online)\b', re.IGNORECASE), 0.98),
-            # Pattern 1e: "As an online class/course" format
-            (re.compile(r'(?:as|is)\s+an?\s+(online\s+(?:class|course))', re.IGNORECASE), 0.98),
-
-            # Pattern 2: "Online" with context in parentheses
-            (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|where|^location)[\s:]+[^\n]{0,50}?\b(online\s*\([^)]{0,100}\))',
-                       re.IGNORECASE | re.MULTILINE), 0.98),
-
-            # Pattern 3: Remote with context
-            (re.compile(r'(?:time\s+and\s+location|location\s+and\s+time|class\s+location|meeting\s+location|where|^location)[\s:]+[^\n]{0,50}?\b(remote(?:\s+through\s+zoom)?)',
-                       re.IGNORECASE | re.MULTILINE), 0.98),
-
-            # Pattern 4: Canvas/MyCourses with "online" context
-            (re.compile(r'\b(canvas\s*\([^)]*(?:online|learning\s+management\s+system|my\s+courses)[^)]*\))',
-                       re.IGNORECASE), 0.98),
-            (re.compile(r'\b((?:unh\s+)?mycourses\s*\([^)]*online[^)]*\))',
-                       re.IGNORECASE), 0.98),
-            # Pattern for "use/will use UNH MyCourses"
-            (re.compile(r'(?:students?\s+)?(?:will\s+)?use\s+((?:unh\s+)?mycourses)',
-                       re.IGNORECASE), 0.98),
-            # CPRM-style: "in Canvas, our learning management system (LMS)"
-            # Special marker pattern - will be handled specially in code
-            (re.compile(r'\basynchronous(?:ly)?\s+online[^\n]{0,100}?\bin\s+(canvas)[,\s]+(?:our\s+)?learning\s+management\s+system',
-                       re.IGNORECASE), 0.98),
-            # Broader Canvas LMS pattern: "Canvas is the learning management system"
-            (re.compile(r'\b(canvas)\s+is\s+(?:the\s+)?learning\s+management\s+system',
-                       re.IGNORECASE), 0.98),
-            # Pattern for "online course" + "course site on Canvas"
-            (re.compile(r'(?:in\s+this|this\s+is\s+an?)\s+online\s+course[^\n]{0,100}?\bcourse\s+site\s+on\s+(canvas)',
-                       re.IGNORECASE), 0.98),
-
-            # Pattern 5: Zoom/Teams in location field
-            (re.compile(r'(?:location|where)[\s:]+[^\n]{0,50}?\b((?:remote\s+)?\(?\s*zoom\s*\))',
-                       re.IGNORECASE), 0.95),
-
-            # Pattern 5b: Zoom/online platform used for class meetings
-            # Capture "online" when Zoom is mentioned for online meetings
-            (re.compile(r'\b(?:zoom|teams)\s+used\s+to\s+hold\s+(?:weekly\s+)?(online)\s+class\s+meetings?',
-                       re.IGNORECASE), 0.98),
-            (re.compile(r'(?:location|where)[\s:]+[^\n]{0,50}?\b(zoom/teams[^\n]{0,60})',
-                       re.IGNORECASE), 0.95),
-
-            # Pattern 6: "By appointment" (for thesis/project courses)
-            (re.compile(r'(?:location|where)[\s:]+[^\n]{0,30}?\b(by\s+appointment(?:\s+\([^)]{0,60}\))?)',
-                       re.IGNORECASE), 0.95),
-
-            # Pattern 7: Hybrid patterns
-            (re.compile(r'(?:location|where|modality)[\s:]+[^\n]{0,50}?\b(hybrid[^\n]{0,100})',
-                       re.IGNORECASE), 0.93),
-
-            # Pattern 8: TBD with remote indicator
-            (re.compile(r'\b(tbd\s*\(\s*remote\s*\))',
-                       re.IGNORECASE), 0.92),
-
-            # Pattern 9: Field sites
-            (re.compile(r'(?:location|where)[\s:]+[^\n]{0,30}?\b(field\s+sites?[^\n]{0,80})',
-                       re.IGNORECASE), 0.90),
-
-            # Pattern 10: Zoom room provided in Canvas
-            (re.compile(r'\b(zoom\s+room\s+provided\s+in\s+canvas)',
-                       re.IGNORECASE), 0.95),
-        ]
-
-        # POSITIVE indicators: class location section keywords
-        self.class_location_keywords = [
-            r'class\s+location',
-            r'class\s+meets?',
-            r'class\s+meeting',
-            r'meeting\s+location',
-            r'meeting\s+place',
-            r'meeting\s+time\s+and\s+place',
-            r'location\s+and\s+time',
-            r'time\s+and\s+location',
-            r'where\s+we\s+meet',
-            r'where\s+the\s+class\s+meets',
-            r'course\s+location',
-            r'course\s+room',
-            r'lecture\s+location',
-            r'when\s+and\s+where',
-            r'schedule\s+and\s+location',
-            r'classroom',
-            r'lecture\s+room',
-            r'\(lecture[;,]',  # "(Lecture;" or "(Lecture," indicates class context
-        ]
-
-        # NEGATIVE indicators: non-class location contexts (REJECT these)
-        self.non_class_keywords = [
-            r'office\s+hours?',
-            r'office\s+location',
-            r'instructor\s+office',
-            r'professor\s+office',
-            r'my\s+office',
-            r'office\s+address',
-            r'\boffice:',  # Simple "Office:" label
-            r'instructor\s+location',
-            r'contact\s+information',
-            r'contact\s+info',
-            r'tutoring\s+center',
-            r'writing\s+center',
-            r'help\s+center',
-            r'support\s+center',
-            r'academic\s+support',
-            r'drop[-\s]in\s+hours',
-            r'consultation\s+hours',
-            r'availability',
-            r'\blab:',  # Lab location (different from class)
-            r'lab\s+location',
-            r'lab\s+sessions?',
-            # Support/Admin offices
-            r'tech\s+consultancy',
-            r'tech\s+consultant',
-            r'workroom',
-            r'student\s+tech',
-            r'title\s+ix',
-            r'deputy\s+intake',
-            r'coordinator.*room',
-            r'advisors?\s+office',
-            r'loan.*laptop',
-            r'borrow.*laptop',
-        ]
-
-        # PRE-COMPILED regex patterns for performance (compiled once at init)
-        self.course_code_patterns = [
-            re.compile(r'\b[A-Z]{2,4}\s+\d{3,4}[A-Z]?\b'),  # COMP 405, BIOL 413A
-            re.compile(r'\b[A-Z]{2,4}-\d{3,4}[A-Z]?\b'),    # COMP-405
-            re.compile(r'\b[A-Z]{2,4}\d{3,4}[A-Z]?\b'),     # COMP405
-        ]
-
-        # PRE-COMPILED room extraction patterns (performance optimization)
-        # Format: (compiled_pattern, confidence_level)
-        self.room_patterns = [
-            # Pattern 0: Explicit class meeting formats "in ROOM" or "Section X: ... Room Y"
-            (re.compile(r'\b(?:class\s+meetings?|section\s+\w+).*?\b((?:in|room|rm\.?)\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE | re.DOTALL),
-             HIGH_CONFIDENCE + 0.01),  # Slightly higher than other high confidence
-
-            # Pattern 0b: "Course Room Number: X" format
-            (re.compile(r'\bcourse\s+room\s+(?:number)?[\s:]+([A-Za-z]?\d{2,4})\b', re.IGNORECASE),
-             HIGH_CONFIDENCE + 0.01),
-
-            # Pattern 1: "Room/Rm [Number]" possibly followed by building
-            (re.compile(r'\b((?:room|rm\.?)\s+[A-Za-z]?\d{2,4}(?:\s*[,\-]?\s*[\w\s]+?(?:hall|building|bldg|mill|lab))?)\b', re.IGNORECASE),
-             HIGH_CONFIDENCE),
-
-            # Pattern 2: Known building name followed by room number
-            # Allow parenthetical content like "(UNHM)" between building and room
-            (re.compile(r'\b((?:pandora|pandra|hamilton\s+smith|dimond|parsons|kingsbury|morse|rudman|murkland)'
-                       r'(?:\s+mill|\s+hall|\s+building|\s+lab)?(?:\s*\([^)]{1,20}\))?\s*[,\-]?\s*(?:room|rm\.?)?\s*[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
-             HIGH_CONFIDENCE),
-
-            # Pattern 3: Just "Room [Number]" or "Rm [Number]"
-            (re.compile(r'\b((?:room|rm\.?)\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
-             LOW_CONFIDENCE),
-
-            # Pattern 4: "Classroom: [Number]" or "Classroom [Number]"
-            (re.compile(r'\b(classroom:?\s+[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
-             MEDIUM_CONFIDENCE),
-
-            # Pattern 5: "Rm" or "Room" directly attached to number (no space)
-            (re.compile(r'\b((?:room|rm)\.?[A-Za-z]?\d{2,4})\b', re.IGNORECASE),
-             MEDIUM_CONFIDENCE),
-
-            # Pattern 6: Single letter + 3-4 digits (like P380, R540)
-            # Must NOT be preceded by alphanumeric (avoids "MegaFix P1135")
-            (re.compile(r'(?<![A-Za-z0-9])([A-Z]\d{3,4})\b'),
-             MEDIUM_CONFIDENCE),
-
-            # Pattern 6b: Single letter + space + 3-4 digits (like "P 146")
-            (re.compile(r'(?<![A-Za-z0-9])([A-Z]\s+\d{3,4})\b'),
-             MEDIUM_CONFIDENCE),
-
-            # Pattern 7: Bare 3-digit number followed by "(Lecture" context
-            # e.g., "380 (Lecture; MW 2:10-3:30 pm)"
-            (re.compile(r'\b(\d{3})\s*\(\s*lecture[;,]', re.IGNORECASE),
-             HIGH_CONFIDENCE),
-
-            # Pattern 8: Room number in "Room P380" format (P prefix with Room)
-            (re.compile(r'\b(room\s+p\s*\d{3,4})\b', re.IGNORECASE),
-             HIGH_CONFIDENCE),
-
-            # Pattern 9: "Pandora Building (UNHM) P 146" - building + optional parens + P-room
-            (re.compile(r'\b((?:pandora|pandra)\s+(?:building|mill|hall)?\s*(?:\([^)]+\))?\s*p\s*\d{3,4})\b', re.IGNORECASE),
-             HIGH_CONFIDENCE),
-
-            # Pattern 10: Lab room format "Lab (Rm 560)"
-            (re.compile(r'\blab\s*\(\s*(rm\.?\s*\d{3,4})\s*\)', re.IGNORECASE),
-             MEDIUM_CONFIDENCE),
-        ]
-
-        # PRE-COMPILED patterns for context checking
-        self.explicit_location_pattern = re.compile(r'\b(?:class\s+)?location\s*:', re.IGNORECASE)
-        self.year_pattern = re.compile(r'\b20\d{2}\b')
-        self.course_code_context_pattern = re.compile(r'[A-Z]{2,4}\s*$')
-        self.room_normalize_pattern = re.compile(r'((?:room|rm)\.?)([A-Za-z]?\d)', re.IGNORECASE)
-
     def _normalize_text(self, text: str) -> str:
         """
         Normalize text for consistent matching.
@@ -306,11 +354,14 @@ class ClassLocationDetector:
         """
         if not text:
             return ""
-        t = unicodedata.normalize("NFKC", text)
-        t = re.sub(r'[ \t]+', ' ', t)
+        # Plain ASCII is already NFKC-normal, and without tabs or double spaces
+        # there is nothing to collapse - the common case for extracted syllabi
+        t = text if text.isascii() else unicodedata.normalize("NFKC", text)
+        if '\t' in t or '  ' in t:
+            t = re.sub(r'[ \t]+', ' ', t)
         return t.strip()
 
-    def _check_line_context(self, lines: List[str], line_index: int) -> ContextType:
+    def _check_line_context(self, lines_lower: List[str], line_index: int) -> ContextType:
         """
         Check the context of a specific line by examining surrounding lines.
 
@@ -318,7 +369,7 @@ class ClassLocationDetector:
         context (what we want), office context (reject), or neutral context.
 
         Args:
-            lines (List[str]): All lines from the document.
+            lines_lower (List[str]): All lines from the document, lowercased.
             line_index (int): The index of the line to check context for.
 
         Returns:
@@ -332,40 +383,46 @@ class ClassLocationDetector:
             2. If CURRENT line has office keywords -> 'OFFICE' (reject)
             3. Check surrounding lines for context
         """
-        if line_index >= len(lines):
+        if line_index >= len(lines_lower):
             return ContextType.NEUTRAL
 
-        current_line = lines[line_index].lower()
+        current_line = lines_lower[line_index]
 
         # PRIORITY 1: Current line has explicit class location keywords -> ACCEPT as 'CLASS'
-        for pattern in self.class_location_keywords:
-            if re.search(pattern, current_line):
-                return ContextType.CLASS
+        if self.class_keyword_pattern.search(current_line):
+            return ContextType.CLASS
 
         # PRIORITY 2: Current line has office keywords -> REJECT as 'OFFICE'
-        for pattern in self.non_class_keywords:
-            if re.search(pattern, current_line):
-                return ContextType.OFFICE
+        if self.non_class_keyword_pattern.search(current_line):
+            return ContextType.OFFICE
 
         # PRIORITY 3: Check surrounding lines for additional context
+        # Joined rather than scanned line by line, so keywords broken across
+        # a line ("class" / "location") still match
         start_idx = max(0, line_index - CONTEXT_WINDOW_BEFORE)
-        end_idx = min(len(lines), line_index + CONTEXT_WINDOW_AFTER + 1)
-        context_lines = lines[start_idx:end_idx]
-        context_text = ' '.join(context_lines).lower()
+        end_idx = min(len(lines_lower), line_index + CONTEXT_WINDOW_AFTER + 1)
+        context_text = ' '.join(lines_lower[start_idx:end_idx])
 
         # Check if surrounding context mentions class keywords
-        for pattern in self.class_location_keywords:
-            if re.search(pattern, context_text):
-                return ContextType.CLASS
+        if self.class_keyword_pattern.search(context_text):
+            return ContextType.CLASS
 
         # Check if surrounding context is office-related
-        # (but be less aggressive - only reject if office keywords are close)
-        for pattern in self.non_class_keywords:
-            if re.search(pattern, context_text):
-                # Only reject if office keyword is in immediate context (within 1 line)
-                immediate_context = ' '.join(lines[max(0, line_index-1):min(len(lines), line_index+2)]).lower()
-                if re.search(pattern, immediate_context):
-                    return ContextType.OFFICE
+        # (but be less aggressive - only reject if office keywords are close).
+        # The immediate context is a substring of the wider one, so one search
+        # of each is equivalent to checking every keyword against both.
+        if self.non_class_keyword_pattern.search(context_text):
+            # Only reject if office keyword is in immediate context (within 1 line).
+            # Those lines are a slice of context_text, so search it in place
+            # instead of joining them again (the neighbouring ' ' separators
+            # give the same word boundaries as the slice's own ends).
+            immediate_idx = max(0, line_index - 1)
+            immediate_start = sum(len(line) + 1 for line in lines_lower[start_idx:immediate_idx])
+            immediate_end = immediate_start + len(lines_lower[immediate_idx])
+            for line in lines_lower[immediate_idx + 1:line_index + 2]:
+                immediate_end += len(line) + 1
+            if self.non_class_keyword_pattern.search(context_text, immediate_start, immediate_end):
+                return ContextType.OFFICE
 
         return ContextType.NEUTRAL
 
@@ -387,10 +444,11 @@ class ClassLocationDetector:
             - "BIOL 413A" -> True
             - "Room 405" -> False
         """
-        for pattern in self.course_code_patterns:
-            if pattern.search(text):
-                return True
-        return False
+        # Course codes need capital letters, so strings without any
+        # (e.g., "105", "room 105") are rejected without a regex search
+        if text.lower() == text:
+            return False
+        return bool(self.course_code_pattern.search(text))
 
     def _extract_room_with_building(self, text: str) -> Optional[Tuple[str, float]]:
         """
@@ -402,7 +460,16 @@ class ClassLocationDetector:
         - "Rm 139, Pandora Mill building" -> ("Rm 139, Pandora Mill", 0.95)
         - "Hamilton Smith 129" -> ("Hamilton Smith 129", 0.90)
         - "P380" -> ("P380", 0.70)
+
+        The room patterns are tried one at a time in priority order, and a
+        rejected match falls through to the next pattern. They cannot be fused
+        into one alternation: that would return the leftmost match in the line
+        rather than the highest-priority one.
         """
+        # Most lines mention no room at all; skip the full pattern list for them
+        if not self.room_digits_pattern.search(text) or not self.room_signal_pattern.search(text):
+            return None
+
         for pattern, confidence in self.room_patterns:
             match = pattern.search(text)
             if match:
@@ -413,14 +480,14 @@ class ClassLocationDetector:
                     continue
 
                 # REJECT if it looks like a year (2020-2029, Fall 2025, etc.)
-                if self.year_pattern.search(location):
+                # (a year needs a literal "20", so most rooms skip the regex)
+                if '20' in location and self.year_pattern.search(location):
                     continue
 
                 # REJECT product model numbers (e.g., "MegaFix P1135")
                 # Check if preceded by product/model keywords within 20 chars
                 context_before = text[max(0, match.start()-20):match.start()].lower()
-                product_keywords = ['megafix', 'model', 'product', 'part', 'item', 'catalog', 'screw']
-                if any(keyword in context_before for keyword in product_keywords):
+                if any(keyword in context_before for keyword in PRODUCT_KEYWORDS):
                     continue  # Skip product models
 
                 # For pattern6 (single letter + digits), only accept if NOT a course code context
@@ -431,63 +498,80 @@ class ClassLocationDetector:
                         continue  # Skip if preceded by capital letters (likely course code)
 
                 # Clean up extra spaces and normalize format
-                location = re.sub(r'\s+', ' ', location)
+                location = ' '.join(location.split())
                 # Add space after Rm/Room if missing: "Rm126" → "Rm 126"
                 location = self.room_normalize_pattern.sub(r'\1 \2', location)
                 return (location, confidence)
 
         return None
 
-    def _find_all_location_candidates(self, lines: List[str]) -> List[LocationCandidate]:
+    def _find_all_location_candidates(self, lines: List[str], lines_lower: List[str]) -> List[LocationCandidate]:
         """
         Find all potential location candidates in the document.
+        lines_lower holds the same lines lowercased, computed once by the caller.
         Returns list of LocationCandidate objects.
         """
         candidates = []
+        # Avoid formatting per-line debug messages unless they will be emitted
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        # First half of the room extraction gate, bound locally: four lines in
+        # five have no two-digit run, and skipping them here saves a method call
+        has_room_digits = self.room_digits_pattern.search
 
         for i, line in enumerate(lines):
-            line_lower = line.lower()
+            if not has_room_digits(line):
+                continue
+
+            # Extract room from this line first: most lines have none, and only
+            # lines with a room need the (window-sized) context check below
+            room_result = self._extract_room_with_building(line)
+            if not room_result:
+                continue
+
+            line_lower = lines_lower[i]
 
             # Check context of this line
-            context_type = self._check_line_context(lines, i)
+            context_type = self._check_line_context(lines_lower, i)
 
             # REJECT if in office/non-class context
-            if context_type == ContextType.OFFICE:
-                self.logger.debug(f"Line {i}: Rejected (office context) - {line[:50]}")
+            if context_type is ContextType.OFFICE:
+                if debug:
+                    self.logger.debug(f"Line {i}: Rejected (office context) - {line[:50]}")
                 continue
 
-            # Check if line has a class location header/keyword
-            has_class_header = any(
-                re.search(pattern, line_lower)
-                for pattern in self.class_location_keywords
-            )
-
             # Check for EXPLICIT location labels (strongest signal)
             has_explicit_label = bool(self.explicit_location_pattern.search(line_lower))
 
-            # Extract room from this line
-            room_result = self._extract_room_with_building(line)
-            if room_result:
-                location, base_conf = room_result
-
-                # Boost confidence if we have a positive class header
-                if has_class_header or context_type == ContextType.CLASS:
-                    confidence = HIGH_CONFIDENCE
-                elif context_type == ContextType.NEUTRAL:
-                    confidence = base_conf * 0.7  # Reduce for neutral context
-                else:
-                    confidence = base_conf
-
-                candidate = LocationCandidate(
-                    location=location,
-                    confidence=confidence,
-                    line_idx=i,
-                    context_type=context_type,
-                    has_explicit_label=has_explicit_label
-                )
-                candidates.append(candidate)
+            location, base_conf = room_result
+
+            # Boost confidence if we have a positive class header. A class keyword
+            # on this line already makes _check_line_context return CLASS, so the
+            # context type covers the header check too.
+            is_class = context_type is ContextType.CLASS
+            if is_class:
+                confidence = HIGH_CONFIDENCE
+            elif context_type is ContextType.NEUTRAL:
+                confidence = base_conf * 0.7  # Reduce for neutral context
+            else:
+                confidence = base_conf
+
+            candidate = LocationCandidate(
+                location=location,
+                confidence=confidence,
+                line_idx=i,
+                context_type=context_type,
+                has_explicit_label=has_explicit_label
+            )
+            candidates.append(candidate)
+            if debug:
                 self.logger.debug(f"Line {i}: Candidate '{location}' (conf: {confidence}, ctx: {context_type.value}, explicit: {has_explicit_label})")
 
+            # Stop early: a CLASS candidate always has HIGH_CONFIDENCE, so with both the
+            # explicit-label and header boosts its sort key in _select_best_candidate
+            # is the lowest possible, and later lines can only tie and lose on line index
+            if is_class and has_explicit_label and i < HEADER_LINE_THRESHOLD:
+                break
+
         return candidates
 
     def _select_best_candidate(self, candidates: List[LocationCandidate]) -> Optional[Tuple[str, float]]:
@@ -504,16 +588,12 @@ class ClassLocationDetector:
         if not candidates:
             return None
 
-        # Calculate scores for all candidates
-        scored_candidates = []
+        # Score every candidate, keeping only the best and runner-up
+        # (lowest sort keys) instead of sorting the whole list
+        best = runner_up = None
         for candidate in candidates:
             # Priority 1: Context type (CLASS=0, NEUTRAL=1, other=2)
-            if candidate.context_type == ContextType.CLASS:
-                context_priority = 0
-            elif candidate.context_type == ContextType.NEUTRAL:
-                context_priority = 1
-            else:
-                context_priority = 2
+            context_priority = CONTEXT_PRIORITY[candidate.context_type]
 
             # Priority 2-4: Confidence with boosts
             adjusted_confidence = candidate.confidence
@@ -527,27 +607,29 @@ class ClassLocationDetector:
             if in_header:
                 adjusted_confidence += HEADER_CONFIDENCE_BOOST
 
-            # Create sort key
+            # Create sort key (line index makes keys unique, so ties cannot occur)
             sort_key = (context_priority, -adjusted_confidence, candidate.line_idx)
-            scored_candidates.append((sort_key, candidate, in_header))
-
-        # Sort by the key
-        scored_candidates.sort(key=lambda x: x[0])
+            scored = (sort_key, candidate, in_header)
+            if best is None or sort_key < best[0]:
+                best, runner_up = scored, best
+            elif runner_up is None or sort_key < runner_up[0]:
+                runner_up = scored
 
         # Get the best
-        _, best_candidate, in_header = scored_candidates[0]
+        _, best_candidate, in_header = best
 
         self.logger.info(f"Best candidate: '{best_candidate.location}' at line {best_candidate.line_idx} "
                         f"(conf: {best_candidate.confidence}, ctx: {best_candidate.context_type.value}, "
                         f"explicit: {best_candidate.has_explicit_label}, in_header: {in_header})")
-        self.logger.debug(f"Total candidates considered: {len(candidates)}")
 
-        if len(scored_candidates) > 1:
-            # Log runner-up for debugging
-            _, runner_up, ru_header = scored_candidates[1]
-            self.logger.debug(f"Runner-up: '{runner_up.location}' at line {runner_up.line_idx} "
-                            f"(conf: {runner_up.confidence}, ctx: {runner_up.context_type.value}, "
-                            f"explicit: {runner_up.has_explicit_label}, in_header: {ru_header})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Total candidates considered: {len(candidates)}")
+            if runner_up is not None:
+                # Log runner-up for debugging
+                _, runner_up_candidate, ru_header = runner_up
+                self.logger.debug(f"Runner-up: '{runner_up_candidate.location}' at line {runner_up_candidate.line_idx} "
+                                f"(conf: {runner_up_candidate.confidence}, ctx: {runner_up_candidate.context_type.value}, "
+                                f"explicit: {runner_up_candidate.has_explicit_label}, in_header: {ru_header})")
 
         return (best_candidate.location, best_candidate.confidence)
 
@@ -562,7 +644,8 @@ class ClassLocationDetector:
         - "Canvas (online learning management system)" -> ("Canvas (online learning management system)", 0.98)
         """
         # Check first 50 lines for online/remote indicators
-        lines = text.split('\n')[:50]
+        # (maxsplit stops splitting there; the unsplit remainder is dropped)
+        lines = text.split('\n', 50)[:50]
         text_to_search = '\n'.join(lines)
 
         for pattern, confidence in self.online_location_patterns:
@@ -594,7 +677,7 @@ class ClassLocationDetector:
                         location = "UNH MyCourses (online)"
 
                 # Clean up the location string
-                location = re.sub(r'\s+', ' ', location)
+                location = ' '.join(location.split())
                 location = location.strip(',;:')
                 # Limit length to avoid capturing too much
                 if len(location) > 100:
@@ -623,37 +706,27 @@ class ClassLocationDetector:
         5. Score each candidate
         6. Select best candidate
         """
-        lines = text.split('\n')[:MAX_LINES_TO_SCAN]
+        # Only the first MAX_LINES_TO_SCAN lines are scanned, so stop splitting
+        # there and drop the unsplit remainder of long documents
+        lines = text.split('\n', MAX_LINES_TO_SCAN)[:MAX_LINES_TO_SCAN]
 
         # PRIORITY 0: Check for explicit class meeting patterns with room in header (first 20 lines)
         # This handles hybrid courses where both room and "online" appear later
         # Patterns: "Class meetings: ... P149", "Class Meeting Room 341", "Class meets in Room 105"
-        explicit_class_patterns = [
-            # "Class Time & Location: ... P146" or "Class Time & Location: ... Pandora Building (UNHM) P146"
-            re.compile(r'class\s+time\s*[&]\s*location\s*:[^\n]*\b((?:pandora|pandra)?\s*(?:building)?\s*(?:\([^)]+\))?\s*P\s*\d{3,4})\b', re.IGNORECASE),
-            re.compile(r'class\s+time\s*[&]\s*location\s*:[^\n]*\b(room\s*\d{2,4})\b', re.IGNORECASE),
-            # "Class meetings: Tuesday, 9:00 - 11:50 AM. P149" or "Class meetings: ... Room 105"
-            re.compile(r'class\s+meetings?\s*[:\s][^P\n]*\b(P\d{3,4})\b', re.IGNORECASE),
-            re.compile(r'class\s+meetings?\s*[:\s][^\n]*\b(room\s*\d{2,4})\b', re.IGNORECASE),
-            # "Class Meeting Room 341"
-            re.compile(r'class\s+meeting\s+room\s*[:\s]*([A-Za-z]?\d{2,4})', re.IGNORECASE),
-            # "Class meets in Room 105" or "Class meets in P149"
-            re.compile(r'class\s+meets?\s+(?:in\s+)?((?:room\s+)?[A-Za-z]?\d{2,4})', re.IGNORECASE),
-            # "Lecture: P502" or "Lecture – P502"
-            re.compile(r'lecture\s*[:\-–]\s*(P\d{3,4})', re.IGNORECASE),
-            # "Location and Times: Lecture – P502"
-            re.compile(r'location[^:]*:\s*lecture\s*[:\-–]\s*(P\d{3,4})', re.IGNORECASE),
-        ]
-        for line in lines[:20]:  # Only check first 20 lines (header area)
-            for pattern in explicit_class_patterns:
-                match = pattern.search(line)
-                if match:
-                    room = match.group(1).strip()
-                    # Normalize: add "Room" prefix if just a number
-                    if room.isdigit():
-                        room = f"Room {room}"
-                    self.logger.info(f"Found explicit class location in header: {room}")
-                    return (room, HIGH_CONFIDENCE + 0.02)
+        header_lines = lines[:20]  # Only check first 20 lines (header area)
+        if self.explicit_class_gate.search('\n'.join(header_lines)):
+            for line in header_lines:
+                if not self.explicit_class_gate.search(line):
+                    continue
+                for pattern in self.explicit_class_patterns:
+                    match = pattern.search(line)
+                    if match:
+                        room = match.group(1).strip()
+                        # Normalize: add "Room" prefix if just a number
+                        if room.isdigit():
+                            room = f"Room {room}"
+                        self.logger.info(f"Found explicit class location in header: {room}")
+                        return (room, HIGH_CONFIDENCE + 0.02)
 
         # PRIORITY 1: Check for online/remote/virtual/appointment locations
         online_result = self._find_online_or_remote_location(text)
@@ -662,7 +735,8 @@ class ClassLocationDetector:
 
         # PRIORITY 2: Look for physical room locations
         # Find all physical location candidates with context analysis
-        candidates = self._find_all_location_candidates(lines)
+        lines_lower = [line.lower() for line in lines]
+        candidates = self._find_all_location_candidates(lines, lines_lower)
 
         # Select best candidate (only physical locations)
         if candidates:
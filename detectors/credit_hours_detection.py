@@ -14,6 +14,58 @@ import re
 import logging
 from typing import Dict, Any, Optional
 
+# Simple patterns for credit declarations
+# These patterns capture the number and surrounding credit text
+CREDIT_PATTERNS = [
+    # "4 credits", "3 credit", "4.0 credits"
+    re.compile(r'(\d+(?:\.\d+)?)\s*credits?\b', re.IGNORECASE),
+
+    # "(4 credit hour)", "(3.0 credit hours)"
+    re.compile(r'(\(\d+(?:\.\d+)?)\s*credits?\shour\s\)\b', re.IGNORECASE),
+
+    # "4-credit", "3-credit course"
+    re.compile(r'(\d+(?:\.\d+)?)-credits?\b', re.IGNORECASE),
+
+    # "(4-credits)", "(3-credit)"
+    re.compile(r'\((\d+(?:\.\d+)?)-credits?\)\b', re.IGNORECASE),
+
+    # "Credits: 4", "Credit: 3.0"
+    re.compile(r'\bCredits?:\s*(\d+(?:\.\d+)?)\b', re.IGNORECASE),
+
+    # "Variable credits 3-5", "Variable credits 2–4"
+    re.compile(r'\bVariable credits\s*(\d+\s*[-–]\s*\d+)\b', re.IGNORECASE),
+
+    # "credit hours: 4", "Credit Hours: 3"
+    re.compile(r'\bCredit\s+Hours?:\s*(\d+(?:\.\d+)?)\b', re.IGNORECASE),
+
+    # "4.0 credit course", "3 credit hours"
+    re.compile(r'(\d+(?:\.\d+)?)\s*credit\s+(?:hours?|course)\b', re.IGNORECASE),
+
+    # "This is a 4-credit course"
+    re.compile(r'\ba\s+(\d+(?:\.\d+)?)-credits?\s+course\b', re.IGNORECASE),
+
+    # "A three-credit hour course", "A 4 credit hours"
+    re.compile(r'\b[aA]n?\s+(?:(?:zero|one|two|three|four|five|six)|\d+)[-\s]?credits?\s+hours?\b', re.IGNORECASE),
+
+    # "A 4-credit course"
+    re.compile(r'\ba\s+(\d+(?:\.\d+)?)-credits?\s+course\b', re.IGNORECASE),
+
+    # "4 cr.", "3 cr.", "4.0 cr."
+    re.compile(r'(\d+(?:\.\d+)?)\s*cr\.?\b', re.IGNORECASE),
+
+    # "This is a 4.0 credit course"
+    re.compile(r'\ba\s+(\d+(?:\.\d+)?)\s*credits?\s+course\b', re.IGNORECASE),
+]
+
+# Every pattern that spells out "credit" can only match text containing the
+# word, so one scan for it decides whether those patterns need to run at all
+# (only the "cr." abbreviation pattern is left when it is absent)
+CREDIT_WORD_PATTERN = re.compile(r'credit', re.IGNORECASE)
+CREDIT_WORD_PATTERNS = frozenset(p for p in CREDIT_PATTERNS if 'credit' in p.pattern.lower())
+
+# The numeric part of a credit match ("4" in "4-credit", "3.0" in "Credits: 3.0")
+CREDIT_NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+
 
 class CreditHoursDetector:
     """
@@ -27,48 +79,8 @@ class CreditHoursDetector:
         self.field_name = 'credit_hours'
         self.logger = logging.getLogger('detector.credit_hours')
         
-        # Simple patterns for credit declarations
-        # These patterns capture the number and surrounding credit text
-        self.credit_patterns = [
-            # "4 credits", "3 credit", "4.0 credits"
-            r'(\d+(?:\.\d+)?)\s*credits?\b',
-
-            # "(4 credit hour)", "(3.0 credit hours)"
-            r'(\(\d+(?:\.\d+)?)\s*credits?\shour\s\)\b',
-            
-            # "4-credit", "3-credit course"
-            r'(\d+(?:\.\d+)?)-credits?\b',
-            
-            # "(4-credits)", "(3-credit)"
-            r'\((\d+(?:\.\d+)?)-credits?\)\b',
-
-            # "Credits: 4", "Credit: 3.0"
-            r'\bCredits?:\s*(\d+(?:\.\d+)?)\b',
-            
-            # "Variable credits 3-5", "Variable credits 2–4"
-            r'\bVariable credits\s*(\d+\s*[-–]\s*\d+)\b',
-
-            # "credit hours: 4", "Credit Hours: 3"
-            r'\bCredit\s+Hours?:\s*(\d+(?:\.\d+)?)\b',
-
-            # "4.0 credit course", "3 credit hours"
-            r'(\d+(?:\.\d+)?)\s*credit\s+(?:hours?|course)\b',
-            
-            # "This is a 4-credit course"
-            r'\ba\s+(\d+(?:\.\d+)?)-credits?\s+course\b',
-            
-            # "A three-credit hour course", "A 4 credit hours"
-            r'\b[aA]n?\s+(?:(?:zero|one|two|three|four|five|six)|\d+)[-\s]?credits?\s+hours?\b',
-
-            # "A 4-credit course"
-            r'\ba\s+(\d+(?:\.\d+)?)-credits?\s+course\b',
-                        
-            # "4 cr.", "3 cr.", "4.0 cr."
-            r'(\d+(?:\.\d+)?)\s*cr\.?\b',
-            
-            # "This is a 4.0 credit course"
-            r'\ba\s+(\d+(?:\.\d+)?)\s*credits?\s+course\b',
-        ]
+        # Credit patterns are compiled once at import (see CREDIT_PATTERNS)
+        self.credit_patterns = CREDIT_PATTERNS
         
     def detect(self, text: str) -> Dict[str, Any]:
         """
@@ -131,9 +143,12 @@ class CreditHoursDetector:
 
         # Collect all potential matches with their positions
         candidates = []
+        has_credit_word = bool(CREDIT_WORD_PATTERN.search(search_text))
 
         for pattern in self.credit_patterns:
-            for match in re.finditer(pattern, search_text, re.IGNORECASE):
+            if not has_credit_word and pattern in CREDIT_WORD_PATTERNS:
+                continue
+            for match in pattern.finditer(search_text):
                 full_match = match.group(0)
                 position = match.start()
 
@@ -162,7 +177,7 @@ class CreditHoursDetector:
                     continue
 
                 # Extract just the number from the match
-                number_match = re.search(r'(\d+(?:\.\d+)?)', full_match)
+                number_match = CREDIT_NUMBER_PATTERN.search(full_match)
                 if number_match:
                     credit_number = float(number_match.group(1))
 
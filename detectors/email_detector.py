@@ -24,12 +24,114 @@ EMAIL_CONFIDENCE_SCORE = 0.95
 EMAIL_RX = re.compile(
     r"[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)*@(?:unh|usnh)\.edu"
 )
+# The domain half of EMAIL_RX. It starts with a literal "@", which the regex
+# engine can skip to directly, unlike EMAIL_RX's leading character class
+EMAIL_DOMAIN_RX = re.compile(r"@(?:unh|usnh)\.edu")
+# Characters an address's local part can be made of
+EMAIL_LOCAL_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789."
+
+# Unicode punctuation and the ASCII that _normalize_text puts in its place
+UNICODE_PUNCTUATION = (
+    ('\uff1a', ':'),  # Full-width colon
+    ('\u2014', '-'),  # Em-dash
+    ('\u2013', '-'),  # En-dash
+)
 
-# Heading keywords to look for (will be normalized during search)
+# Heading keywords to look for, written the way _normalize_text leaves text
+# (lowercase, ASCII punctuation, single spaces)
 HEADING_CLUES = [
     "email", "e-mail", "contact", "contact information",
     "preferred contact method", "instructor", "professor"
 ]
+# The clues as one alternation, so each normalized line is scanned once
+HEADING_CLUE_PATTERN = re.compile('|'.join(re.escape(clue) for clue in HEADING_CLUES))
+
+
+# ---------------- helpers (shared with PreferredDetector) ----------------
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for consistent matching.
+    Handles:
+    - Lowercasing
+    - Unicode punctuation (full-width colon, em-dash, etc.)
+    - Extra whitespace
+    """
+    if not text:
+        return ""
+
+    # Lowercase first
+    normalized = text.lower()
+
+    # Replace Unicode punctuation with ASCII equivalents; plain ASCII
+    # lines (nearly all of them) have none, so they skip the pass
+    if not normalized.isascii():
+        for unicode_char, ascii_char in UNICODE_PUNCTUATION:
+            normalized = normalized.replace(unicode_char, ascii_char)
+
+    # Normalize whitespace (multiple spaces -> single space)
+    normalized = ' '.join(normalized.split())
+
+    return normalized
+
+
+def leading_lines(text: str, count: int) -> List[str]:
+    """
+    First count lines of text, as text.splitlines()[:count] would give.
+
+    Splits a growing prefix instead of the whole document, since only the
+    top of it is scanned for headings. A prefix that splits into more
+    than count lines has its first count lines complete.
+    """
+    limit = 8192
+    while limit < len(text):
+        lines = text[:limit].splitlines()
+        if len(lines) > count:
+            return lines[:count]
+        limit *= 4
+    return text.splitlines()[:count]
+
+
+def email_scan_start(text: str) -> int:
+    """
+    Offset where EMAIL_RX can first match in text, or -1 if it can't.
+
+    Every address ends in "@unh.edu" or "@usnh.edu", so the first one can
+    start no earlier than the run of local-part characters in front of
+    the first such domain. Scanning from there gives the same matches.
+    The run is walked back in place rather than rstripping a copy of
+    everything before the domain.
+    """
+    m = EMAIL_DOMAIN_RX.search(text)
+    if not m:
+        return -1
+    start = m.start()
+    while start and text[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+    return start
+
+
+def find_email_near_heading(lines: List[str]) -> Optional[str]:
+    """Find an email on a line that contains a clue word, or the next line."""
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+        # Normalize the line for comparison
+        normalized_line = normalize_text(line)
+
+        # Check if any heading clue appears in the normalized line
+        if HEADING_CLUE_PATTERN.search(normalized_line):
+            # same line (search in original, not normalized); an address
+            # needs an "@", so lines without one skip the regex
+            if '@' in line:
+                m = EMAIL_RX.search(line)
+                if m:
+                    return m.group(0)
+            # next line
+            if i + 1 < len(lines) and '@' in lines[i+1]:
+                m2 = EMAIL_RX.search(lines[i+1])
+                if m2:
+                    return m2.group(0)
+    return None
 
 
 class EmailDetector:
@@ -37,34 +139,6 @@ class EmailDetector:
         self.field_name = 'email'
         self.logger = logging.getLogger('detector.email')
 
-    @staticmethod
-    def _normalize_text(text: str) -> str:
-        """
-        Normalize text for consistent matching.
-        Handles:
-        - Lowercasing
-        - Unicode punctuation (full-width colon, em-dash, etc.)
-        - Extra whitespace
-        """
-        if not text:
-            return ""
-
-        # Lowercase first
-        normalized = text.lower()
-
-        # Replace Unicode punctuation with ASCII equivalents
-        # Full-width colon, em-dash, en-dash, etc.
-        normalized = normalized.replace('：', ':')  # Full-width colon
-        normalized = normalized.replace('—', '-')  # Em-dash
-        normalized = normalized.replace('–', '-')  # En-dash
-        normalized = normalized.replace('\u2014', '-')  # Em-dash (unicode)
-        normalized = normalized.replace('\u2013', '-')  # En-dash (unicode)
-
-        # Normalize whitespace (multiple spaces -> single space)
-        normalized = ' '.join(normalized.split())
-
-        return normalized
-
     def detect(self, text: str) -> Dict[str, Any]:
         self.logger.info("Starting detection for field: email")
 
@@ -72,24 +146,25 @@ class EmailDetector:
             return self._not_found()
 
         # 1) Try: scan first N lines for heading + email on the same/next line
-        lines = text.splitlines()
-        window_lines = lines[:MAX_HEADING_SCAN_LINES] if len(lines) > MAX_HEADING_SCAN_LINES else lines
-        candidate = self._find_near_heading(window_lines)
+        window_lines = leading_lines(text, MAX_HEADING_SCAN_LINES)
+        candidate = find_email_near_heading(window_lines)
         if candidate:
             email = candidate
             method = "heading_window"
         else:
             # 2) Try: any valid email in the first N chars (header area)
             header = text[:MAX_HEADER_CHARS]
-            header_emails = EMAIL_RX.findall(header)
-            if header_emails:
-                email = header_emails[0]
+            start = email_scan_start(header)
+            m = EMAIL_RX.search(header, start) if start >= 0 else None
+            if m:
+                email = m.group(0)
                 method = "header_any"
             else:
                 # 3) Fallback: first valid email anywhere in the doc
-                all_emails = EMAIL_RX.findall(text)
-                if all_emails:
-                    email = all_emails[0]
+                start = email_scan_start(text)
+                m = EMAIL_RX.search(text, start) if start >= 0 else None
+                if m:
+                    email = m.group(0)
                     method = "fallback_any"
                 else:
                     return self._not_found()
@@ -101,26 +176,6 @@ class EmailDetector:
 
     # ---------------- helpers ----------------
 
-    def _find_near_heading(self, lines: List[str]) -> Optional[str]:
-        """Find an email on a line that contains a clue word, or the next line."""
-        for i, raw in enumerate(lines):
-            line = raw.strip()
-            # Normalize the line for comparison
-            normalized_line = self._normalize_text(line)
-
-            # Check if any heading clue appears in the normalized line
-            if any(self._normalize_text(clue) in normalized_line for clue in HEADING_CLUES):
-                # same line (search in original, not normalized)
-                m = EMAIL_RX.search(line)
-                if m:
-                    return m.group(0)
-                # next line
-                if i + 1 < len(lines):
-                    m2 = EMAIL_RX.search(lines[i+1])
-                    if m2:
-                        return m2.group(0)
-        return None
-
     def _found(self, content: str, method: str) -> Dict[str, Any]:
         """Return found result with email as string (consistent with other detectors)."""
         self.logger.info(f"FOUND: email via {method}")
@@ -10,13 +10,17 @@ This detector handles everything that is NOT canonical A..F letter-range mapping
 
 import re
 import logging
-from typing import Dict, Any
+from itertools import accumulate
+from typing import Dict, Any, List
+
+from detectors import get_detector
 
 # Detection Configuration Constants
 MAX_HEADING_SCAN_LINES = 8
 MAX_HEADING_WORDS_CAPS = 12
 MAX_HEADING_WORDS_ANCHOR = 15
 MAX_HEADING_WORDS_TITLE = 10
+MAX_HEADING_WORDS = max(MAX_HEADING_WORDS_CAPS, MAX_HEADING_WORDS_ANCHOR, MAX_HEADING_WORDS_TITLE)
 MIN_TITLE_CASE_CAPS = 2
 MIN_WINDOW_SCORE = 2
 MAX_SHORT_LINE_WORDS = 15
@@ -27,45 +31,83 @@ MAX_DOWNWARD_SCAN = 9
 MAX_FORWARD_SCAN = 7
 PERCENT_CLUSTER_WINDOW = 3
 
+# A run of flagged lines in a per-line bytearray mask
+WINDOW_RUN_PATTERN = re.compile(rb'\x01+')
+
+
+def _keyword_pattern(keywords):
+    """Compile a case-sensitive alternation that finds any of ``keywords``.
+
+    Keywords containing another keyword (e.g. 'grade scale' and 'grade')
+    are left out: wherever they occur the shorter one does too, so the
+    search result is the same with fewer branches to try.
+    """
+    needed = [k for k in keywords if not any(o != k and o in k for o in keywords)]
+    return re.compile('|'.join(re.escape(k) for k in needed))
+
 
 class GradingProcessDetector:
     """Detector for grading processes in syllabi (not canonical A..F letter-range mappings)."""
 
+    # Patterns are compiled once with the class and shared by every instance
+    # Keywords that suggest a grading scale block
+    percent_pattern = re.compile(r"\d+\s*%")
+    points_pattern = re.compile(r"\b\d+\s*(points|pts)\b", re.I)
+
+    # small list of common labels to help anchor sections
+    anchor_keywords = [
+        'grade', 'grading', 'grades', 'grade breakdown', 'grade scale', 'grading scale', 'course grades',
+        'how grades are determined', 'final grade', 'grade distribution', 'assignment', 'exam', 'quiz', 'project',
+        'total = 100', 'total=100', 'total 100', 'total: 100', 'total - 100'
+    ]
+    # The same keywords as one alternation, so a lowered line is scanned once.
+    # It is searched in lowered text rather than compiled with re.I, which
+    # measured several times slower on syllabus lines, even counting the lower()
+    anchor_pattern = _keyword_pattern(anchor_keywords)
+
+    # Pattern to detect grading scale lines (letter grades with ranges)
+    # Examples: "A 100 % to 94 %", "A- < 94 % to 90 %", "A: 93 - 100"
+    grading_scale_pattern = re.compile(
+        r'\b[A-F][+-]?\s*[:<\|]?\s*(<\s*)?\d+\s*%?\s*(to|[-–—])\s*\d+\s*%?',
+        re.I
+    )
+    # The numeric range every grading scale line match contains ("94 % to 90",
+    # "93 - 100"); it begins with a digit, which the regex engine can find
+    # quickly, so it screens lines before the full pattern runs
+    grading_scale_range_pattern = re.compile(r'\d\s*%?\s*(?:to|[-–—])\s*\d', re.I)
+    # Letter grades on their own, and a letter grade followed by a table pipe
+    letter_grade_pattern = re.compile(r'\b[A-F][+-]?\b')
+    letter_grade_pipe_pattern = re.compile(r'\b[A-F][+-]?\s*\|')
+    # A labelled grading item such as "Project ... 100 points". Items ending in
+    # a percentage ("Homework ... 20%") also count, but any line holding one
+    # already matches percent_pattern, and this is only tried on lines that
+    # match neither percent_pattern nor points_pattern, so the percentage
+    # branches are left out
+    item_pattern = re.compile(r"^[A-Za-z].{0,60}\d+\s*(?:points|pts)", re.I)
+
+    # Late submission indicators, and the words that mark a late policy table
+    # row, each as one alternation searched in the lowered line
+    late_indicators = ['days late', 'late submission', 'points subtracted', 'late penalty',
+                       'will not be graded', 'late work', 'late assignment', 'late deduction']
+    late_indicator_pattern = _keyword_pattern(late_indicators)
+    late_table_word_pattern = _keyword_pattern(['late', 'day', 'penalty', 'deduction'])
+
     def __init__(self):
         self.field_name = 'grading_process'
         self.logger = logging.getLogger('detector.grading_process')
 
-        # Keywords that suggest a grading scale block
-        self.percent_pattern = re.compile(r"\d+\s*%")
-        self.points_pattern = re.compile(r"\b\d+\s*(points|pts)\b", re.I)
-        # Letter-grade block pattern (A:, B:, C:, D:, F: in same area)
-        self.letter_block_pattern = re.compile(
-            r"A\s*[:\-].{0,80}B\s*[:\-].{0,80}C\s*[:\-].{0,80}D\s*[:\-].{0,80}F\s*[:\-]",
-            re.I | re.S,
-        )
-
-        # small list of common labels to help anchor sections
-        self.anchor_keywords = [
-            'grade', 'grading', 'grades', 'grade breakdown', 'grade scale', 'grading scale', 'course grades',
-            'how grades are determined', 'final grade', 'grade distribution', 'assignment', 'exam', 'quiz', 'project',
-            'total = 100', 'total=100', 'total 100', 'total: 100', 'total - 100'
-        ]
-
-        # Pattern to detect grading scale lines (letter grades with ranges)
-        # Examples: "A 100 % to 94 %", "A- < 94 % to 90 %", "A: 93 - 100"
-        self.grading_scale_pattern = re.compile(
-            r'\b[A-F][+-]?\s*[:<\|]?\s*(<\s*)?\d+\s*%?\s*(to|[-–—])\s*\d+\s*%?',
-            re.I
-        )
-
-    def _is_grading_scale_line(self, line: str) -> bool:
-        """Return True if line appears to be a grading scale (letter grades with ranges)."""
+    def _is_grading_scale_line(self, line: str, line_lower: str = None) -> bool:
+        """Return True if line appears to be a grading scale (letter grades with ranges).
+
+        ``line_lower`` may be passed when the caller already has the lowered line.
+        """
         if not line:
             return False
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
 
         # Check for grading scale patterns like "A 100% to 94%", "A: 93-100"
-        if self.grading_scale_pattern.search(line):
+        if self.grading_scale_range_pattern.search(line) and self.grading_scale_pattern.search(line):
             return True
 
         # Check for table headers typical of grading scales
@@ -73,13 +115,12 @@ class GradingProcessDetector:
             return True
 
         # Check for multiple letter grades in one line (e.g., "A | 100%to94% |")
-        letter_grades = re.findall(r'\b[A-F][+-]?\b', line)
-        if len(letter_grades) >= 2 and '%' in line:
+        if '%' in line and len(self.letter_grade_pattern.findall(line)) >= 2:
             return True
 
         # Check for table-formatted grading scales with pipes
         # Example: "A | 100 % to 94 % |" or "A- | < 94 % to 90 % |"
-        if '|' in line and re.search(r'\b[A-F][+-]?\s*\|', line):
+        if '|' in line and self.letter_grade_pipe_pattern.search(line):
             # Has letter grade followed by pipe - likely a grading scale table
             if '%' in line or 'to' in line_lower:
                 return True
@@ -92,30 +133,33 @@ class GradingProcessDetector:
 
         return False
 
-    def _is_late_policy_line(self, line: str) -> bool:
-        """Return True if line appears to be a late submission policy."""
+    def _is_late_policy_line(self, line: str, line_lower: str = None) -> bool:
+        """Return True if line appears to be a late submission policy.
+
+        ``line_lower`` may be passed when the caller already has the lowered line.
+        """
         if not line:
             return False
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
 
         # Check for late submission indicators
-        late_indicators = ['days late', 'late submission', 'points subtracted', 'late penalty',
-                          'will not be graded', 'late work', 'late assignment', 'late deduction']
-        if any(indicator in line_lower for indicator in late_indicators):
+        if self.late_indicator_pattern.search(line_lower):
             return True
 
         # Check for late policy table patterns
         # Example: "1 | 15%" or "7 or more | Will not be graded"
-        if '|' in line and any(word in line_lower for word in ['late', 'day', 'penalty', 'deduction']):
+        if '|' in line and self.late_table_word_pattern.search(line_lower):
             return True
 
         return False
 
-    def _get_heading_before(self, lines, line_index: int, max_scan: int = MAX_HEADING_SCAN_LINES) -> str:
+    def _get_heading_before(self, lines, line_index: int, max_scan: int = MAX_HEADING_SCAN_LINES, lowered=None) -> str:
         """Return a nearby short heading above line_index or empty string.
 
         Scans up to ``max_scan`` non-empty lines looking for short ALL-CAPS
-        headings, anchor keywords, or short Title-Case phrases.
+        headings, anchor keywords, or short Title-Case phrases. ``lowered``
+        optionally holds ``lines`` already lowercased, index for index.
         """
         if not lines:
             return ''
@@ -126,43 +170,100 @@ class GradingProcessDetector:
             if not ln:
                 continue
             words = ln.split()
+            # Every heading check below caps the word count, so longer lines are skipped outright
+            if len(words) > MAX_HEADING_WORDS:
+                continue
             if ln.isupper() and len(words) <= MAX_HEADING_WORDS_CAPS:
                 return ln
-            low = ln.lower()
-            if any(k in low for k in self.anchor_keywords) and len(words) <= MAX_HEADING_WORDS_ANCHOR:
-                return ln
-            cap_count = sum(1 for w in words if w and w[0].isupper())
-            if MIN_TITLE_CASE_CAPS <= cap_count and len(words) <= MAX_HEADING_WORDS_TITLE and '.' not in ln and ',' not in ln:
+            low = lowered[i] if lowered is not None else ln.lower()
+            if len(words) <= MAX_HEADING_WORDS_ANCHOR and self.anchor_pattern.search(low):
                 return ln
+            if len(words) <= MAX_HEADING_WORDS_TITLE and '.' not in ln and ',' not in ln:
+                cap_count = sum(1 for w in words if w[0].isupper())
+                if cap_count >= MIN_TITLE_CASE_CAPS:
+                    return ln
         return ''
 
-    def _is_heading_line(self, s: str) -> bool:
+    def _is_heading_line(self, s: str, s_lower: str = None) -> bool:
         """Return True if ``s`` looks like a short section heading.
 
         This is a lightweight heuristic used when extending blocks to
-        include nearby headings.
+        include nearby headings. ``s_lower`` may be passed when the caller
+        already has the lowered line.
         """
         if not s or not s.strip():
             return False
         s_stripped = s.strip()
-        words = [w for w in s_stripped.split() if w]
+        words = s_stripped.split()
+        # Paragraph lines are longer than any heuristic below allows
+        if len(words) > MAX_HEADING_WORDS:
+            return False
 
         # All-caps short headings are strong indicator
         if s_stripped.isupper() and len(words) <= MAX_HEADING_WORDS_CAPS:
             return True
 
-        low = s_stripped.lower()
         # Anchor keywords are useful, but require the line to be reasonably short
-        if any(k in low for k in self.anchor_keywords) and len(words) <= MAX_HEADING_WORDS_ANCHOR:
+        low = s_lower if s_lower is not None else s_stripped.lower()
+        if len(words) <= MAX_HEADING_WORDS_ANCHOR and self.anchor_pattern.search(low):
             return True
 
         # Title-Case heuristic: short lines with multiple capitalized words and no sentence punctuation
-        cap_count = sum(1 for w in words if w and w[0].isupper())
-        if MIN_TITLE_CASE_CAPS <= cap_count and len(words) <= MAX_HEADING_WORDS_TITLE and '.' not in s_stripped and ',' not in s_stripped:
-            return True
+        if len(words) <= MAX_HEADING_WORDS_TITLE and '.' not in s_stripped and ',' not in s_stripped:
+            cap_count = sum(1 for w in words if w[0].isupper())
+            if cap_count >= MIN_TITLE_CASE_CAPS:
+                return True
 
         return False
 
+    def _select_block_lines(self, stripped, start: int, end: int, line_has_percent, line_has_points) -> List[int]:
+        """Return indices of the percent/points lines in ``stripped[start:end + 1]``
+        with their short context lines, in order, or an empty list if the
+        range holds no percent/points line.
+
+        Each hit brings along one short line before and after it, and short
+        label lines that lead up to a percent line just past the range
+        (e.g. 'Quizzes:' then later 'Quiz1: 40%') are picked up as well.
+        """
+        selected = []
+        for idx in range(start, end + 1):
+            if not (line_has_percent[idx] or line_has_points[idx]):
+                continue
+            # include one short preceding line if it looks like a heading/context
+            if idx - 1 >= start and stripped[idx-1]:
+                prev = stripped[idx-1]
+                if len(prev.split()) <= MAX_SHORT_LINE_WORDS and len(prev) <= MAX_SHORT_LINE_LENGTH:
+                    selected.append(idx-1)
+            selected.append(idx)
+            # include one short following line if it's short and not a long sentence
+            if idx + 1 <= end and stripped[idx+1]:
+                next_line = stripped[idx+1]
+                if len(next_line.split()) <= MAX_NEXT_LINE_WORDS:
+                    selected.append(idx+1)
+        if not selected:
+            return []
+
+        # dedupe with one flag per line of the range; first occurrences
+        # in selected are already ascending, so this keeps their order
+        picked = bytearray(end - start + 1)
+        for i in selected:
+            picked[i - start] = 1
+        final_idxs = [start + i for i, flag in enumerate(picked) if flag]
+
+        # If percent lines are separated by short label lines that appear later,
+        # scan forward up to a few lines to capture them
+        end_block = final_idxs[-1]
+        for j in range(end_block + 1, min(len(stripped), end_block + MAX_FORWARD_SCAN)):
+            if line_has_percent[j]:
+                # include intervening short lines; k is past end_block, so it
+                # can't already be in final_idxs
+                for k in range(end_block + 1, j + 1):
+                    # only include short label/context lines
+                    if stripped[k] and (k == j or len(stripped[k].split()) <= MAX_SHORT_LINE_WORDS):
+                        final_idxs.append(k)
+                break
+        return final_idxs
+
     def detect(self, text: str) -> Dict[str, Any]:
         """Detect grading process and return a result dict with keys:
         - 'found': bool
@@ -179,90 +280,93 @@ class GradingProcessDetector:
             self.logger.info(f"NOT_FOUND: {self.field_name} (empty text)")
             return {'found': False, 'content': ''}
 
-        # Normalize line endings
-        lines = [ln.rstrip() for ln in text.split('\n')]
-        joined = '\n'.join(lines)
+        # Lines keep their trailing whitespace (and any '\r'); every check below
+        # strips what it looks at, and output lines are rstripped when joined
+        lines = text.split('\n')
+        # Lowercased once for all the keyword tests below, trailing whitespace
+        # dropped so window context joins words with a single space; lowering
+        # never turns whitespace into text or back, so stripping before or after agrees
+        lowered = [ln.lower().rstrip() for ln in lines]
+        # Stripped lines for every emptiness, length and word test; lines
+        # itself is kept for output, which keeps each line's indentation
+        stripped = [ln.strip() for ln in lines]
+
+        # Percent/points hits per line, searched once and reused by every pass
+        # below (surrounding whitespace never changes whether they match).
+        # A hit needs a '%', or a 'p'/'P' for points, so lines without one
+        # never reach the regex engine. The bound search methods are looked up
+        # once here rather than on every line
+        percent_search = self.percent_pattern.search
+        points_search = self.points_pattern.search
+        line_has_percent = [('%' in ln and percent_search(ln) is not None) for ln in lines]
+        line_has_points = [('p' in low and points_search(ln) is not None)
+                           for ln, low in zip(lines, lowered)]
+        # Running counts of those lines, so any range of lines is counted with
+        # one subtraction: lines a..b-1 hold hit_count[b] - hit_count[a] hits
+        percent_count = [0, *accumulate(line_has_percent)]
+        hit_count = [0, *accumulate(p or q for p, q in zip(line_has_percent, line_has_points))]
 
         # DISABLED: Letter-grade block detection (A: ... B: ... C: ... F:)
         # This was detecting grading SCALES (A=90-100%), not grading PROCESS (Homework 30%)
         # The grading scale should be handled by final_grade_scale detector instead
+        # (its letter_block_pattern, whose .{0,80} gaps could backtrack heavily,
+        # has been removed along with it)
 
         # 1) Look for contiguous percentage/points lines (window detection)
-        windows = []
-        current_block = []
-        for i, ln in enumerate(lines):
-            s = ln.strip()
-            if not s:
-                # break block
-                if current_block:
-                    windows.append((i - len(current_block), current_block))
-                    current_block = []
+        # Mark every line that can sit in a window; blank, grading scale, late
+        # policy and unrelated lines stay unmarked and so end a block
+        in_window = bytearray(len(lines))
+        item_match = self.item_pattern.match
+        for i, s in enumerate(stripped):
+            # Only percent/points lines and item lines can join a window (blank
+            # lines are neither), so the costlier grading scale and late policy
+            # checks below run on those alone. The item pattern only decides
+            # lines with no percent/points hit and needs a 'p' from 'points'/'pts'
+            if not (line_has_percent[i] or line_has_points[i]
+                    or ('p' in lowered[i] and item_match(s))):
                 continue
 
-            has_percent = bool(self.percent_pattern.search(s))
-            has_points = bool(self.points_pattern.search(s))
-            looks_like_item = bool(re.match(r"^[A-Za-z].{0,60}(\d+\s*%|\(\d+%\)|\d+\s*points|\d+\s*pts)", s, re.I))
-
             # Skip lines that look like grading scale (letter grades with ranges)
-            if self._is_grading_scale_line(s):
-                # If we have a block, end it here
-                if current_block:
-                    windows.append((i - len(current_block), current_block))
-                    current_block = []
+            # or like late submission policy
+            s_lower = lowered[i].strip()
+            if self._is_grading_scale_line(s, s_lower) or self._is_late_policy_line(s, s_lower):
                 continue
-
-            # Skip lines that look like late submission policy
-            if self._is_late_policy_line(s):
-                # If we have a block, end it here
-                if current_block:
-                    windows.append((i - len(current_block), current_block))
-                    current_block = []
-                continue
-
-            if has_percent or has_points or looks_like_item:
-                current_block.append(s)
-            else:
-                # if block already has multiple percent lines, we end it
-                if current_block:
-                    windows.append((i - len(current_block), current_block))
-                    current_block = []
-        if current_block:
-            windows.append((len(lines) - len(current_block), current_block))
+            in_window[i] = 1
+        # Each run of marked lines is a window, kept as a (first line index,
+        # line count) pair; the regex engine finds the runs over the mask in C
+        windows = [(m.start(), m.end() - m.start()) for m in WINDOW_RUN_PATTERN.finditer(in_window)]
 
         # Choose the best window: one with most percent/points lines
         best = None
         best_score = 0
-        for idx, block in windows:
-            # FILTER: Skip windows that are predominantly grading scales or late policies
-            grading_scale_lines = sum(1 for ln in block if self._is_grading_scale_line(ln))
-            late_policy_lines = sum(1 for ln in block if self._is_late_policy_line(ln))
-            total_lines = len(block)
-
-            # If more than 50% of lines are grading scale/late policy, skip this window
-            if total_lines > 0 and (grading_scale_lines + late_policy_lines) / total_lines > 0.5:
-                continue
-
-            score = sum(1 for ln in block if self.percent_pattern.search(ln) or self.points_pattern.search(ln))
+        for idx, total_lines in windows:
+            # Windows never hold grading scale or late policy lines: the scan
+            # above ends a window at each one, so they need no second check
+            score = hit_count[idx + total_lines] - hit_count[idx]
             # bonus if there is an anchor keyword near the block
-            context = ' '.join(lines[max(0, idx-PERCENT_CLUSTER_WINDOW): min(len(lines), idx+len(block)+PERCENT_CLUSTER_WINDOW)])
-            if any(k in context.lower() for k in self.anchor_keywords):
+            context = ' '.join(lowered[max(0, idx-PERCENT_CLUSTER_WINDOW): min(len(lines), idx+total_lines+PERCENT_CLUSTER_WINDOW)])
+            if self.anchor_pattern.search(context):
                 score += 1
             if score > best_score and score >= MIN_WINDOW_SCORE:
                 best_score = score
-                best = (idx, block)
+                best = (idx, total_lines)
+            # A later window scores at most the hits left after this one plus
+            # the anchor bonus; once that can't beat best_score, stop
+            if best_score > hit_count[-1] - hit_count[idx + total_lines]:
+                break
 
         if best:
-            start_idx, block = best
-            end_idx = start_idx + len(block) - 1
+            start_idx, block_len = best
+            end_idx = start_idx + block_len - 1
 
             # Try to extend upwards to include a nearby heading (scan up to MAX_UPWARD_SCAN lines)
             start = start_idx
             for i in range(start_idx - 1, max(-1, start_idx - MAX_UPWARD_SCAN - 1), -1):
                 if i < 0:
                     break
-                if not lines[i].strip():
+                if not stripped[i]:
                     break
-                if self._is_heading_line(lines[i]):
+                if self._is_heading_line(stripped[i], lowered[i]):
                     start = i
                     # once we include a heading, stop scanning further up
                     break
@@ -271,58 +375,20 @@ class GradingProcessDetector:
             # Extend down to capture multi-line items (up to MAX_DOWNWARD_SCAN lines), but stop at long sentence paragraphs
             end = end_idx
             for j in range(end_idx + 1, min(len(lines), end_idx + MAX_DOWNWARD_SCAN)):
-                if not lines[j].strip():
+                if not stripped[j]:
                     break
-                next_line = lines[j].strip()
+                next_line = stripped[j]
                 # If the line looks like a long sentence (many words and contains a period), stop
                 if '.' in next_line and len(next_line.split()) > MAX_NEXT_LINE_WORDS:
                     break
                 end = j
 
             # Prefer to return only the percent/points lines and very short context
-            percent_idxs = [i for i in range(start, end + 1) if self.percent_pattern.search(lines[i]) or self.points_pattern.search(lines[i])]
-            if percent_idxs:
-                selected = []
-                for idx in percent_idxs:
-                    # include one short preceding line if it looks like a heading/context
-                    if idx - 1 >= start and lines[idx-1].strip():
-                        prev = lines[idx-1].strip()
-                        if len(prev.split()) <= MAX_SHORT_LINE_WORDS and len(prev) <= MAX_SHORT_LINE_LENGTH:
-                            selected.append(idx-1)
-                    selected.append(idx)
-                    # include one short following line if it's short and not a long sentence
-                    if idx + 1 <= end and lines[idx+1].strip():
-                        next_line = lines[idx+1].strip()
-                        if len(next_line.split()) <= MAX_NEXT_LINE_WORDS and not ('.' in next_line and len(next_line.split()) > MAX_NEXT_LINE_WORDS):
-                            selected.append(idx+1)
-                # dedupe while preserving order
-                seen = set()
-                final_idxs = []
-                for i in selected:
-                    if i not in seen:
-                        seen.add(i)
-                        final_idxs.append(i)
-
-                # If percent lines are separated by short label lines that appear later,
-                # scan forward up to a few lines to capture them (e.g., 'Quizzes:' then later 'Quiz1: 40%')
-                if final_idxs:
-                    start_block = min(final_idxs)
-                    end_block = max(final_idxs)
-                    for j in range(end_block + 1, min(len(lines), end_block + MAX_FORWARD_SCAN)):
-                        if self.percent_pattern.search(lines[j]):
-                            # include intervening short lines
-                            for k in range(end_block + 1, j + 1):
-                                if k not in seen and lines[k].strip():
-                                    # only include short label/context lines
-                                    if k == j or len(lines[k].split()) <= MAX_SHORT_LINE_WORDS:
-                                        seen.add(k)
-                                        final_idxs.append(k)
-                            end_block = j
-                            break
-
-                content_lines = [lines[i].rstrip() for i in final_idxs if lines[i].strip()]
+            final_idxs = self._select_block_lines(stripped, start, end, line_has_percent, line_has_points)
+            if final_idxs:
+                content_lines = [lines[i].rstrip() for i in final_idxs if stripped[i]]
                 # prepend heading if found above original block
-                heading = self._get_heading_before(lines, start_idx)
+                heading = self._get_heading_before(lines, start_idx, lowered=lowered)
                 if heading and (not content_lines or not content_lines[0].startswith(heading)):
                     content_lines.insert(0, heading)
                 content = '\n'.join(content_lines).strip()
@@ -330,77 +396,44 @@ class GradingProcessDetector:
                 return {'found': True, 'content': content}
             else:
                 # fallback to returning the short block (should be rare)
-                content_lines = [lines[i].rstrip() for i in range(start, end + 1) if lines[i].strip()]
+                content_lines = [lines[i].rstrip() for i in range(start, end + 1) if stripped[i]]
                 content = '\n'.join(content_lines).strip()
                 self.logger.info(f"FOUND: {self.field_name} (short block fallback)")
                 return {'found': True, 'content': content}
 
         # 3) fallback: look for lines containing a cluster of assignment labels followed shortly by percentages
         # find lines where a percentage exists and gather +/-PERCENT_CLUSTER_WINDOW lines around it
-        percent_lines_idx = [i for i, ln in enumerate(lines) if self.percent_pattern.search(ln)]
+        percent_lines_idx = [i for i, hit in enumerate(line_has_percent) if hit]
         for idx in percent_lines_idx:
             # gather a slightly larger window and then try to expand to heading/context
             start = max(0, idx - PERCENT_CLUSTER_WINDOW)
             end = min(len(lines), idx + PERCENT_CLUSTER_WINDOW + 1)
-            block_lines = [lines[j] for j in range(start, end) if lines[j].strip()]
-            if sum(1 for ln in block_lines if self.percent_pattern.search(ln)) >= MIN_WINDOW_SCORE:
+            if percent_count[end] - percent_count[start] >= MIN_WINDOW_SCORE:
                 # expand similarly to the window case
                 # find nearest non-empty start before 'start' that looks like a heading
                 heading_start = start
                 for i in range(start - 1, max(-1, start - MAX_DOWNWARD_SCAN), -1):
-                    if i < 0 or not lines[i].strip():
+                    if i < 0 or not stripped[i]:
                         break
-                    if any(k in lines[i].lower() for k in self.anchor_keywords) or lines[i].strip().isupper():
+                    if self.anchor_pattern.search(lowered[i]) or stripped[i].isupper():
                         heading_start = i
                         break
                 final_start = heading_start
                 final_end = min(len(lines) - 1, end + PERCENT_CLUSTER_WINDOW)
                 for j in range(end, min(len(lines), end + MAX_DOWNWARD_SCAN)):
-                    if not lines[j].strip():
+                    if not stripped[j]:
                         break
                     final_end = j
                 # prefer to return only percent/points lines near the cluster
-                percent_idxs2 = [k for k in range(final_start, final_end + 1) if self.percent_pattern.search(lines[k]) or self.points_pattern.search(lines[k])]
-                if percent_idxs2:
-                    selected = []
-                    for idx in percent_idxs2:
-                        if idx - 1 >= final_start and lines[idx-1].strip():
-                            prev = lines[idx-1].strip()
-                            if len(prev.split()) <= MAX_SHORT_LINE_WORDS and len(prev) <= MAX_SHORT_LINE_LENGTH:
-                                selected.append(idx-1)
-                        selected.append(idx)
-                        if idx + 1 <= final_end and lines[idx+1].strip():
-                            next_line = lines[idx+1].strip()
-                            if len(next_line.split()) <= MAX_NEXT_LINE_WORDS and not ('.' in next_line and len(next_line.split()) > MAX_NEXT_LINE_WORDS):
-                                selected.append(idx+1)
-                    seen = set()
-                    final_idxs2 = []
-                    for i in selected:
-                        if i not in seen:
-                            seen.add(i)
-                            final_idxs2.append(i)
-
-                    # expand forward to include percent lines that appear after short labels
-                    if final_idxs2:
-                        start_block2 = min(final_idxs2)
-                        end_block2 = max(final_idxs2)
-                        for j in range(end_block2 + 1, min(len(lines), end_block2 + MAX_FORWARD_SCAN)):
-                            if self.percent_pattern.search(lines[j]):
-                                for k in range(end_block2 + 1, j + 1):
-                                    if k not in seen and lines[k].strip():
-                                        if k == j or len(lines[k].split()) <= MAX_SHORT_LINE_WORDS:
-                                            seen.add(k)
-                                            final_idxs2.append(k)
-                                end_block2 = j
-                                break
-
-                    content_lines = [lines[k].rstrip() for k in final_idxs2 if lines[k].strip()]
-                    heading = self._get_heading_before(lines, final_start)
+                final_idxs2 = self._select_block_lines(stripped, final_start, final_end, line_has_percent, line_has_points)
+                if final_idxs2:
+                    content_lines = [lines[k].rstrip() for k in final_idxs2 if stripped[k]]
+                    heading = self._get_heading_before(lines, final_start, lowered=lowered)
                     if heading and (not content_lines or not content_lines[0].startswith(heading)):
                         content_lines.insert(0, heading)
                     self.logger.info(f"FOUND: {self.field_name} (percent cluster)")
                     return {'found': True, 'content': '\n'.join(content_lines).strip()}
-                content_lines = [lines[k].rstrip() for k in range(final_start, final_end + 1) if lines[k].strip()]
+                content_lines = [lines[k].rstrip() for k in range(final_start, final_end + 1) if stripped[k]]
                 self.logger.info(f"FOUND: {self.field_name} (cluster fallback)")
                 return {'found': True, 'content': '\n'.join(content_lines).strip()}
 
@@ -410,7 +443,7 @@ class GradingProcessDetector:
 
 # Backwards compatibility
 def detect_grading_process(text: str) -> str:
-    d = GradingProcessDetector()
+    d = get_detector(GradingProcessDetector)
     res = d.detect(text)
     return res.get('content', '') if res.get('found') else ''
 
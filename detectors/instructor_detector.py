@@ -66,6 +66,9 @@ class InstructorDetector:
         self.title_keywords = [
             'assistant professor', 'associate professor', 'senior lecturer', 'lecturer', 'adjunct professor', 'adjunct instructor', 'adjunct faculty', 'professor', 'prof.', "adjunct"
         ]
+        # One pass over a lowered line tells whether any title keyword is there
+        # at all; only lines that hit are checked keyword by keyword, in order
+        self.title_keyword_pattern = re.compile('|'.join(re.escape(k.lower()) for k in self.title_keywords))
         self.dept_keywords = [
             'Department', 'Dept.', 'School of', 'Division of', 'Program', 'College of', 'Department/Program', 'Department and Program'
         ]
@@ -372,12 +375,15 @@ class InstructorDetector:
         # First, look for any title except 'Dr'/'Dr.' and 'Phd'/'Ph.D'
         found_title = None
         for line in lines:
+            line_lower = line.lower()
+            if not self.title_keyword_pattern.search(line_lower):
+                continue
             for keyword in self.title_keywords:
                 if keyword not in ['Dr', 'Dr.']:
-                    if keyword.lower() in line.lower():
+                    if keyword.lower() in line_lower:
                         return keyword.title() if keyword.islower() else keyword
                 elif keyword.lower() in ['phd', 'ph.d']:
-                    if keyword.lower() in line.lower():
+                    if keyword.lower() in line_lower:
                         found_title = keyword.title() if keyword.islower() else keyword
 
 
@@ -456,7 +462,8 @@ class InstructorDetector:
         """
         # Only search first 30 lines (where instructor info typically appears)
         # This avoids matching department names in course descriptions or footers
-        lines = text.split('\n')[:30]
+        # (maxsplit stops splitting there; the unsplit remainder is dropped)
+        lines = text.split('\n', 30)[:30]
         search_text = '\n'.join(lines).lower()
 
         # Search for known departments (list is ordered from most specific to least)
@@ -478,7 +485,8 @@ class InstructorDetector:
         """
         self.logger.info(f"Starting detection for field: {self.field_name}")
 
-        lines = text.split('\n')[:LINES_TO_SCAN]
+        # Only the leading lines are scanned, so stop splitting after them
+        lines = text.split('\n', LINES_TO_SCAN)[:LINES_TO_SCAN]
         name = self.extract_name(lines)
         title = self.extract_title(lines)
         department = self.extract_department(lines)
@@ -35,12 +35,139 @@ MIN_SCORE_THRESHOLD = 5
 SHORT_LINE_THRESHOLD = 50
 LONG_LINE_THRESHOLD = 100
 
+# Unicode punctuation and the ASCII that _normalize_text puts in its place
+UNICODE_PUNCTUATION = (
+    ('\uff1a', ':'),  # Full-width colon
+    ('\u2014', '-'),  # Em-dash
+    ('\u2013', '-'),  # En-dash
+    ('\u2010', '-'),  # Hyphen
+    ('\u2011', '-'),  # Non-breaking hyphen
+    ('\u2043', '-'),  # Bullet operator
+    ('\u2019', "'"),  # Right single quote
+    ('\u2018', "'"),  # Left single quote
+    ('\u201c', '"'),  # Left double quote
+    ('\u201d', '"'),  # Right double quote
+)
+
+# Approved titles for late missing work detection, written the way
+# LateDetector._normalize_text leaves text (lowercase, ASCII punctuation,
+# single spaces) so normalized lines compare against them directly
+APPROVED_TITLES = (
+    # Removed generic "assignments" and "assessments" - too many false positives
+    "assignment deadlines",
+    "assignments and grading",
+    "attendance and late work",
+    "deadline expectations",
+    "deadline policy",
+    "expectations regarding assignment deadlines, late, or missing work",
+    "grading (late policy: 10% deduction per day, up to 5 days)",
+    "late assignments",
+    "late assignments and make-up exams",
+    "late homework policy",
+    "late policy",
+    "late submission policy",
+    "late submissions",
+    "late submissions and make-up exam",
+    "late submissions and make-up exams",
+    "late submissions and makeups",
+    "late work",
+    "late work policy",
+    "late/make-up work",
+    "makeups",
+    "make-up policy",
+    "make-up work",
+    "missing work",
+    "missing work policy",
+    "paper assignment / powerpoint presentations",
+    "penalty for late assignments",
+    "policy on attendance, late submissions",
+    "policy on late submissions",
+    "policy on late work",
+    "submission deadlines",
+    "submission policy",
+    "summary/critique paper (late policy)",
+    "experiments/demonstrations"
+)
+# Exact title lines are found with one set lookup instead of a scan
+APPROVED_TITLE_SET = frozenset(APPROVED_TITLES)
+# Every title check needs some title inside the normalized line, so a single
+# scan for all of them rules out the lines that cannot match
+APPROVED_TITLE_PATTERN = re.compile('|'.join(re.escape(title) for title in APPROVED_TITLES))
+
 # Section headers that indicate end of late work content
 SECTION_HEADERS = [
     'course description', 'course objectives', 'course goals',
     'prerequisites', 'textbook', 'grading', 'schedule',
     'extra credit', 'attendance'
 ]
+# The same headers as one alternation, so a lowered line is scanned once
+SECTION_HEADER_PATTERN = re.compile('|'.join(re.escape(section) for section in SECTION_HEADERS))
+
+# Content patterns that strongly indicate late work policies
+# Made more conservative to reduce false positives
+# (compiled case-insensitive, so lines are searched without lowercasing them)
+CONTENT_PATTERNS = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in [
+    # High confidence patterns - require clear policy language
+    r"late work is.*?(?:anything submitted|defined as|considered).*?after.*?(?:due date|deadline)",
+    r"you will lose.*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",  # Must have "per day" context
+    r"late work is anything submitted after.*?(?:due date|deadline)",
+    r"(?:\d+%|ten percent|\d+ percent).*?(?:deduction|penalty).*?per day.*?(?:late work|late assignment)",
+    r"late work will not be accepted.*?(?:after|beyond)",
+    r"no assignment will be accepted after.*?(?:deadline|due date)",
+    r"submissions will not be accepted after.*?(?:deadline|due date)",
+    r"(?:late|tardy).*?(?:penalty|deduction).*?\d+%.*?(?:per day|each day)",
+    r"do not submit.*?(?:homework|assignment|work).*?late",
+    r"you may hand in.*?(?:one|1).*?late.*?(?:homework|assignment)",
+
+    # New pattern for the specific case you mentioned
+    r"any assignment not turned in by.*?(?:midnight|due date|date).*?(?:late|penalty|grade penalty)",
+
+    # Medium confidence patterns
+    r"unexcused late.*?will receive.*?deduction",
+    r"no submissions.*?accepted.*?(?:after|beyond).*?\d+.*?days",
+    r"three days after.*?due date.*?will not be accepted",
+    r"(?:48|forty-eight) hours after.*?due.*?(?:day|date)",
+    r"grace period.*?(?:late|assignment)",
+    r"make-?up.*?(?:work|exam|assignment).*?(?:policy|will be)",
+
+    # Medium confidence patterns - require more context
+    r"late submissions.*?no assignment will be accepted",
+    r"(?:late|tardy).*?(?:work|assignment).*?policy",  # Must mention "policy"
+    r"(?:grading|penalty).*?\(late policy.*?\)",
+
+    # Conservative patterns for simple statements
+    r"(?:homework|assignments).*?submitted late.*?(?:deduct|reduce|lose).*?\d+",  # Must have penalty amount
+    r"(?:one|1).*?late.*?(?:homework|assignment).*?(?:allowed|accepted)",
+
+    # Additional patterns for assignment-specific policies
+    r"assignment.*?not turned in.*?(?:midnight|due date).*?(?:late|penalty)",
+    r"(?:assignment|homework).*?(?:due date|deadline).*?(?:penalty|deduction|zero|0)",
+    r"after.*?(?:due date|deadline).*?assignment.*?(?:not accepted|zero|penalty)",
+
+    # Patterns for combined title+content cases
+    r"late submissions.*?no assignment will be accepted",
+    r"late work.*?no.*?(?:assignment|work).*?(?:accepted|allowed)",
+    r"you will receive.*?(?:grade of 0|zero).*?for.*?(?:quiz|exam).*?(?:miss|late)",
+    r"you will receive a grade of 0 for any (?:quiz|exam|assignment) that you miss",  # Very specific pattern
+    r"late submissions.*?no assignment will be accepted after.*?deadline.*?grade",  # Combined title+content pattern
+]]
+
+# All content patterns fused into one scan over the whole text. None of them
+# can cross a newline without DOTALL, so the leftmost match is on the first
+# line a per-line loop would have hit. The plain variant runs over lowered
+# text, which lets the regex engine skip ahead on literal prefixes; the
+# IGNORECASE variant covers text whose lowercasing differs from re's folding.
+CONTENT_PATTERN = re.compile('|'.join(f'(?:{p.pattern})' for p in CONTENT_PATTERNS))
+CONTENT_PATTERN_IGNORECASE = re.compile(CONTENT_PATTERN.pattern, re.IGNORECASE)
+CASE_MISMATCH_CHARS = ('\u0130', '\u0131', '\u017f')
+
+# Multi-line patterns - more conservative
+MULTILINE_PATTERNS = [re.compile(p, re.IGNORECASE | re.DOTALL) for p in [
+    r"late work is anything submitted after.*?(?:unless you have received|zero will be given|will not be accepted)",
+    r"(?:10|ten)%.*?per day.*?for.*?(?:work submitted late|late work).*?(?:up to|for up to)",
+    r"late work is.*?(?:submitted|turned in|handed in).*?after.*?(?:due|deadline).*?(?:penalty|deduction|lose)",
+    r"(?:penalty|deduction).*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",
+]]
 
 
 class LateDetector:
@@ -58,42 +185,7 @@ class LateDetector:
         self.logger = logging.getLogger('detector.late')
 
         # Approved titles for late missing work detection
-        self.approved_titles = [
-            # Removed generic "assignments" and "assessments" - too many false positives
-            "assignment deadlines",
-            "assignments and grading",
-            "attendance and late work",
-            "deadline expectations",
-            "deadline policy",
-            "expectations regarding assignment deadlines, late, or missing work",
-            "grading (late policy: 10% deduction per day, up to 5 days)",
-            "late assignments",
-            "late assignments and make-up exams",
-            "late homework policy",
-            "late policy",
-            "late submission policy",
-            "late submissions",
-            "late submissions and make-up exam",
-            "late submissions and make-up exams",
-            "late submissions and makeups",
-            "late work",
-            "late work policy",
-            "late/make-up work",
-            "makeups",
-            "make-up policy",
-            "make-up work",
-            "missing work",
-            "missing work policy",
-            "paper assignment / powerpoint presentations",
-            "penalty for late assignments",
-            "policy on attendance, late submissions",
-            "policy on late submissions",
-            "policy on late work",
-            "submission deadlines",
-            "submission policy",
-            "summary/critique paper (late policy)",
-            "experiments/demonstrations"
-        ]
+        self.approved_titles = APPROVED_TITLES
 
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -110,25 +202,11 @@ class LateDetector:
         # Lowercase first
         normalized = text.lower()
 
-        # Replace Unicode punctuation with ASCII equivalents
-        normalized = normalized.replace('：', ':')  # Full-width colon
-        normalized = normalized.replace('—', '-')  # Em-dash
-        normalized = normalized.replace('–', '-')  # En-dash
-        normalized = normalized.replace('‐', '-')  # Hyphen (U+2010)
-        normalized = normalized.replace('‑', '-')  # Non-breaking hyphen (U+2011)
-        normalized = normalized.replace('⁃', '-')  # Bullet operator (U+2043)
-        normalized = normalized.replace('\u2014', '-')  # Em-dash (unicode)
-        normalized = normalized.replace('\u2013', '-')  # En-dash (unicode)
-        normalized = normalized.replace('\u2010', '-')  # Hyphen (unicode)
-        normalized = normalized.replace('\u2011', '-')  # Non-breaking hyphen (unicode)
-        normalized = normalized.replace('\u2043', '-')  # Bullet operator (unicode)
-        
-        # Handle common Unicode quotation marks
-        normalized = normalized.replace("’", "'")   # Right single quote
-        normalized = normalized.replace("‘", "'")   # Left single quote
-        normalized = normalized.replace("“", '"')   # Left double quote
-        normalized = normalized.replace("”", '"')   # Right double quote
-
+        # Replace Unicode punctuation with ASCII equivalents; plain ASCII
+        # lines (nearly all of them) have none, so they skip the pass
+        if not normalized.isascii():
+            for unicode_char, ascii_char in UNICODE_PUNCTUATION:
+                normalized = normalized.replace(unicode_char, ascii_char)
 
         # Normalize whitespace (multiple spaces -> single space)
         normalized = ' '.join(normalized.split())
@@ -212,32 +290,30 @@ class LateDetector:
         """
         lines = text.split('\n')
 
-        # Find all potential matches first, then pick the best one
-        potential_matches = []
+        # Keep the best match seen so far; on equal scores the earliest wins
+        best_match = None
 
         for i, line in enumerate(lines):
-            line_normalized = self._normalize_text(line.strip())
+            # (whitespace collapsing in _normalize_text also strips the line)
+            line_normalized = self._normalize_text(line)
             line_without_punctuation = line_normalized.replace(':', '').replace('.', '').strip()
-
-            # First check for exact matches - these get priority
-            exact_match_found = False
-            for title in self.approved_titles:
-                normalized_title = self._normalize_text(title)
-                if (normalized_title == line_without_punctuation or
-                    normalized_title + ':' == line_normalized or
-                    normalized_title == line_normalized.rstrip(':')):
-                    # Exact match - add with very high score
-                    potential_matches.append((100, i, line))
-                    exact_match_found = True
-                    break
-            
-            if exact_match_found:
+            if not (APPROVED_TITLE_PATTERN.search(line_without_punctuation) or
+                    APPROVED_TITLE_PATTERN.search(line_normalized)):
                 continue
 
+            # First check for exact matches - these get priority. Titles never
+            # end in ':', so "title:" lines are covered by the rstrip form
+            if (line_without_punctuation in APPROVED_TITLE_SET or
+                line_normalized.rstrip(':') in APPROVED_TITLE_SET):
+                # Exact match - add with very high score. No scored line
+                # reaches 100, and ties keep the earliest line, so the first
+                # exact match is the final pick
+                best_match = (100, i, line)
+                break
+
             # Check if any approved title appears properly (not just as part of a sentence)
             contains_approved_title = False
-            for title in self.approved_titles:
-                normalized_title = self._normalize_text(title)
+            for normalized_title in self.approved_titles:
                 if normalized_title in line_without_punctuation:
                     # Additional check: line should be relatively short and not part of a long sentence
                     # or the title should be at the start/end of the line
@@ -302,36 +378,23 @@ class LateDetector:
                 # Score this match based on how likely it is to be a section header
                 score = 0
 
-                # Very high score for exact matches (check both case variations)
+                # Very high score for exact matches (normalizing lowercases,
+                # so title-case variants of a title compare the same)
                 exact_match = False
-                for title in self.approved_titles:
-                    normalized_title = self._normalize_text(title)
-                    # Also check title case version
-                    title_case_version = title.title()
-                    normalized_title_case = self._normalize_text(title_case_version)
-                    
-                    for check_title in [normalized_title, normalized_title_case]:
-                        if (check_title == line_without_punctuation or 
-                            check_title + ':' == line_without_punctuation or
-                            check_title == line_without_punctuation.rstrip(':') or
-                            # Check if line starts with the title and has reasonable continuation
-                            (line_without_punctuation.startswith(check_title) and 
-                             len(line_without_punctuation) <= len(check_title) + 100)):
-                            exact_match = True
-                            break
-                    if exact_match:
+                for check_title in self.approved_titles:
+                    if (check_title == line_without_punctuation or 
+                        check_title + ':' == line_without_punctuation or
+                        check_title == line_without_punctuation.rstrip(':') or
+                        # Check if line starts with the title and has reasonable continuation
+                        (line_without_punctuation.startswith(check_title) and 
+                         len(line_without_punctuation) <= len(check_title) + 100)):
+                        exact_match = True
                         break
                 if exact_match:
                     score += 20  # Very high score for exact matches
 
                 # Higher score for lines that start with approved titles
-                starts_with_approved = False
-                for title in self.approved_titles:
-                    normalized_title = self._normalize_text(title)
-                    if line_without_punctuation.startswith(normalized_title):
-                        starts_with_approved = True
-                        break
-                if starts_with_approved:
+                if line_without_punctuation.startswith(self.approved_titles):
                     score += SCORE_STARTS_WITH_TITLE
 
                 # Higher score for shorter lines (more likely to be headers)
@@ -350,12 +413,12 @@ class LateDetector:
                 if line.strip().isupper():
                     score += SCORE_ALL_CAPS
 
-                potential_matches.append((score, i, line))
+                if best_match is None or score > best_match[0]:
+                    best_match = (score, i, line)
 
-        # Sort by score (highest first) and pick the best match
-        if potential_matches:
-            potential_matches.sort(key=lambda x: x[0], reverse=True)
-            best_score, best_i, best_line = potential_matches[0]
+        # Use the highest-scoring match
+        if best_match:
+            best_score, best_i, best_line = best_match
 
             # Only accept matches with a reasonable score (likely section headers)
             # Lower threshold to catch more legitimate titles
@@ -376,7 +439,7 @@ class LateDetector:
                     continue
 
                 # Stop if we hit another section title
-                if any(section in next_line.lower() for section in SECTION_HEADERS):
+                if SECTION_HEADER_PATTERN.search(next_line.lower()):
                     break
 
                 content_lines.append(next_line)
@@ -402,116 +465,71 @@ class LateDetector:
         Returns:
             tuple: (found, content)
         """
-        # Content patterns that strongly indicate late work policies
-        # Made more conservative to reduce false positives
-        content_patterns = [
-            # High confidence patterns - require clear policy language
-            r"late work is.*?(?:anything submitted|defined as|considered).*?after.*?(?:due date|deadline)",
-            r"you will lose.*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",  # Must have "per day" context
-            r"late work is anything submitted after.*?(?:due date|deadline)",  
-            r"(?:\d+%|ten percent|\d+ percent).*?(?:deduction|penalty).*?per day.*?(?:late work|late assignment)",
-            r"late work will not be accepted.*?(?:after|beyond)",
-            r"no assignment will be accepted after.*?(?:deadline|due date)",
-            r"submissions will not be accepted after.*?(?:deadline|due date)",
-            r"(?:late|tardy).*?(?:penalty|deduction).*?\d+%.*?(?:per day|each day)",
-            r"do not submit.*?(?:homework|assignment|work).*?late",
-            r"you may hand in.*?(?:one|1).*?late.*?(?:homework|assignment)",
-            
-            # New pattern for the specific case you mentioned
-            r"any assignment not turned in by.*?(?:midnight|due date|date).*?(?:late|penalty|grade penalty)",
-            
-            # Medium confidence patterns
-            r"unexcused late.*?will receive.*?deduction",
-            r"no submissions.*?accepted.*?(?:after|beyond).*?\d+.*?days",
-            r"three days after.*?due date.*?will not be accepted",
-            r"(?:48|forty-eight) hours after.*?due.*?(?:day|date)",
-            r"grace period.*?(?:late|assignment)",
-            r"make-?up.*?(?:work|exam|assignment).*?(?:policy|will be)",
-            
-            # Medium confidence patterns - require more context
-            r"late submissions.*?no assignment will be accepted",
-            r"(?:late|tardy).*?(?:work|assignment).*?policy",  # Must mention "policy"
-            r"(?:grading|penalty).*?\(late policy.*?\)",
+        lines = text.split('\n')
+        if any(ch in text for ch in CASE_MISMATCH_CHARS):
+            content_pattern, haystack = CONTENT_PATTERN_IGNORECASE, text
+        else:
+            content_pattern, haystack = CONTENT_PATTERN, text.lower()
+
+        # Search for content patterns, one matching line at a time
+        i = 0
+        line_start = 0
+        match = content_pattern.search(haystack)
+        while match:
+            i += haystack.count('\n', line_start, match.start())
+            line = lines[i]
+            # Found a content pattern, extract surrounding context
             
-            # Conservative patterns for simple statements  
-            r"(?:homework|assignments).*?submitted late.*?(?:deduct|reduce|lose).*?\d+",  # Must have penalty amount
-            r"(?:one|1).*?late.*?(?:homework|assignment).*?(?:allowed|accepted)",
+            # Balanced content extraction - focused but not too restrictive
+            content_lines = []
             
-            # Additional patterns for assignment-specific policies
-            r"assignment.*?not turned in.*?(?:midnight|due date).*?(?:late|penalty)",
-            r"(?:assignment|homework).*?(?:due date|deadline).*?(?:penalty|deduction|zero|0)",
-            r"after.*?(?:due date|deadline).*?assignment.*?(?:not accepted|zero|penalty)",
+            # Start with the current line that matched the pattern
+            current_line = line.strip()
+            if current_line:
+                content_lines.append(current_line)
             
-            # Patterns for combined title+content cases
-            r"late submissions.*?no assignment will be accepted",
-            r"late work.*?no.*?(?:assignment|work).*?(?:accepted|allowed)",
-            r"you will receive.*?(?:grade of 0|zero).*?for.*?(?:quiz|exam).*?(?:miss|late)",
-            r"you will receive a grade of 0 for any (?:quiz|exam|assignment) that you miss",  # Very specific pattern
-            r"late submissions.*?no assignment will be accepted after.*?deadline.*?grade",  # Combined title+content pattern
-        ]
-
-        lines = text.split('\n')
-        
-        # Search for content patterns
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            # Check if this line matches any content pattern
-            for pattern in content_patterns:
-                if re.search(pattern, line_lower, re.IGNORECASE | re.DOTALL):
-                    # Found a content pattern, extract surrounding context
-                    
-                    # Balanced content extraction - focused but not too restrictive
-                    content_lines = []
+            # Add up to 2 additional lines if they continue the policy
+            for j in range(i + 1, min(i + 3, len(lines))):
+                if j < len(lines):
+                    next_line = lines[j].strip()
+                    if not next_line:
+                        continue
                     
-                    # Start with the current line that matched the pattern
-                    current_line = line.strip()
-                    if current_line:
-                        content_lines.append(current_line)
+                    # Stop if we hit obvious section breaks
+                    if (SECTION_HEADER_PATTERN.search(next_line.lower()) or
+                        (next_line.endswith(':') and len(next_line) < 50) or  # Likely header
+                        (next_line[0].isupper() and ':' in next_line and len(next_line) < 60)):  # New section
+                        break
                     
-                    # Add up to 2 additional lines if they continue the policy
-                    for j in range(i + 1, min(i + 3, len(lines))):
-                        if j < len(lines):
-                            next_line = lines[j].strip()
-                            if not next_line:
-                                continue
-                            
-                            # Stop if we hit obvious section breaks
-                            if (any(section in next_line.lower() for section in SECTION_HEADERS) or
-                                (next_line.endswith(':') and len(next_line) < 50) or  # Likely header
-                                (next_line[0].isupper() and ':' in next_line and len(next_line) < 60)):  # New section
-                                break
-                            
-                            content_lines.append(next_line)
-                            
-                            # Stop if content is getting too long
-                            total_length = sum(len(cl) for cl in content_lines)
-                            if total_length > 300:  # More reasonable limit
-                                break
+                    content_lines.append(next_line)
                     
-                    # Create focused content
-                    if content_lines:
-                        content = ' '.join(content_lines)
-                        # Clean up extra whitespace
-                        content = re.sub(r'\s+', ' ', content).strip()
-                        
-                        # More reasonable length limits
-                        if 20 < len(content) <= 350:  # Between 20-350 characters
-                            return True, content
+                    # Stop if content is getting too long
+                    total_length = sum(len(cl) for cl in content_lines)
+                    if total_length > 300:  # More reasonable limit
+                        break
+            
+            # Create focused content
+            if content_lines:
+                content = ' '.join(content_lines)
+                # Clean up extra whitespace
+                content = re.sub(r'\s+', ' ', content).strip()
+                
+                # More reasonable length limits
+                if 20 < len(content) <= 350:  # Between 20-350 characters
+                    return True, content
+
+            # Move on to the next line that matches any content pattern
+            line_end = haystack.find('\n', match.start())
+            if line_end < 0:
+                break
+            i += 1
+            line_start = line_end + 1
+            match = content_pattern.search(haystack, line_start)
         
         # Also check for multi-line patterns that span across lines
-        full_text_lower = text.lower()
-        
-        # Multi-line patterns - more conservative
-        multiline_patterns = [
-            r"late work is anything submitted after.*?(?:unless you have received|zero will be given|will not be accepted)",
-            r"(?:10|ten)%.*?per day.*?for.*?(?:work submitted late|late work).*?(?:up to|for up to)",
-            r"late work is.*?(?:submitted|turned in|handed in).*?after.*?(?:due|deadline).*?(?:penalty|deduction|lose)",
-            r"(?:penalty|deduction).*?\d+.*?(?:percent|%).*?per day.*?(?:late|tardy)",
-        ]
-        
-        for pattern in multiline_patterns:
-            match = re.search(pattern, full_text_lower, re.IGNORECASE | re.DOTALL)
+        # (searched in place, so match offsets index straight into text)
+        for pattern in MULTILINE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 # Extract just the matched content with minimal padding
                 start_pos = max(0, match.start() - 20)  # Much less padding
@@ -189,9 +189,7 @@ class LocationDetector(BaseDetector):
         Returns:
             List[str]: Processed, valid office location strings.
         """
-        unique_rooms = []
-        seen = set()
-
+        rooms = []
         for match in matches:
             # Handle tuple matches from regex capture groups
             if isinstance(match, tuple):
@@ -200,13 +198,18 @@ class LocationDetector(BaseDetector):
             room = match.strip() if match else ''
 
             # Validate format: digits optionally followed by a letter (e.g., "529", "105A")
-            if room and re.match(r'^\d+[A-Z]?$', room) and room not in seen:
-                # Check if this is actually an office (not a classroom)
-                if self._is_office_context(room, text):
-                    # Check how this room appears in the document to match the format
-                    formatted = self._format_room_number(room, text)
-                    unique_rooms.append(formatted)
-                    seen.add(room)
+            if room and re.match(r'^\d+[A-Z]?$', room):
+                rooms.append(room)
+
+        # Each distinct room is checked once, in first-seen order; a room that
+        # fails the office check would fail it again, so repeats are skipped
+        unique_rooms = []
+        for room in dict.fromkeys(rooms):
+            # Check if this is actually an office (not a classroom)
+            if self._is_office_context(room, text):
+                # Check how this room appears in the document to match the format
+                formatted = self._format_room_number(room, text)
+                unique_rooms.append(formatted)
 
         return unique_rooms
 
@@ -291,9 +294,11 @@ class LocationDetector(BaseDetector):
             rf'{room_pattern}[^{{}}]*(?:Phone|Email|Hours)'  # "Room 529 ... Phone:"
         ]
 
+        # Check first OFFICE_CONTEXT_SEARCH_LIMIT chars for performance
+        # (sliced once rather than copied again for every pattern)
+        context_text = text[:OFFICE_CONTEXT_SEARCH_LIMIT]
         for pattern in office_patterns:
-            # Check first OFFICE_CONTEXT_SEARCH_LIMIT chars for performance
-            if re.search(pattern, text[:OFFICE_CONTEXT_SEARCH_LIMIT], re.IGNORECASE | re.DOTALL):
+            if re.search(pattern, context_text, re.IGNORECASE | re.DOTALL):
                 return True
 
         return True  # Default to office if context unclear
@@ -822,7 +827,8 @@ class PhoneDetector(BaseDetector):
             r'434[\s.-]?\d{3}[\s.-]?\d{4}',  # For the 434 area code
         ]
         
-        return [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+        # No ^ or $ anchors here, so re.MULTILINE would change nothing
+        return [re.compile(p, re.IGNORECASE) for p in patterns]
     
     def _process_matches(self, matches: List[str], text: str) -> List[str]:
         """
@@ -19,95 +19,256 @@ Example:
 import re
 from typing import Dict, Any, List, Tuple
 
+from detectors import get_detector
+
+
+# ================================================================
+# COMPREHENSIVE REGEX PATTERNS
+# Organized by phrase type for better maintainability
+# (compiled once at import; every detector instance shares them)
+# ================================================================
+# Each pattern is paired with lowercase words, one of which every match of it
+# contains; detect() skips a pattern when none of its words are in the text.
+# None of them use ^ or $, so they are compiled without re.MULTILINE
+RESPOND_WORDS = ('respond', 'repl', 'get', 'answer')
+TIME_PATTERNS = [(words, re.compile(p, re.IGNORECASE)) for words, p in [
+    # Group 1: Direct "Response Time" mentions
+    (('response',), r'response\s+time\s*:?\s*([^\n.;]{0,100}?(?:\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?[^\n.;]{0,50}?))'),
+    (('response',), r'email\s+response\s+time\s*:?\s*([^\n.;]{0,80})'),
+    (('response',), r'(\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)\s+response\s+time'),
+
+    # Group 2: "Within" patterns (most common)
+    (('within',), r'(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?(?:\s+on\s+\w+)?(?:\s*\([^)]{0,30}\))?)'),
+    (('within',), r'(within\s+one\s+(?:business\s+)?day)'),
+    (('within',), r'(within\s+a\s+(?:business\s+)?day)'),
+    (('within',), r'(within\s+24-48\s*hours?)'),
+    (('within',), r'(within\s+24\s*hours?)'),
+    (('within',), r'(within\s+48\s*hours?)'),
+
+    # Group 3: "I respond/reply within..." patterns
+    (RESPOND_WORDS, r'I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)'),
+    (RESPOND_WORDS, r'I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)'),
+    (RESPOND_WORDS, r'I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))'),
+    (RESPOND_WORDS, r'I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (RESPOND_WORDS, r'I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 4: "Respond within..." (without "I")
+    (RESPOND_WORDS, r'(?:respond(?:s)?|reply|replies?|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?(?:\s+on\s+\w+)?)'),
+    (RESPOND_WORDS, r'(?:respond(?:s)?|reply|replies?|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)'),
+
+    # Group 5: "Typically/Usually" patterns
+    (('typically', 'usually', 'generally'), r'(typically|usually|generally)\s+(?:respond(?:s)?|reply|replies?|get\s+back|answer)?\s*(?:to\s+emails?\s*)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?(?:\s*\([^)]{0,30}\))?)'),
+    (('typically', 'usually', 'generally'), r'(typically|usually|generally)\s+(?:respond(?:s)?|reply|replies?|get\s+back|answer)?\s*(?:to\s+emails?\s*)?(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('typically', 'usually', 'generally'), r'(typically|usually|generally)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 6: "You'll/You will" patterns
+    (('you',), r'you(?:\'ll|\s+will)\s+(?:get\s+a\s+)?(?:response|reply|hear\s+from\s+me)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('you',), r'you(?:\'ll|\s+will)\s+(?:get\s+a\s+)?(?:response|reply|hear\s+from\s+me)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('you',), r'you\s+(?:can\s+)?expect\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('you',), r'you\s+(?:can\s+)?expect\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('you',), r'you\s+(?:can\s+)?expect\s+to\s+hear\s+(?:from\s+me\s+)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 7: "Expect" patterns (without "you")
+    (('expect',), r'expect\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('expect',), r'expect\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 8: "No later than" patterns
+    (('later',), r'(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(next\s+(?:business\s+)?(?:day|weekday))'),
+    (('later',), r'(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('later',), r'I\'ll\s+(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(next\s+(?:business\s+)?(?:day|weekday))'),
+    (('later',), r'I\'ll\s+(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 9: "By" patterns
+    (RESPOND_WORDS, r'(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))'),
+    (RESPOND_WORDS, r'I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))'),
+    (('next',), r'(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))'),
+
+    # Group 10: Specific common formats
+    (('24-48',), r'(24-48\s*hours?)'),
+    (('24',), r'(24\s*hours?)(?:\s+on\s+\w+)?'),
+    (('48',), r'(48\s*hours?)(?:\s+on\s+\w+)?'),
+    (('one',), r'(one\s+(?:business\s+)?day)'),
+    (('day',), r'(a\s+(?:business\s+)?day)'),
+    (('business',), r'(\d+\s+business\s+days?)'),
+    (('same',), r'(same\s+(?:business\s+)?day)'),
+    (('next',), r'(next\s+(?:business\s+)?(?:day|weekday))'),
+
+    # Group 11: "Responses/Replies" (plural)
+    (('responses', 'replies'), r'(?:responses|replies)\s+(?:are\s+)?(?:typically|usually|generally)?\s*(?:sent\s+)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('responses', 'replies'), r'(?:responses|replies)\s+(?:are\s+)?(?:typically|usually|generally)?\s*(?:sent\s+)?(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+
+    # Group 12: "Receive" patterns
+    (('receive',), r'(?:you\s+(?:will\s+|\'ll\s+)?)?receive\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+    (('receive',), r'(?:you\s+(?:will\s+|\'ll\s+)?)?receive\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)'),
+]]
+
+# Characters re.IGNORECASE equates with an ASCII letter that str.lower() does
+# not turn into it; the word prefilter is only exact when none are present
+CASE_MISMATCH_CHARS = ('\u0130', '\u0131', '\u017f')
+
+# False-positive filters used by _is_false_positive
+# Assignment grading turnaround (NOT instructor email response)
+GRADING_TURNAROUND_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'assignments?\s+(?:will\s+)?(?:be\s+)?(?:returned|graded)',
+    r'(?:returned|graded).*assignments?',
+    r'once\s+(?:they\s+are\s+)?graded',
+    r'graded.*(?:within|in)\s+\d+',
+    r'(?:within|in)\s+\d+.*graded',
+    r'returned\s+via.*(?:within|in)\s+\d+',
+    r'turnaround.*(?:within|in)\s+\d+',
+    r'(?:within|in)\s+\d+.*turnaround',
+    r'feedback.*(?:within|in)\s+\d+.*(?:graded|returned)',
+]]
+
+# Student must contact instructor (NOT instructor response)
+STUDENT_MUST_CONTACT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'student\s+(?:must|should|need\s+to)\s+(?:contact|notify|email|reach)',
+    r'you\s+(?:must|should|need\s+to)\s+(?:contact|notify|email|reach)',
+    r'(?:contact|notify|email).*(?:instructor|professor).*(?:within|in)\s+\d+',
+    r'(?:within|in)\s+\d+.*(?:of|after).*(?:missed|absence|exam)',
+    r'must\s+(?:contact|notify|email|reach).*(?:within|in)\s+\d+',
+    r'(?:within|in)\s+\d+.*of\s+the\s+missed',
+]]
+
+# Class absence notification deadlines
+ABSENCE_NOTIFICATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'miss(?:ing|ed)?\s+(?:a\s+)?class',
+    r'absence.*(?:before|after|within)',
+    r'(?:before|after).*absence',
+    r'email.*(?:instructor|professor).*(?:about|regarding).*(?:absence|missing)',
+    r'notify.*(?:instructor|professor).*(?:absence|missing)',
+    r'inform.*(?:instructor|professor).*(?:absence|missing)',
+    r'contact.*(?:instructor|professor).*(?:about|regarding).*(?:absence|missing)',
+    r'(?:absence|missing).*(?:before|after|within).*(?:email|contact|notify)',
+    r'if\s+you\s+miss\s+(?:a\s+)?class',
+    r'take\s+(?:the\s+)?responsibility',
+    r'make\s+up.*absence',
+    r'circumstances\s+for\s+missing',
+]]
+
+# Grade disputes and grading-related
+GRADE_RELATED_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'discrepanc(?:y|ies)',
+    r'grade.*(?:published|posted|dispute|error|mistake|concern)',
+    r'(?:published|posted).*grade',
+    r'contact.*me.*regarding.*(?:grade|discrepanc)',
+    r'if.*you.*(?:disagree|question).*grade',
+    r'grading.*(?:error|mistake|concern)',
+    r'final.*grade.*(?:posted|published)',
+    r'regrade.*request',
+    r'appeal.*grade',
+]]
+
+# Student absence/health/performance contexts
+STUDENT_ABSENCE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'student\s+(?:health|support|success|absence|performance)',
+    r'extenuating\s+circumstance',
+    r'unavailable.*(?:day|hour)',
+    r'affect.*performance',
+    r'extended\s+absence',
+    r'personal.*(?:health|matter)',
+    r'dealing\s+with',
+    r'keep\s+you\s+unavailable',
+]]
+
+# Assignment/deadline patterns
+DEADLINE_INDICATOR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\bassignments?\b.*(?:due|submit|turn\s+in)',
+    r'(?:due|submit|turn\s+in).*\bassignments?\b',
+    r'\bhomeworks?\b.*(?:due|submit)',
+    r'(?:due|submit).*\bhomeworks?\b',
+    r'\bexams?\b.*(?:due|submit)',
+    r'\bquizz?(?:es)?\b.*(?:due|submit)',
+    r'\btests?\b.*(?:due|submit)',
+    r'\bprojects?\b.*(?:due|submit)',
+    r'\bdeadline\b.*\bfor\b',
+    r'\blate\b.*(?:penalty|points|grade)',
+    r'(?:late|missing).*(?:work|assignment|homework)',
+]]
+
+# Tech support patterns
+TECH_SUPPORT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'tech(?:nical)?\s+(?:help|support).*(?:\d+\s*hours?|24/7)',
+    r'help\s+desk.*available',
+    r'support\s+(?:is\s+)?available',
+    r'canvas\s+support',
+    r'\bit\s+support',
+    r'24/7.*support',
+    r'support.*24/7',
+    r'hotline.*\d+\s*hours?',
+    r'\d+\s*hours?.*hotline',
+    r'\d+\s*hours?\s+a\s+day.*(?:seven|7)\s+days',
+    r'(?:seven|7)\s+days.*\d+\s*hours?\s+a\s+day',
+    r'for\s+tech\s+help',
+    r'sharpp|ywca|crisis|domestic\s+violence|sexual\s+assault',
+    r'emergency.*\d{3}-\d{3}-\d{4}',
+    r'counseling.*available',
+    r'help.*button.*canvas',
+    r'walkthroughs.*tutorials',
+]]
+
+# Course duration/hours
+DURATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'course\s+runs',
+    r'total\s+(?:credit\s+)?hours',
+    r'credit\s+hours',
+    r'hours?\s+per\s+week',
+    r'hours?\s+of\s+instruction',
+    r'contact\s+hours',
+    r'lecture\s+hours',
+    r'class\s+meets.*hours',
+]]
+
+# Every group except the deadline one rules a candidate out on any hit, so
+# they are searched as a single alternation rather than pattern by pattern
+FALSE_POSITIVE_PATTERN = re.compile('|'.join(
+    f'(?:{pattern.pattern})'
+    for group in (GRADING_TURNAROUND_PATTERNS, STUDENT_MUST_CONTACT_PATTERNS,
+                  ABSENCE_NOTIFICATION_PATTERNS, GRADE_RELATED_PATTERNS,
+                  STUDENT_ABSENCE_PATTERNS, TECH_SUPPORT_PATTERNS, DURATION_PATTERNS)
+    for pattern in group
+), re.IGNORECASE)
+
+# "More than X" is usually NOT response time
+MORE_THAN_PATTERN = re.compile(r'more\s+than\s+\d+|more\s+than\s+a\s+(?:day|hour)', re.IGNORECASE)
+
+# Deadline hits only count when nothing points at email response
+RESPONSE_CONTEXT_PATTERN = re.compile(r'email|respond|reply|contact', re.IGNORECASE)
+
+# Explicit time units: "24 hours", "next business day", "one day"
+EXPLICIT_TIME_PATTERN = re.compile(
+    r'\d+\s*(?:hour|hr|day|business\s+day)s?'
+    r'|next\s+(?:business\s+)?(?:day|weekday)'
+    r'|(?:one|a)\s+(?:business\s+)?day'
+)
+
+# Numbered hours or days in a candidate earn a scoring boost in detect()
+NUMBERED_TIME_PATTERN = re.compile(r'\d+\s*(?:hour|day)', re.IGNORECASE)
+
+# Keywords that indicate contact/communication sections
+CONTACT_KEYWORD_PATTERNS = [re.compile(re.escape(keyword), re.IGNORECASE) for keyword in [
+    'contact', 'email', 'office hour', 'communication',
+    'preferred contact', 'reach me', 'get in touch',
+    'response time', 'availability', 'questions'
+]]
+
+# Response time phrasing that opens a window even without a contact keyword
+RESPONSE_INDICATOR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'(?:respond|reply|get\s+back|answer).*(?:within|in)\s+\d+',
+    r'(?:within|in)\s+\d+.*(?:respond|reply|get\s+back)',
+    r'response\s+time',
+    r'I\s+(?:will\s+)?(?:respond|reply|get\s+back)',
+]]
+
+# Used when no contact window is found: is the opening chunk about contact at all?
+CONTACT_MENTION_PATTERN = re.compile(r'email|contact', re.IGNORECASE)
+
 
 class ResponseTimeDetector:
     """Detects instructor email response time commitments"""
 
     def __init__(self):
         self.field_name = 'response_time'
-        
-        # ================================================================
-        # COMPREHENSIVE REGEX PATTERNS
-        # Organized by phrase type for better maintainability
-        # ================================================================
-        
-        self.time_patterns = [
-            # Group 1: Direct "Response Time" mentions
-            r'(?i)response\s+time\s*:?\s*([^\n.;]{0,100}?(?:\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?[^\n.;]{0,50}?))',
-            r'(?i)email\s+response\s+time\s*:?\s*([^\n.;]{0,80})',
-            r'(?i)(\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)\s+response\s+time',
-            
-            # Group 2: "Within" patterns (most common)
-            r'(?i)(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?(?:\s+on\s+\w+)?(?:\s*\([^)]{0,30}\))?)',
-            r'(?i)(within\s+one\s+(?:business\s+)?day)',
-            r'(?i)(within\s+a\s+(?:business\s+)?day)',
-            r'(?i)(within\s+24-48\s*hours?)',
-            r'(?i)(within\s+24\s*hours?)',
-            r'(?i)(within\s+48\s*hours?)',
-            
-            # Group 3: "I respond/reply within..." patterns
-            r'(?i)I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)',
-            r'(?i)I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)',
-            r'(?i)I\s+(?:will\s+)?(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))',
-            r'(?i)I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 4: "Respond within..." (without "I")
-            r'(?i)(?:respond(?:s)?|reply|replies?|get\s+back|answer)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?(?:\s+on\s+\w+)?)',
-            r'(?i)(?:respond(?:s)?|reply|replies?|get\s+back|answer)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day|business\s+day)s?)',
-            
-            # Group 5: "Typically/Usually" patterns
-            r'(?i)(typically|usually|generally)\s+(?:respond(?:s)?|reply|replies?|get\s+back|answer)?\s*(?:to\s+emails?\s*)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?(?:\s*\([^)]{0,30}\))?)',
-            r'(?i)(typically|usually|generally)\s+(?:respond(?:s)?|reply|replies?|get\s+back|answer)?\s*(?:to\s+emails?\s*)?(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)(typically|usually|generally)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 6: "You'll/You will" patterns
-            r'(?i)you(?:\'ll|\s+will)\s+(?:get\s+a\s+)?(?:response|reply|hear\s+from\s+me)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)you(?:\'ll|\s+will)\s+(?:get\s+a\s+)?(?:response|reply|hear\s+from\s+me)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)you\s+(?:can\s+)?expect\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)you\s+(?:can\s+)?expect\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)you\s+(?:can\s+)?expect\s+to\s+hear\s+(?:from\s+me\s+)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 7: "Expect" patterns (without "you")
-            r'(?i)expect\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)expect\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 8: "No later than" patterns
-            r'(?i)(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(next\s+(?:business\s+)?(?:day|weekday))',
-            r'(?i)(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)I\'ll\s+(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(next\s+(?:business\s+)?(?:day|weekday))',
-            r'(?i)I\'ll\s+(?:respond|reply|get\s+back|answer)\s+no\s+later\s+than\s+(\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 9: "By" patterns
-            r'(?i)(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))',
-            r'(?i)I\'ll\s+(?:respond|reply|get\s+back|answer)\s+(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))',
-            r'(?i)(by\s+(?:the\s+)?next\s+(?:business\s+)?(?:day|weekday))',
-            
-            # Group 10: Specific common formats
-            r'(?i)(24-48\s*hours?)',
-            r'(?i)(24\s*hours?)(?:\s+on\s+\w+)?',
-            r'(?i)(48\s*hours?)(?:\s+on\s+\w+)?',
-            r'(?i)(one\s+(?:business\s+)?day)',
-            r'(?i)(a\s+(?:business\s+)?day)',
-            r'(?i)(\d+\s+business\s+days?)',
-            r'(?i)(same\s+(?:business\s+)?day)',
-            r'(?i)(next\s+(?:business\s+)?(?:day|weekday))',
-            
-            # Group 11: "Responses/Replies" (plural)
-            r'(?i)(?:responses|replies)\s+(?:are\s+)?(?:typically|usually|generally)?\s*(?:sent\s+)?(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)(?:responses|replies)\s+(?:are\s+)?(?:typically|usually|generally)?\s*(?:sent\s+)?(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            
-            # Group 12: "Receive" patterns
-            r'(?i)(?:you\s+(?:will\s+|\'ll\s+)?)?receive\s+(?:a\s+)?(?:response|reply)\s+(within\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-            r'(?i)(?:you\s+(?:will\s+|\'ll\s+)?)?receive\s+(?:a\s+)?(?:response|reply)\s+(in\s+\d+(?:-\d+)?\s*(?:hour|hr|day)s?)',
-        ]
-        
-        # Keywords that indicate contact/communication sections
-        self.contact_keywords = [
-            'contact', 'email', 'office hour', 'communication',
-            'preferred contact', 'reach me', 'get in touch',
-            'response time', 'availability', 'questions'
-        ]
 
     def _find_contact_windows(self, text: str) -> List[Tuple[int, int]]:
         """Find sections of text about contact/communication"""
@@ -117,23 +278,15 @@ class ResponseTimeDetector:
         windows = []
         
         # Find sections near contact keywords
-        for keyword in self.contact_keywords:
-            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+        for pattern in CONTACT_KEYWORD_PATTERNS:
             for match in pattern.finditer(text):
                 start = max(0, match.start() - 200)
                 end = min(len(text), match.end() + 800)
                 windows.append((start, end))
         
         # Also look for response time patterns directly
-        response_indicators = [
-            r'(?i)(?:respond|reply|get\s+back|answer).*(?:within|in)\s+\d+',
-            r'(?i)(?:within|in)\s+\d+.*(?:respond|reply|get\s+back)',
-            r'(?i)response\s+time',
-            r'(?i)I\s+(?:will\s+)?(?:respond|reply|get\s+back)',
-        ]
-        
-        for pattern in response_indicators:
-            for match in re.finditer(pattern, text):
+        for pattern in RESPONSE_INDICATOR_PATTERNS:
+            for match in pattern.finditer(text):
                 start = max(0, match.start() - 300)
                 end = min(len(text), match.end() + 300)
                 windows.append((start, end))
@@ -159,15 +312,12 @@ class ResponseTimeDetector:
         if not windows:
             # Fallback to first chunk if no contact keywords
             first_chunk = text[:2000]
-            if re.search(r'(?i)(email|contact)', first_chunk):
+            if CONTACT_MENTION_PATTERN.search(first_chunk):
                 return first_chunk
             return ""
         
-        contact_text = ""
-        for start, end in windows:
-            contact_text += text[start:end] + "\n"
-        
-        return contact_text
+        # Each window is followed by a newline; join once instead of growing a string
+        return "".join(text[start:end] + "\n" for start, end in windows)
 
     def _has_explicit_time(self, text: str) -> bool:
         """Check if text has explicit time mention (not vague)"""
@@ -177,11 +327,7 @@ class ResponseTimeDetector:
         text_lower = text.lower()
         
         # Check for time units
-        has_time_unit = bool(re.search(r'\d+\s*(?:hour|hr|day|business\s+day)s?', text_lower))
-        if not has_time_unit:
-            has_time_unit = bool(re.search(r'next\s+(?:business\s+)?(?:day|weekday)', text_lower))
-        if not has_time_unit:
-            has_time_unit = bool(re.search(r'(?:one|a)\s+(?:business\s+)?day', text_lower))
+        has_time_unit = bool(EXPLICIT_TIME_PATTERN.search(text_lower))
         
         # Exclude vague terms
         vague_terms = ['may vary', 'varies', 'depends', 'as soon as possible', 'asap', 'promptly', 'quickly']
@@ -210,149 +356,23 @@ class ResponseTimeDetector:
             if not has_response_context:
                 return True
         
-        # Assignment grading turnaround (NOT instructor email response)
-        grading_turnaround_patterns = [
-            r'assignments?\s+(?:will\s+)?(?:be\s+)?(?:returned|graded)',
-            r'(?:returned|graded).*assignments?',
-            r'once\s+(?:they\s+are\s+)?graded',
-            r'graded.*(?:within|in)\s+\d+',
-            r'(?:within|in)\s+\d+.*graded',
-            r'returned\s+via.*(?:within|in)\s+\d+',
-            r'turnaround.*(?:within|in)\s+\d+',
-            r'(?:within|in)\s+\d+.*turnaround',
-            r'feedback.*(?:within|in)\s+\d+.*(?:graded|returned)',
-        ]
-        for pattern in grading_turnaround_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
-        # Student must contact instructor (NOT instructor response)
-        student_must_contact_patterns = [
-            r'student\s+(?:must|should|need\s+to)\s+(?:contact|notify|email|reach)',
-            r'you\s+(?:must|should|need\s+to)\s+(?:contact|notify|email|reach)',
-            r'(?:contact|notify|email).*(?:instructor|professor).*(?:within|in)\s+\d+',
-            r'(?:within|in)\s+\d+.*(?:of|after).*(?:missed|absence|exam)',
-            r'must\s+(?:contact|notify|email|reach).*(?:within|in)\s+\d+',
-            r'(?:within|in)\s+\d+.*of\s+the\s+missed',
-        ]
-        for pattern in student_must_contact_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
-        # Class absence notification deadlines
-        absence_notification_patterns = [
-            r'miss(?:ing|ed)?\s+(?:a\s+)?class',
-            r'absence.*(?:before|after|within)',
-            r'(?:before|after).*absence',
-            r'email.*(?:instructor|professor).*(?:about|regarding).*(?:absence|missing)',
-            r'notify.*(?:instructor|professor).*(?:absence|missing)',
-            r'inform.*(?:instructor|professor).*(?:absence|missing)',
-            r'contact.*(?:instructor|professor).*(?:about|regarding).*(?:absence|missing)',
-            r'(?:absence|missing).*(?:before|after|within).*(?:email|contact|notify)',
-            r'if\s+you\s+miss\s+(?:a\s+)?class',
-            r'take\s+(?:the\s+)?responsibility',
-            r'make\s+up.*absence',
-            r'circumstances\s+for\s+missing',
-        ]
-        for pattern in absence_notification_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
-        # Grade disputes and grading-related
-        grade_related_patterns = [
-            r'discrepanc(?:y|ies)',
-            r'grade.*(?:published|posted|dispute|error|mistake|concern)',
-            r'(?:published|posted).*grade',
-            r'contact.*me.*regarding.*(?:grade|discrepanc)',
-            r'if.*you.*(?:disagree|question).*grade',
-            r'grading.*(?:error|mistake|concern)',
-            r'final.*grade.*(?:posted|published)',
-            r'regrade.*request',
-            r'appeal.*grade',
-        ]
-        for pattern in grade_related_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
+        # Grading turnaround, students contacting the instructor, absence
+        # notices, grade disputes, student absence, tech support and course
+        # hours (see FALSE_POSITIVE_PATTERN)
+        if FALSE_POSITIVE_PATTERN.search(combined):
+            return True
         
         # "More than X" is usually NOT response time
-        if re.search(r'more\s+than\s+\d+|more\s+than\s+a\s+(?:day|hour)', combined, re.IGNORECASE):
+        if MORE_THAN_PATTERN.search(combined):
             return True
         
-        # Student absence/health/performance contexts
-        student_absence_patterns = [
-            r'student\s+(?:health|support|success|absence|performance)',
-            r'extenuating\s+circumstance',
-            r'unavailable.*(?:day|hour)',
-            r'affect.*performance',
-            r'extended\s+absence',
-            r'personal.*(?:health|matter)',
-            r'dealing\s+with',
-            r'keep\s+you\s+unavailable',
-        ]
-        for pattern in student_absence_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
         # Assignment/deadline patterns
-        deadline_indicators = [
-            r'\bassignments?\b.*(?:due|submit|turn\s+in)',
-            r'(?:due|submit|turn\s+in).*\bassignments?\b',
-            r'\bhomeworks?\b.*(?:due|submit)',
-            r'(?:due|submit).*\bhomeworks?\b',
-            r'\bexams?\b.*(?:due|submit)',
-            r'\bquizz?(?:es)?\b.*(?:due|submit)',
-            r'\btests?\b.*(?:due|submit)',
-            r'\bprojects?\b.*(?:due|submit)',
-            r'\bdeadline\b.*\bfor\b',
-            r'\blate\b.*(?:penalty|points|grade)',
-            r'(?:late|missing).*(?:work|assignment|homework)',
-        ]
-        
-        for pattern in deadline_indicators:
-            if re.search(pattern, combined, re.IGNORECASE):
+        for pattern in DEADLINE_INDICATOR_PATTERNS:
+            if pattern.search(combined):
                 # Make sure it's not about email response
-                if not re.search(r'email|respond|reply|contact', combined, re.IGNORECASE):
+                if not RESPONSE_CONTEXT_PATTERN.search(combined):
                     return True
         
-        # Tech support patterns
-        tech_support_patterns = [
-            r'tech(?:nical)?\s+(?:help|support).*(?:\d+\s*hours?|24/7)',
-            r'help\s+desk.*available',
-            r'support\s+(?:is\s+)?available',
-            r'canvas\s+support',
-            r'\bit\s+support',
-            r'24/7.*support',
-            r'support.*24/7',
-            r'hotline.*\d+\s*hours?',
-            r'\d+\s*hours?.*hotline',
-            r'\d+\s*hours?\s+a\s+day.*(?:seven|7)\s+days',
-            r'(?:seven|7)\s+days.*\d+\s*hours?\s+a\s+day',
-            r'for\s+tech\s+help',
-            r'sharpp|ywca|crisis|domestic\s+violence|sexual\s+assault',
-            r'emergency.*\d{3}-\d{3}-\d{4}',
-            r'counseling.*available',
-            r'help.*button.*canvas',
-            r'walkthroughs.*tutorials',
-        ]
-        for pattern in tech_support_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
-        # Course duration/hours
-        duration_patterns = [
-            r'course\s+runs',
-            r'total\s+(?:credit\s+)?hours',
-            r'credit\s+hours',
-            r'hours?\s+per\s+week',
-            r'hours?\s+of\s+instruction',
-            r'contact\s+hours',
-            r'lecture\s+hours',
-            r'class\s+meets.*hours',
-        ]
-        for pattern in duration_patterns:
-            if re.search(pattern, combined, re.IGNORECASE):
-                return True
-        
         return False
 
     def _clean_response_time(self, text: str) -> str:
@@ -390,9 +410,13 @@ class ResponseTimeDetector:
         best_match = None
         best_score = 0
         
-        # Try all patterns
-        for pattern in self.time_patterns:
-            for match in re.finditer(pattern, contact_text, re.MULTILINE | re.IGNORECASE):
+        # Try all patterns, skipping those whose words never appear
+        contact_lower = contact_text.lower()
+        use_prefilter = not any(ch in contact_text for ch in CASE_MISMATCH_CHARS)
+        for words, pattern in TIME_PATTERNS:
+            if use_prefilter and not any(word in contact_lower for word in words):
+                continue
+            for match in pattern.finditer(contact_text):
                 candidate = match.group(1) if match.lastindex else match.group(0)
                 candidate = candidate.strip()
                 
@@ -416,7 +440,7 @@ class ResponseTimeDetector:
                     score += 5
                 if 'within' in candidate.lower():
                     score += 3
-                if re.search(r'\d+\s*(?:hour|day)', candidate, re.IGNORECASE):
+                if NUMBERED_TIME_PATTERN.search(candidate):
                     score += 2
                 if '(' in candidate or 'business' in candidate.lower():
                     score += 1
@@ -443,7 +467,7 @@ class ResponseTimeDetector:
 
 def detect_response_time(text: str) -> str:
     """Simple wrapper - returns response time or 'Missing'"""
-    detector = ResponseTimeDetector()
+    detector = get_detector(ResponseTimeDetector)
     result = detector.detect(text)
     return result.get("content", "Missing")
 
@@ -52,6 +52,8 @@ class SLODetector:
         'course description', 'course objectives', 'course goals',
         'prerequisites', 'textbook', 'grading', 'schedule'
     ]
+    # The same headers as one alternation, searched in the lowered line
+    SECTION_HEADER_PATTERN = re.compile('|'.join(re.escape(section) for section in SECTION_HEADERS))
 
     def __init__(self):
         """Initialize with strict business rules for valid SLO titles"""
@@ -232,7 +234,7 @@ class SLODetector:
                     continue
 
                 # Stop at next section header
-                if any(section in next_line.lower() for section in self.SECTION_HEADERS):
+                if self.SECTION_HEADER_PATTERN.search(next_line.lower()):
                     break
 
                 content_lines.append(next_line)
@@ -22,134 +22,152 @@ from typing import Dict, Any, Optional, Tuple
 # Detection Configuration Constants
 MAX_DOCUMENT_LENGTH = 30000
 
+# Patterns for workload declarations
+# Note: Order matters - more specific patterns should come first
+WORKLOAD_PATTERNS = [
+    # "minimum of 3 hours of engaged time per week per credit over a 15-week semester"
+    re.compile(r'minimum\s+of\s+(\d+(?:-\d+)?)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester', re.IGNORECASE),
 
-class WorkloadDetector:
-    """
-    Detector for workload/engaged time information in syllabus documents.
+    # "minimum 3 hours of engaged time per week per credit over a 15-week semester"
+    re.compile(r'minimum\s+(\d+)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester', re.IGNORECASE),
 
-    This detector identifies workload expectations and time commitment declarations
-    commonly found in academic syllabi. It searches for patterns describing:
-    - Hours of engaged time per week per credit
-    - Total hours of student work per term
-    - Expected study hours outside of class
-    - Minimum work hour requirements
+    # "3 hours of engaged time per week per credit over a 15-week semester" (without "minimum")
+    re.compile(r'(\d+)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester', re.IGNORECASE),
 
-    Attributes:
-        field_name (str): The name of the field being detected ('workload').
-        logger (logging.Logger): Logger instance for this detector.
-        word_to_number (dict): Mapping of word numbers to digit strings.
-        workload_patterns (list): List of regex patterns for workload detection.
-    """
+    # "minimum of 3-4 hours per week for the completion of homework"
+    re.compile(r'minimum\s+of\s+(\d+(?:-\d+)?)\s+hours?\s+per\s+week\s+for\s+the\s+completion\s+of', re.IGNORECASE),
 
-    def __init__(self):
-        """
-        Initialize the Workload detector.
+    # "12 hours of student academic work per week for a 15 week course"
+    re.compile(r'(\d+)\s+hours?\s+of\s+student\s+academic\s+work\s+per\s+week\s+for\s+(?:a\s+)?(\d+)[-\s]+week\s+course', re.IGNORECASE),
 
-        Sets up the field name, logger, word-to-number mappings, and compiles
-        the list of regex patterns used to detect workload declarations.
-        """
-        self.field_name = 'workload'
-        self.logger = logging.getLogger('detector.workload')
+    # "minimum of 4 hours engaged time per week per credit"
+    re.compile(r'minimum\s+of\s+(\d+)\s+hours?\s+engaged\s+time\s+per\s+week\s+per\s+credit', re.IGNORECASE),
 
-        # Word-to-number mapping
-        self.word_to_number = {
-            'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
-            'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10'
-        }
+    # "minimum 3 hours engaged time per week per credit"
+    re.compile(r'minimum\s+(\d+)\s+hours?\s+engaged\s+time\s+per\s+week\s+per\s+credit', re.IGNORECASE),
 
-        # Patterns for workload declarations
-        # Note: Order matters - more specific patterns should come first
-        self.workload_patterns = [
-            # "minimum of 3 hours of engaged time per week per credit over a 15-week semester"
-            r'minimum\s+of\s+(\d+(?:-\d+)?)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester',
+    # "three hours of student academic work and engagement each week" (word numbers)
+    re.compile(r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+and\s+engagement\s+each\s+week', re.IGNORECASE),
 
-            # "minimum 3 hours of engaged time per week per credit over a 15-week semester"
-            r'minimum\s+(\d+)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester',
+    # "three hours of student academic work each week" (word numbers)
+    re.compile(r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+each\s+week', re.IGNORECASE),
 
-            # "3 hours of engaged time per week per credit over a 15-week semester" (without "minimum")
-            r'(\d+)\s+hours?\s+of\s+engaged\s+time\s+per\s+week\s+per\s+credit\s+over\s+(?:a\s+)?(\d+)[-\s]+week\s+semester',
+    # "minimum of 180 hours of total student work"
+    re.compile(r'minimum\s+of\s+(\d+)\s+hours?\s+of\s+total\s+student\s+work', re.IGNORECASE),
 
-            # "minimum of 3-4 hours per week for the completion of homework"
-            r'minimum\s+of\s+(\d+(?:-\d+)?)\s+hours?\s+per\s+week\s+for\s+the\s+completion\s+of',
+    # "minimum of three hours of student academic work" (with word numbers)
+    re.compile(r'minimum\s+of\s+(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+(?:of\s+)?student\s+academic\s+work', re.IGNORECASE),
 
-            # "12 hours of student academic work per week for a 15 week course"
-            r'(\d+)\s+hours?\s+of\s+student\s+academic\s+work\s+per\s+week\s+for\s+(?:a\s+)?(\d+)[-\s]+week\s+course',
+    # "minimum of three hours of academic work each week for each credit hour"
+    re.compile(r'minimum\s+of\s+(three|four|five|six|seven|eight|nine|ten|one|two|\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+each\s+week\s+for\s+each\s+credit', re.IGNORECASE),
 
-            # "minimum of 4 hours engaged time per week per credit"
-            r'minimum\s+of\s+(\d+)\s+hours?\s+engaged\s+time\s+per\s+week\s+per\s+credit',
+    # "45 hours of student academic work per credit per term"
+    re.compile(r'(\d+)\s+hours?\s+(?:of\s+)?(?:student\s+)?academic\s+work\s+per\s+credit', re.IGNORECASE),
 
-            # "minimum 3 hours engaged time per week per credit"
-            r'minimum\s+(\d+)\s+hours?\s+engaged\s+time\s+per\s+week\s+per\s+credit',
+    # "45 hours of course work per credit"
+    re.compile(r'(\d+)\s+hours?\s+(?:of\s+)?course\s+work\s+per\s+credit', re.IGNORECASE),
 
-            # "three hours of student academic work and engagement each week" (word numbers)
-            r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+and\s+engagement\s+each\s+week',
+    # "expected to involve a minimum of X hours"
+    re.compile(r'expected\s+to\s+involve\s+a\s+minimum\s+of\s+(\d+)\s+hours?', re.IGNORECASE),
 
-            # "three hours of student academic work each week" (word numbers)
-            r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+each\s+week',
+    # "expected to spend a minimum of X hours each week on their academic work"
+    re.compile(r'expected\s+to\s+spend\s+a\s+minimum\s+of\s+(\d+)\s+hours?\s+each\s+week\s+on\s+their\s+academic\s+work', re.IGNORECASE),
 
-            # "minimum of 180 hours of total student work"
-            r'minimum\s+of\s+(\d+)\s+hours?\s+of\s+total\s+student\s+work',
+    # "expected to spend at least X hours per week on this class"
+    re.compile(r'expected\s+to\s+spend\s+at\s+least\s+(\d+)\s+hours?\s+per\s+week\s+on\s+this\s+class', re.IGNORECASE),
 
-            # "minimum of three hours of student academic work" (with word numbers)
-            r'minimum\s+of\s+(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+(?:of\s+)?student\s+academic\s+work',
+    # "You are expected to study at least X hours outside class every week" (very common!)
+    re.compile(r'expected\s+to\s+study\s+at\s+least\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class\s+every\s+week', re.IGNORECASE),
 
-            # "minimum of three hours of academic work each week for each credit hour"
-            r'minimum\s+of\s+(three|four|five|six|seven|eight|nine|ten|one|two|\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+each\s+week\s+for\s+each\s+credit',
+    # "You are expected to study at least X hours outside class" (without "every week")
+    re.compile(r'expected\s+to\s+study\s+at\s+least\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class', re.IGNORECASE),
 
-            # "45 hours of student academic work per credit per term"
-            r'(\d+)\s+hours?\s+(?:of\s+)?(?:student\s+)?academic\s+work\s+per\s+credit',
+    # "You are expected to study X hours outside class every week" (without "at least")
+    re.compile(r'expected\s+to\s+study\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class\s+every\s+week', re.IGNORECASE),
 
-            # "45 hours of course work per credit"
-            r'(\d+)\s+hours?\s+(?:of\s+)?course\s+work\s+per\s+credit',
+    # "expected to at least study X hours outside class" (different word order)
+    re.compile(r'expected\s+to\s+at\s+least\s+study\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class', re.IGNORECASE),
 
-            # "expected to involve a minimum of X hours"
-            r'expected\s+to\s+involve\s+a\s+minimum\s+of\s+(\d+)\s+hours?',
+    # "expected to allocate X to Y hours outside of class"
+    re.compile(r'expected\s+to\s+allocate\s+(\d+)\s+to\s+(\d+)\s+hours?\s+outside\s+(?:of\s+)?class', re.IGNORECASE),
 
-            # "expected to spend a minimum of X hours each week on their academic work"
-            r'expected\s+to\s+spend\s+a\s+minimum\s+of\s+(\d+)\s+hours?\s+each\s+week\s+on\s+their\s+academic\s+work',
+    # "You are expected to engage in outside class learning X hours every week"
+    re.compile(r'expected\s+to\s+engage\s+in\s+outside\s+class\s+learning\s+(\d+)\s+hours\s+every\s+week', re.IGNORECASE),
 
-            # "expected to spend at least X hours per week on this class"
-            r'expected\s+to\s+spend\s+at\s+least\s+(\d+)\s+hours?\s+per\s+week\s+on\s+this\s+class',
+    # "You are expected to engage in outside class learning X hours" (without every week)
+    re.compile(r'expected\s+to\s+engage\s+in\s+outside\s+class\s+learning\s+(\d+)\s+hours', re.IGNORECASE),
 
-            # "You are expected to study at least X hours outside class every week" (very common!)
-            r'expected\s+to\s+study\s+at\s+least\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class\s+every\s+week',
+    # "minimum of 180 hours in a professional setting"
+    re.compile(r'minimum\s+of\s+(\d+)\s+hours?\s+in\s+a\s+professional\s+setting', re.IGNORECASE),
 
-            # "You are expected to study at least X hours outside class" (without "every week")
-            r'expected\s+to\s+study\s+at\s+least\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class',
+    # "complete the minimal X hours of onsite work"
+    re.compile(r'complete\s+the\s+minim(?:al|um)\s+(\d+)\s+hours?\s+(?:of\s+)?(?:onsite|on-site)\s+work', re.IGNORECASE),
 
-            # "You are expected to study X hours outside class every week" (without "at least")
-            r'expected\s+to\s+study\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class\s+every\s+week',
+    # "X hours per week for graduate students" or "X hours per week"
+    re.compile(r'(\d+)\s+hours?\s+per\s+week(?:\s+for\s+(?:graduate|undergraduate)\s+students)?', re.IGNORECASE),
 
-            # "expected to at least study X hours outside class" (different word order)
-            r'expected\s+to\s+at\s+least\s+study\s+(\d+(?:-\d+)?)\s+hours?\s+outside\s+(?:of\s+)?class',
+    # "1 credit = 3 hours of academic work per week"
+    re.compile(r'(\d+)\s+credit\s*=\s*(\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+per\s+week', re.IGNORECASE),
 
-            # "expected to allocate X to Y hours outside of class"
-            r'expected\s+to\s+allocate\s+(\d+)\s+to\s+(\d+)\s+hours?\s+outside\s+(?:of\s+)?class',
+    # "X work hours for Y credits" or "X hours for Y credit"
+    re.compile(r'(\d+)\s+(?:work\s+)?hours?\s+for\s+(\d+)\s+credits?', re.IGNORECASE),
 
-            # "You are expected to engage in outside class learning X hours every week"
-            r'expected\s+to\s+engage\s+in\s+outside\s+class\s+learning\s+(\d+)\s+hours\s+every\s+week',
+    # "12 hours/week (4 credits x 3 hours per credit)" - this should be lower priority
+    re.compile(r'(\d+)\s+hours?/week\s*\([^)]*credits?\s*x\s*\d+\s+hours?\s+per\s+credit[^)]*\)', re.IGNORECASE),
+]
 
-            # "You are expected to engage in outside class learning X hours" (without every week)
-            r'expected\s+to\s+engage\s+in\s+outside\s+class\s+learning\s+(\d+)\s+hours',
+# Generic boilerplate patterns (UNH policy text) - these should be deprioritized
+# These patterns often appear in syllabi as policy text, not course-specific workload
+GENERIC_WORKLOAD_PATTERNS = frozenset({
+    r'(\d+)\s+hours?\s+(?:of\s+)?(?:student\s+)?academic\s+work\s+per\s+credit',
+    r'(\d+)\s+hours?\s+(?:of\s+)?course\s+work\s+per\s+credit',
+    r'(\d+)\s+credit\s*=\s*(\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+per\s+week',
+    r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+each\s+week',
+})
 
-            # "minimum of 180 hours in a professional setting"
-            r'minimum\s+of\s+(\d+)\s+hours?\s+in\s+a\s+professional\s+setting',
+# Text clean-up applied before matching
+# Unicode dashes: en-dash, em-dash, hyphen, non-breaking hyphen, figure dash, etc.
+DASH_PATTERN = re.compile(r'[\u2010\u2011\u2012\u2013\u2014\u2015\u2212\uFE58\uFE63\uFF0D]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7F]+')
 
-            # "complete the minimal X hours of onsite work"
-            r'complete\s+the\s+minim(?:al|um)\s+(\d+)\s+hours?\s+(?:of\s+)?(?:onsite|on-site)\s+work',
 
-            # "X hours per week for graduate students" or "X hours per week"
-            r'(\d+)\s+hours?\s+per\s+week(?:\s+for\s+(?:graduate|undergraduate)\s+students)?',
+class WorkloadDetector:
+    """
+    Detector for workload/engaged time information in syllabus documents.
 
-            # "1 credit = 3 hours of academic work per week"
-            r'(\d+)\s+credit\s*=\s*(\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+per\s+week',
+    This detector identifies workload expectations and time commitment declarations
+    commonly found in academic syllabi. It searches for patterns describing:
+    - Hours of engaged time per week per credit
+    - Total hours of student work per term
+    - Expected study hours outside of class
+    - Minimum work hour requirements
 
-            # "X work hours for Y credits" or "X hours for Y credit"
-            r'(\d+)\s+(?:work\s+)?hours?\s+for\s+(\d+)\s+credits?',
+    Attributes:
+        field_name (str): The name of the field being detected ('workload').
+        logger (logging.Logger): Logger instance for this detector.
+        word_to_number (dict): Mapping of word numbers to digit strings.
+        workload_patterns (list): List of compiled regex patterns for workload detection.
+    """
 
-            # "12 hours/week (4 credits x 3 hours per credit)" - this should be lower priority
-            r'(\d+)\s+hours?/week\s*\([^)]*credits?\s*x\s*\d+\s+hours?\s+per\s+credit[^)]*\)',
-        ]
+    def __init__(self):
+        """
+        Initialize the Workload detector.
+
+        Sets up the field name, logger, word-to-number mappings, and the list
+        of compiled regex patterns used to detect workload declarations.
+        """
+        self.field_name = 'workload'
+        self.logger = logging.getLogger('detector.workload')
+
+        # Word-to-number mapping
+        self.word_to_number = {
+            'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+            'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10'
+        }
+
+        # Workload patterns are compiled once at import (see WORKLOAD_PATTERNS)
+        self.workload_patterns = WORKLOAD_PATTERNS
 
     def detect(self, text: str) -> Dict[str, Any]:
         """
@@ -210,27 +228,18 @@ class WorkloadDetector:
         # First, normalize various dash/hyphen characters to standard hyphen
         cleaned_text = text
         # Unicode dashes: en-dash, em-dash, hyphen, non-breaking hyphen, figure dash, etc.
-        cleaned_text = re.sub(r'[\u2010\u2011\u2012\u2013\u2014\u2015\u2212\uFE58\uFE63\uFF0D]', '-', cleaned_text)
+        cleaned_text = DASH_PATTERN.sub('-', cleaned_text)
         # Replace newlines with spaces
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+        cleaned_text = WHITESPACE_PATTERN.sub(' ', cleaned_text)
         # Remove remaining special characters like bullets, diamonds, etc.
-        cleaned_text = re.sub(r'[^\x00-\x7F]+', ' ', cleaned_text)
+        cleaned_text = NON_ASCII_PATTERN.sub(' ', cleaned_text)
 
         # Collect all potential matches with their positions and pattern index
         candidates = []
 
-        # Generic boilerplate patterns (UNH policy text) - these should be deprioritized
-        # These patterns often appear in syllabi as policy text, not course-specific workload
-        generic_patterns = {
-            r'(\d+)\s+hours?\s+(?:of\s+)?(?:student\s+)?academic\s+work\s+per\s+credit',
-            r'(\d+)\s+hours?\s+(?:of\s+)?course\s+work\s+per\s+credit',
-            r'(\d+)\s+credit\s*=\s*(\d+)\s+hours?\s+(?:of\s+)?academic\s+work\s+per\s+week',
-            r'(three|four|five|six|seven|eight|nine|ten|one|two)\s+hours?\s+of\s+student\s+academic\s+work\s+each\s+week',
-        }
-
         for pattern_idx, pattern in enumerate(self.workload_patterns):
-            is_generic = pattern in generic_patterns
-            for match in re.finditer(pattern, cleaned_text, re.IGNORECASE):
+            is_generic = pattern.pattern in GENERIC_WORKLOAD_PATTERNS
+            for match in pattern.finditer(cleaned_text):
                 full_match = match.group(0).strip()
                 position = match.start()
 
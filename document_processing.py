@@ -94,7 +94,7 @@ def extract_text_from_pdf(pdf_path):
             logging.warning(f"Low character count per page ({avg_per_page:.0f}) - possible scanned/image-based PDF")
             logging.info("Attempting alternative extraction methods...")
             
-            # Try PyPDF2 as alternative
+            # Try PyMuPDF / PyPDF2 as alternatives
             alternative_text = try_alternative_pdf_extraction(pdf_path)
             if alternative_text and len(alternative_text) > len(combined_text):
                 logging.info(f"Alternative extraction yielded {len(alternative_text)} characters (vs {len(combined_text)})")
@@ -115,8 +115,30 @@ def try_alternative_pdf_extraction(pdf_path):
     """
     alternative_text = None
     
-    # Try PyPDF2
-    if PYPDF2_AVAILABLE:
+    # Try PyMuPDF first: its C parser is much faster than pure-Python PyPDF2
+    if PYMUPDF_AVAILABLE:
+        try:
+            with fitz.open(pdf_path) as doc:
+                pages_text = []
+                
+                for page_num, page in enumerate(doc, 1):
+                    page_text = page.get_text()
+                    
+                    if page_text:
+                        pages_text.append(page_text)
+                        logging.info(f"PyMuPDF - Page {page_num}: {len(page_text)} characters")
+                    else:
+                        logging.warning(f"PyMuPDF - Page {page_num}: No text extracted")
+            
+            if pages_text:
+                alternative_text = "\n".join(pages_text)
+                logging.info(f"PyMuPDF total: {len(alternative_text)} characters")
+                    
+        except Exception as e:
+            logging.error(f"PyMuPDF extraction failed: {e}")
+    
+    # Try PyPDF2 if PyMuPDF didn't work or isn't available
+    if (not alternative_text or len(alternative_text) < 5000) and PYPDF2_AVAILABLE:
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -134,39 +156,14 @@ def try_alternative_pdf_extraction(pdf_path):
                         logging.error(f"PyPDF2 - Page {page_num} error: {e}")
                 
                 if pages_text:
-                    alternative_text = "\n".join(pages_text)
-                    logging.info(f"PyPDF2 total: {len(alternative_text)} characters")
+                    pypdf2_text = "\n".join(pages_text)
+                    logging.info(f"PyPDF2 total: {len(pypdf2_text)} characters")
                     
-        except Exception as e:
-            logging.error(f"PyPDF2 extraction failed: {e}")
-    
-    # Try PyMuPDF if PyPDF2 didn't work or isn't available
-    if (not alternative_text or len(alternative_text) < 5000) and PYMUPDF_AVAILABLE:
-        try:
-            doc = fitz.open(pdf_path)
-            pages_text = []
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                page_text = page.get_text()
-                
-                if page_text:
-                    pages_text.append(page_text)
-                    logging.info(f"PyMuPDF - Page {page_num + 1}: {len(page_text)} characters")
-                else:
-                    logging.warning(f"PyMuPDF - Page {page_num + 1}: No text extracted")
-            
-            doc.close()
-            
-            if pages_text:
-                pymupdf_text = "\n".join(pages_text)
-                logging.info(f"PyMuPDF total: {len(pymupdf_text)} characters")
-                
-                if not alternative_text or len(pymupdf_text) > len(alternative_text):
-                    alternative_text = pymupdf_text
+                    if not alternative_text or len(pypdf2_text) > len(alternative_text):
+                        alternative_text = pypdf2_text
                     
         except Exception as e:
-            logging.error(f"PyMuPDF extraction failed: {e}")
+            logging.error(f"PyPDF2 extraction failed: {e}")
     
     return alternative_text
 
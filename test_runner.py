@@ -11,12 +11,25 @@ Now also captures SLO text and writes it to JSON only (no terminal SLO prints),
 Includes support for assignment_types_title, deadline_expectations_title, response_time, and grading_process fields.
 """
 import os
+import re
 import sys
+import glob
 import json
+import hashlib
 import argparse
+import functools
+import importlib.metadata
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
+# Faster JSON parsing for the ground truth file when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Constants
 FUZZY_MATCH_THRESHOLD = 0.80
 SUPPORTED_FIELDS = (
@@ -30,6 +43,16 @@ SUPPORTED_FIELDS = (
     "class_location",
     "grading_process"
 )
+# Words marking an online-only class location in GT, and an online modality
+ONLINE_LOCATION_INDICATORS = ("online", "canvas", "zoom", "teams", "webex", "remote", "tbd")
+ONLINE_MODALITY_WORDS = ("online", "remote", "zoom", "teams", "webex")
+
+# Per-file predictions from earlier runs, reused while the file and the
+# detector code are unchanged (see cached_preds_path)
+CACHE_DIR = os.path.join(".cache", "test_runner")
+# Distributions document_processing extracts text with; which of them are
+# installed, and at what version, decides the text each syllabus yields
+EXTRACTION_PACKAGES = ("pdfplumber", "pdfminer.six", "PyMuPDF", "PyPDF2", "python-docx")
 
 # Add repo root to path
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "."))
@@ -39,6 +62,7 @@ for p in (REPO_ROOT, PARENT):
         sys.path.append(p)
 
 from document_processing import extract_text_from_pdf, extract_text_from_docx
+from detectors import get_detector
 
 # ------------------ Detector Imports ------------------
 try:
@@ -154,6 +178,9 @@ except Exception:
 def norm(s):
     if s is None:
         return ""
+    # Plain numbers ("3", "4.0" - most credit hours) are already normalized
+    if type(s) is str and (s.isdigit() or s.replace(".", "", 1).isdigit()):
+        return s
     return " ".join(str(s).strip().lower().split())
 
 def has_value(value):
@@ -214,8 +241,6 @@ def loose_compare(gt, pred):
 
 def compare_grading_scale(gt, pred):
     """Compare grading scales - focus on grade letters found rather than exact formatting."""
-    import re
-    
     # Normalize empty values
     def is_empty(value):
         if not value:
@@ -302,6 +327,7 @@ def compare_modality(gt, pred):
     # Both normalized values should match
     return gt_norm == pred_norm
 
+@functools.lru_cache(maxsize=2048)
 def normalize_location(s):
     """
     Normalize location strings for better matching.
@@ -310,6 +336,8 @@ def normalize_location(s):
     - Remove extra spaces
     - Lowercase
     - Handle P149 <-> Pandora 149 equivalence
+
+    Memoized: the same locations recur across ground-truth records.
     """
     s = s.strip().lower()
 
@@ -319,8 +347,7 @@ def normalize_location(s):
 
     # Room prefix variations - normalize all "rm" variants to "room "
     # Handle "rm." "rm " and "rm" followed by number
-    import re as re_local
-    s = re_local.sub(r'\brm\.?\s*', 'room ', s)
+    s = re.sub(r'\brm\.?\s*', 'room ', s)
     s = s.replace("classroom:", "room ")
     s = s.replace("classroom ", "room ")
 
@@ -334,8 +361,6 @@ def normalize_location(s):
     # Handle P[number] <-> Pandora [number] equivalence
     # "pandora 149" -> "p149" and "room p149" -> "p149"
     # This allows "PANDRA 149" and "Room P149" to match
-    import re
-
     # First, normalize "P 146" (with space) to "p146" (no space)
     s = re.sub(r'\bp\s+(\d+)\b', r'p\1', s)
 
@@ -367,15 +392,12 @@ def compare_class_location(gt, pred, modality):
     if g in ("missing", "tbd", "not specified", "n/a", ""):
         return p in ("", "missing")
 
-    # Check if GT indicates an online-only course
-    online_indicators = ["online", "canvas", "zoom", "teams", "webex", "remote", "tbd"]
-    gt_is_online = any(indicator in g for indicator in online_indicators)
-
     # Special case: GT says online and modality confirms it's online/remote
-    # Empty prediction is acceptable (no physical location expected)
-    if gt_is_online and modality:
+    # Empty prediction is acceptable (no physical location expected).
+    # Without a modality there is nothing to confirm, so skip the GT scan
+    if modality and any(indicator in g for indicator in ONLINE_LOCATION_INDICATORS):
         modality_norm = norm(modality)
-        modality_is_online = any(word in modality_norm for word in ["online", "remote", "zoom", "teams", "webex"])
+        modality_is_online = any(word in modality_norm for word in ONLINE_MODALITY_WORDS)
         if modality_is_online:
             # Both empty or pred is empty when GT says "online/remote"
             if p in ("", "missing") or g == p:
@@ -445,7 +467,7 @@ def detect_all_fields(text: str) -> dict:
 
     # SLOs (capture flag + text)
     if SLO_AVAILABLE:
-        slo = SLODetector().detect(text)
+        slo = get_detector(SLODetector).detect(text)
         preds["has_slos"] = bool(slo.get("found"))
         content = slo.get("content")
         if isinstance(content, list):
@@ -459,7 +481,7 @@ def detect_all_fields(text: str) -> dict:
 
     # Email
     if EMAIL_AVAILABLE:
-        email_result = EmailDetector().detect(text)
+        email_result = get_detector(EmailDetector).detect(text)
         content = email_result.get("content")
         # Now returns string directly, but handle legacy list format for safety
         if isinstance(content, list) and content:
@@ -471,21 +493,21 @@ def detect_all_fields(text: str) -> dict:
 
     # Credit Hours
     if CREDIT_HOURS_AVAILABLE:
-        c = CreditHoursDetector().detect(text)
+        c = get_detector(CreditHoursDetector).detect(text)
         preds["credit_hour"] = c.get("content", "Missing") if c.get("found") else "Missing"
     else:
         preds["credit_hour"] = "Missing"
 
     # Workload
     if WORKLOAD_AVAILABLE:
-        w = WorkloadDetector().detect(text)
+        w = get_detector(WorkloadDetector).detect(text)
         preds["workload"] = w.get("content", "Missing") if w.get("found") else "Missing"
     else:
         preds["workload"] = "Missing"
 
     # Instructor
     if INSTRUCTOR_AVAILABLE:
-        instructor_result = InstructorDetector().detect(text)
+        instructor_result = get_detector(InstructorDetector).detect(text)
         preds["instructor_name"] = instructor_result.get("name", "Missing")
         preds["instructor_title"] = instructor_result.get("title", "Missing")
         preds["instructor_department"] = instructor_result.get("department", "Missing")
@@ -496,7 +518,7 @@ def detect_all_fields(text: str) -> dict:
 
     # Office Information
     if OFFICE_INFO_AVAILABLE:
-        o = OfficeInformationDetector().detect(text)
+        o = get_detector(OfficeInformationDetector).detect(text)
         preds["office_address"] = o.get("office_location", {}).get("content", "Missing") if o.get("office_location", {}).get("found") else "Missing"
         preds["office_hours"] = o.get("office_hours", {}).get("content", "Missing") if o.get("office_hours", {}).get("found") else "Missing"
         preds["office_phone"] = o.get("phone", {}).get("content", "Missing") if o.get("phone", {}).get("found") else "Missing"
@@ -507,14 +529,14 @@ def detect_all_fields(text: str) -> dict:
 
     # Preferred Contact Method
     if PREFERRED_CONTACT_AVAILABLE:
-        pc = PreferredDetector().detect(text)
+        pc = get_detector(PreferredDetector).detect(text)
         preds["preferred_contact_method"] = pc.get("content", "Missing") if pc.get("found") else "Missing"
     else:
         preds["preferred_contact_method"] = "Missing"
 
     # Assignment Types
     if ASSIGNMENT_TYPES_AVAILABLE:
-        a = AssignmentTypesDetector().detect(text)
+        a = get_detector(AssignmentTypesDetector).detect(text)
         preds["assignment_types_title"] = a.get("content", "Missing") if a.get("found") else "Missing"
     else:
         preds["assignment_types_title"] = "Missing"
@@ -524,7 +546,7 @@ def detect_all_fields(text: str) -> dict:
 
     # Deadline Expectations
     if DEADLINE_EXPECTATIONS_AVAILABLE:
-        d = LateDetector().detect(text)
+        d = get_detector(LateDetector).detect(text)
         # Extract just the title (first line) from content
         content = d.get("content", "")
         if content and d.get("found"):
@@ -536,35 +558,35 @@ def detect_all_fields(text: str) -> dict:
 
     # Assignment Delivery
     if ASSIGNMENT_DELIVERY_AVAILABLE:
-        ad = AssignmentDeliveryDetector().detect(text)
+        ad = get_detector(AssignmentDeliveryDetector).detect(text)
         preds["assignment_delivery"] = ad.get("content", "Missing") if ad.get("found") else "Missing"
     else:
         preds["assignment_delivery"] = "Missing"
 
     # Grading Scale
     if GRADING_SCALE_AVAILABLE:
-        gs = GradingScaleDetector().detect(text)
+        gs = get_detector(GradingScaleDetector).detect(text)
         preds["final_grade_scale"] = gs.get("content", "Missing") if gs.get("found") else "Missing"
     else:
         preds["final_grade_scale"] = "Missing"
 
     # Response Time
     if RESPONSE_TIME_AVAILABLE:
-        rt = ResponseTimeDetector().detect(text)
+        rt = get_detector(ResponseTimeDetector).detect(text)
         preds["response_time"] = rt.get("content", "Missing") if rt.get("found") else "Missing"
     else:
         preds["response_time"] = "Missing"
 
     # Grading Process
     if GRADING_PROCESS_AVAILABLE:
-        gp = GradingProcessDetector().detect(text)
+        gp = get_detector(GradingProcessDetector).detect(text)
         preds["grading_process"] = gp.get("content", "Missing") if gp.get("found") else "Missing"
     else:
         preds["grading_process"] = "Missing"
 
     # Class Location
     if CLASS_LOCATION_AVAILABLE:
-        cl = ClassLocationDetector().detect(text)
+        cl = get_detector(ClassLocationDetector).detect(text)
         preds["class_location"] = cl.get("content", "Missing") if cl.get("found") else "Missing"
     else:
         preds["class_location"] = "Missing"
@@ -575,11 +597,71 @@ def detect_all_fields(text: str) -> dict:
 # MAIN
 # ======================================================================
 
+def load_ground_truth(path: str):
+    """Load the ground truth records, parsing with orjson when it's installed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def detector_version() -> str:
+    """
+    Hash of the code that turns a syllabus file into predictions.
+
+    Part of every result cache key, so editing a detector, the text
+    extraction or detect_all_fields invalidates earlier cached results.
+    The installed extraction packages and their versions are hashed too,
+    since installing, removing or upgrading one changes the extracted text.
+    """
+    sources = sorted(glob.glob(os.path.join(REPO_ROOT, "detectors", "*.py")))
+    sources += [os.path.join(REPO_ROOT, "document_processing.py"), os.path.abspath(__file__)]
+    h = hashlib.blake2b(digest_size=16)
+    for path in sources:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    for package in EXTRACTION_PACKAGES:
+        try:
+            version = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        h.update(f"{package}={version};".encode())
+    return h.hexdigest()
+
+
+def cached_preds_path(cache_dir: str, fpath: str, version: str) -> str:
+    """Cache file for one syllabus, keyed by its path, mtime and detector_version()."""
+    key = f"{os.path.abspath(fpath)}:{os.stat(fpath).st_mtime_ns}:{version}"
+    return os.path.join(cache_dir, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".json")
+
+
+def extract_and_detect(fpath: str):
+    """
+    Extract text from one syllabus file and run every detector on it.
+
+    Kept at module level so worker processes can run it. Returns
+    (preds, None) on success or (None, error_message) if the file can't be read.
+    """
+    try:
+        if fpath.lower().endswith(".pdf"):
+            text = extract_text_from_pdf(fpath) or ""
+        else:
+            text = extract_text_from_docx(fpath) or ""
+    except Exception as e:
+        return None, str(e)
+    return detect_all_fields(text), None
+
+
 def main():
     ap = argparse.ArgumentParser(description="Run detectors vs ground_truth.json")
     ap.add_argument("--syllabi", default="ground_truth_syllabus", help="Folder with PDFs/DOCX")
     ap.add_argument("--ground_truth", default="ground_truth.json", help="Ground truth JSON")
     ap.add_argument("--output", default="test_results.json", help="Output JSON file")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Processes for text extraction + detection (default: CPU count, 1 = serial)")
+    ap.add_argument("--cache_dir", default=CACHE_DIR, help="Folder for cached per-file predictions")
+    ap.add_argument("--no_cache", action="store_true", help="Re-run every file and don't touch the cache")
     args = ap.parse_args()
 
     print(f"\n[INFO] Folder: {os.path.abspath(args.syllabi)}")
@@ -589,8 +671,7 @@ def main():
         print("[ERROR] Missing folder or JSON.")
         sys.exit(1)
 
-    with open(args.ground_truth, "r", encoding="utf-8") as f:
-        gt_data = json.load(f)
+    gt_data = load_ground_truth(args.ground_truth)
 
     print(f"\nFound {len(gt_data)} records in ground truth.")
 
@@ -602,200 +683,242 @@ def main():
     field_stats = defaultdict(lambda: {"TP": 0, "FP": 0, "FN": 0, "TN": 0})
     details = []
 
-    for i, record in enumerate(gt_data, 1):
-        fname = record.get("filename", "")
-        fpath = os.path.join(args.syllabi, fname)
-        if not os.path.exists(fpath):
-            print(f"[{i}] [ERROR] Missing file: {fname}")
-            continue
-
-        # Extract text
-        try:
-            if fpath.lower().endswith(".pdf"):
-                text = extract_text_from_pdf(fpath) or ""
+    # Extraction and detection are independent per file, so they run across
+    # worker processes; results come back in ground-truth order and are
+    # compared below one record at a time, exactly as in a serial run
+    fpaths = [os.path.join(args.syllabi, record.get("filename", "")) for record in gt_data]
+    found = [os.path.exists(fpath) for fpath in fpaths]
+    existing = [fpath for fpath, ok in zip(fpaths, found) if ok]
+
+    # Files unchanged since an earlier run with the same detector code reuse
+    # that run's predictions; only the rest are extracted and detected
+    cache_paths = {}
+    cached = {}
+    if not args.no_cache:
+        os.makedirs(args.cache_dir, exist_ok=True)
+        version = detector_version()
+        for fpath in existing:
+            cache_paths[fpath] = cache_path = cached_preds_path(args.cache_dir, fpath, version)
+            if os.path.exists(cache_path):
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached[fpath] = json.load(f)
+        print(f"[INFO] Cached results reused for {len(cached)} file(s)")
+    todo = [fpath for fpath in existing if fpath not in cached]
+
+    if args.workers == 1 or len(todo) < 2:
+        outcomes = map(extract_and_detect, todo)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        outcomes = executor.map(extract_and_detect, todo, chunksize=4)
+
+    try:
+        for i, (record, ok) in enumerate(zip(gt_data, found), 1):
+            fname = record.get("filename", "")
+            if not ok:
+                print(f"[{i}] [ERROR] Missing file: {fname}")
+                continue
+
+            fpath = fpaths[i - 1]
+            if fpath in cached:
+                preds, error = cached[fpath], None
             else:
-                text = extract_text_from_docx(fpath) or ""
-        except Exception as e:
-            print(f"[{i}] Error reading {fname}: {e}")
-            continue
-
-        preds = detect_all_fields(text)
-        result = {"filename": fname}
-
-        # Modality
-        if "modality" in record:
-            gt_val = record["modality"]
-            pred_val = preds.get("modality", "")
-            match = compare_modality(gt_val, pred_val)
-            update_field_stats(field_stats["modality"], gt_val, pred_val, match)
-            result["modality"] = {"gt": gt_val, "pred": pred_val, "match": match}
+                preds, error = next(outcomes)
+                if error is None and fpath in cache_paths:
+                    with open(cache_paths[fpath], "w", encoding="utf-8") as f:
+                        json.dump(preds, f, ensure_ascii=False)
+            if error is not None:
+                print(f"[{i}] Error reading {fname}: {error}")
+                continue
+
+            result = {"filename": fname}
+
+            # Modality
+            if "modality" in record:
+                gt_val = record["modality"]
+                pred_val = preds.get("modality", "")
+                match = compare_modality(gt_val, pred_val)
+                update_field_stats(field_stats["modality"], gt_val, pred_val, match)
+                result["modality"] = {"gt": gt_val, "pred": pred_val, "match": match}
             
-        # SLOs: compare presence, store texts (JSON only)
-        if "SLOs" in record:
-            gt_val = record.get("SLOs", "")
-            pred_val = preds.get("slos_text", "Missing")
+            # SLOs: compare presence, store texts (JSON only)
+            if "SLOs" in record:
+                gt_val = record.get("SLOs", "")
+                pred_val = preds.get("slos_text", "Missing")
             
-            # FIXED: Use has_value() to properly determine if GT has SLOs
-            gt_has = has_value(gt_val)
-            pred_has = has_value(pred_val)
-            match = (gt_has == pred_has)
-
-            update_field_stats(field_stats["SLOs"], gt_val, pred_val, match)
-
-            result["slos"] = {
-                "gt_present": gt_has,
-                "pred_present": pred_has,
-                "match": match,
-                "gt_text": str(gt_val).strip(),
-                "pred_text": pred_val
-            }
-
-        # Email
-        if "email" in record:
-            gt_val = record["email"]
-            pred_val = preds.get("email", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["email"], gt_val, pred_val, match)
-            result["email"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Credit hour
-        if "credit_hour" in record:
-            gt_val = record["credit_hour"]
-            pred_val = preds.get("credit_hour", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["credit_hour"], gt_val, pred_val, match)
-            result["credit_hour"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Workload
-        if "workload" in record:
-            gt_val = record["workload"]
-            pred_val = preds.get("workload", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["workload"], gt_val, pred_val, match)
-            result["workload"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Instructor Name
-        if "instructor_name" in record:
-            gt_val = record["instructor_name"]
-            pred_val = preds.get("instructor_name", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["instructor_name"], gt_val, pred_val, match)
-            result["instructor_name"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Instructor Title
-        if "instructor_title" in record:
-            gt_val = record["instructor_title"]
-            pred_val = preds.get("instructor_title", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["instructor_title"], gt_val, pred_val, match)
-            result["instructor_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Instructor Department
-        if "instructor_department" in record:
-            gt_val = record["instructor_department"]
-            pred_val = preds.get("instructor_department", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["instructor_department"], gt_val, pred_val, match)
-            result["instructor_department"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Office Address
-        if "office_address" in record:
-            gt_val = record["office_address"]
-            pred_val = preds.get("office_address", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["office_address"], gt_val, pred_val, match)
-            result["office_address"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Office Hours
-        if "office_hours" in record:
-            gt_val = record["office_hours"]
-            pred_val = preds.get("office_hours", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["office_hours"], gt_val, pred_val, match)
-            result["office_hours"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Office Phone
-        if "office_phone" in record:
-            gt_val = record["office_phone"]
-            pred_val = preds.get("office_phone", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["office_phone"], gt_val, pred_val, match)
-            result["office_phone"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Preferred Contact Method
-        if "preferred_contact_method" in record:
-            gt_val = record["preferred_contact_method"]
-            pred_val = preds.get("preferred_contact_method", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["preferred_contact_method"], gt_val, pred_val, match)
-            result["preferred_contact_method"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Assignment Types Title
-        if "assignment_types_title" in record:
-            gt_val = record["assignment_types_title"]
-            pred_val = preds.get("assignment_types_title", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["assignment_types_title"], gt_val, pred_val, match)
-            result["assignment_types_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Deadline Expectations Title
-        if "deadline_expectations_title" in record:
-            gt_val = record["deadline_expectations_title"]
-            pred_val = preds.get("deadline_expectations_title", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["deadline_expectations_title"], gt_val, pred_val, match)
-            result["deadline_expectations_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Assignment Delivery
-        if "assignment_delivery" in record:
-            gt_val = record["assignment_delivery"]
-            pred_val = preds.get("assignment_delivery", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["assignment_delivery"], gt_val, pred_val, match)
-            result["assignment_delivery"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        # Final Grade Scale
-        if "final_grade_scale" in record:
-            gt_val = record["final_grade_scale"]  
-            pred_val = preds.get("final_grade_scale", "Missing")    
-            match = compare_grading_scale(gt_val, pred_val)  
-            update_field_stats(field_stats["final_grade_scale"], gt_val, pred_val, match)  
-            result["final_grade_scale"] = {"gt": gt_val, "pred": pred_val, "match": match}  
+                # FIXED: Use has_value() to properly determine if GT has SLOs
+                gt_has = has_value(gt_val)
+                pred_has = has_value(pred_val)
+                match = (gt_has == pred_has)
+
+                update_field_stats(field_stats["SLOs"], gt_val, pred_val, match)
+
+                result["slos"] = {
+                    "gt_present": gt_has,
+                    "pred_present": pred_has,
+                    "match": match,
+                    "gt_text": str(gt_val).strip(),
+                    "pred_text": pred_val
+                }
+
+            # Email
+            if "email" in record:
+                gt_val = record["email"]
+                pred_val = preds.get("email", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["email"], gt_val, pred_val, match)
+                result["email"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Credit hour
+            if "credit_hour" in record:
+                gt_val = record["credit_hour"]
+                pred_val = preds.get("credit_hour", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["credit_hour"], gt_val, pred_val, match)
+                result["credit_hour"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Workload
+            if "workload" in record:
+                gt_val = record["workload"]
+                pred_val = preds.get("workload", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["workload"], gt_val, pred_val, match)
+                result["workload"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Instructor Name
+            if "instructor_name" in record:
+                gt_val = record["instructor_name"]
+                pred_val = preds.get("instructor_name", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["instructor_name"], gt_val, pred_val, match)
+                result["instructor_name"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Instructor Title
+            if "instructor_title" in record:
+                gt_val = record["instructor_title"]
+                pred_val = preds.get("instructor_title", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["instructor_title"], gt_val, pred_val, match)
+                result["instructor_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Instructor Department
+            if "instructor_department" in record:
+                gt_val = record["instructor_department"]
+                pred_val = preds.get("instructor_department", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["instructor_department"], gt_val, pred_val, match)
+                result["instructor_department"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Office Address
+            if "office_address" in record:
+                gt_val = record["office_address"]
+                pred_val = preds.get("office_address", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["office_address"], gt_val, pred_val, match)
+                result["office_address"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Office Hours
+            if "office_hours" in record:
+                gt_val = record["office_hours"]
+                pred_val = preds.get("office_hours", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["office_hours"], gt_val, pred_val, match)
+                result["office_hours"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Office Phone
+            if "office_phone" in record:
+                gt_val = record["office_phone"]
+                pred_val = preds.get("office_phone", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["office_phone"], gt_val, pred_val, match)
+                result["office_phone"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Preferred Contact Method
+            if "preferred_contact_method" in record:
+                gt_val = record["preferred_contact_method"]
+                pred_val = preds.get("preferred_contact_method", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["preferred_contact_method"], gt_val, pred_val, match)
+                result["preferred_contact_method"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Assignment Types Title
+            if "assignment_types_title" in record:
+                gt_val = record["assignment_types_title"]
+                pred_val = preds.get("assignment_types_title", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["assignment_types_title"], gt_val, pred_val, match)
+                result["assignment_types_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Deadline Expectations Title
+            if "deadline_expectations_title" in record:
+                gt_val = record["deadline_expectations_title"]
+                pred_val = preds.get("deadline_expectations_title", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["deadline_expectations_title"], gt_val, pred_val, match)
+                result["deadline_expectations_title"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Assignment Delivery
+            if "assignment_delivery" in record:
+                gt_val = record["assignment_delivery"]
+                pred_val = preds.get("assignment_delivery", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["assignment_delivery"], gt_val, pred_val, match)
+                result["assignment_delivery"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            # Final Grade Scale
+            if "final_grade_scale" in record:
+                gt_val = record["final_grade_scale"]  
+                pred_val = preds.get("final_grade_scale", "Missing")    
+                match = compare_grading_scale(gt_val, pred_val)  
+                update_field_stats(field_stats["final_grade_scale"], gt_val, pred_val, match)  
+                result["final_grade_scale"] = {"gt": gt_val, "pred": pred_val, "match": match}  
             
-        # Response Time
-        if "response_time" in record:
-            gt_val = record["response_time"]
-            pred_val = preds.get("response_time", "Missing")
-            match = loose_compare(gt_val, pred_val)
-            update_field_stats(field_stats["response_time"], gt_val, pred_val, match)
-            result["response_time"] = {"gt": gt_val, "pred": pred_val, "match": match}
+            # Response Time
+            if "response_time" in record:
+                gt_val = record["response_time"]
+                pred_val = preds.get("response_time", "Missing")
+                match = loose_compare(gt_val, pred_val)
+                update_field_stats(field_stats["response_time"], gt_val, pred_val, match)
+                result["response_time"] = {"gt": gt_val, "pred": pred_val, "match": match}
             
-        # Class Location (with smart comparison considering modality)
-        if "class_location" in record:
-            gt_val = record["class_location"]
-            pred_val = preds.get("class_location", "Missing")
-            modality_value = record.get("modality", "")
-            match = compare_class_location(gt_val, pred_val, modality_value)
-            update_field_stats(field_stats["class_location"], gt_val, pred_val, match)
-            result["class_location"] = {
-                "gt": gt_val,
-                "pred": pred_val,
-                "match": match,
-                "modality": modality_value
-            }
-        # Grading Process
-        if "grading_process" in record:
-            gt_val = record["grading_process"]
-            pred_val = preds.get("grading_process", "Missing")
-            match = compare_grading_process(gt_val, pred_val)
-            update_field_stats(field_stats["grading_process"], gt_val, pred_val, match)
-            result["grading_process"] = {"gt": gt_val, "pred": pred_val, "match": match}
-
-        details.append(result)
-
-    # Calculate summary statistics with Precision, Recall, and F1 Score
+            # Class Location (with smart comparison considering modality)
+            if "class_location" in record:
+                gt_val = record["class_location"]
+                pred_val = preds.get("class_location", "Missing")
+                modality_value = record.get("modality", "")
+                match = compare_class_location(gt_val, pred_val, modality_value)
+                update_field_stats(field_stats["class_location"], gt_val, pred_val, match)
+                result["class_location"] = {
+                    "gt": gt_val,
+                    "pred": pred_val,
+                    "match": match,
+                    "modality": modality_value
+                }
+            # Grading Process
+            if "grading_process" in record:
+                gt_val = record["grading_process"]
+                pred_val = preds.get("grading_process", "Missing")
+                match = compare_grading_process(gt_val, pred_val)
+                update_field_stats(field_stats["grading_process"], gt_val, pred_val, match)
+                result["grading_process"] = {"gt": gt_val, "pred": pred_val, "match": match}
+
+            details.append(result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Calculate summary statistics with Precision, Recall, and F1 Score.
+    # The terminal report is built up as a list of lines in the same pass
+    # (one row per field) and written in one go once the totals are known
     summary = {}
     total_tp = total_fp = total_fn = total_tn = 0
+    report = [
+        "\n" + "=" * 90,
+        "RESULTS SUMMARY - Detector Performance Metrics",
+        "=" * 90,
+        f"{'Field':<30} {'Accuracy':>9} {'Precision':>10} {'Recall':>9} {'F1 Score':>10}",
+        "-" * 90,
+    ]
 
     for field in SUPPORTED_FIELDS:
         stats = field_stats[field]
@@ -818,7 +941,7 @@ def main():
         total = tp + fp + fn + tn
         accuracy = ((tp + tn) / total) if total > 0 else 0.0
 
-        summary[field] = {
+        summary[field] = row = {
             "accuracy": round(accuracy, 4),
             "precision": round(precision, 4),
             "recall": round(recall, 4),
@@ -828,6 +951,8 @@ def main():
             "FN": fn,
             "TN": tn
         }
+        report.append(f"{field:<30} {row['accuracy']:>8.1%} {row['precision']:>10.1%} "
+                      f"{row['recall']:>9.1%} {row['f1_score']:>10.1%}")
 
         total_tp += tp
         total_fp += fp
@@ -842,30 +967,22 @@ def main():
     overall_accuracy = ((total_tp + total_tn) / overall_total) if overall_total > 0 else 0.0
 
     # Print summary to terminal with F1 Score
-    print("\n" + "=" * 90)
-    print("RESULTS SUMMARY - Detector Performance Metrics")
-    print("=" * 90)
-    print(f"{'Field':<30} {'Accuracy':>9} {'Precision':>10} {'Recall':>9} {'F1 Score':>10}")
-    print("-" * 90)
-
-    for field in SUPPORTED_FIELDS:
-        stats = summary[field]
-        print(f"{field:<30} {stats['accuracy']:>8.1%} {stats['precision']:>10.1%} "
-              f"{stats['recall']:>9.1%} {stats['f1_score']:>10.1%}")
-
-    print("-" * 90)
-    print(f"{'OVERALL':<30} {overall_accuracy:>8.1%} {overall_precision:>10.1%} "
-          f"{overall_recall:>9.1%} {overall_f1:>10.1%}")
-    print("=" * 90)
-
-    # Print explanation for non-technical audience
-    print("\nMETRIC DEFINITIONS:")
-    print("  • Accuracy:  How often the detector is correct overall")
-    print("  • Precision: When detector finds something, how often is it right?")
-    print("  • Recall:    Of all fields that exist, how many did we find?")
-    print("  • F1 Score:  Balanced measure combining Precision and Recall")
-    print("               (Higher F1 = better overall detector quality)")
-    print("=" * 90)
+    report.append("-" * 90)
+    report.append(f"{'OVERALL':<30} {overall_accuracy:>8.1%} {overall_precision:>10.1%} "
+                  f"{overall_recall:>9.1%} {overall_f1:>10.1%}")
+    report.append("=" * 90)
+
+    # Explanation for non-technical audience
+    report.extend([
+        "\nMETRIC DEFINITIONS:",
+        "  • Accuracy:  How often the detector is correct overall",
+        "  • Precision: When detector finds something, how often is it right?",
+        "  • Recall:    Of all fields that exist, how many did we find?",
+        "  • F1 Score:  Balanced measure combining Precision and Recall",
+        "               (Higher F1 = better overall detector quality)",
+        "=" * 90,
+    ])
+    sys.stdout.write("\n".join(report) + "\n")
 
     # Save results to JSON
     output_data = {
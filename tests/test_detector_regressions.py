@@ -0,0 +1,237 @@
+import re
+import sys
+from pathlib import Path
+
+# Add root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from detectors.assignment_types_detection import AssignmentTypesDetector, HEADER_KEYWORDS, KEYED_TIERS
+from detectors.class_location_detector import ClassLocationDetector
+from detectors.late_missing_work_detector import LateDetector
+from detectors.email_detector import EmailDetector
+from detectors.response_time_detector import ResponseTimeDetector
+from detectors.preferred_contact_detector import PreferredDetector
+from detectors.grading_process_detection import GradingProcessDetector
+
+# Expected outputs were recorded from the detectors before their regexes
+# were rewritten for speed; the rewrites must not change them.
+# Detectors keep no per-document state, so one instance serves every test.
+assignment_types_detector = AssignmentTypesDetector()
+class_location_detector = ClassLocationDetector()
+late_detector = LateDetector()
+email_detector = EmailDetector()
+response_time_detector = ResponseTimeDetector()
+preferred_detector = PreferredDetector()
+grading_process_detector = GradingProcessDetector()
+
+
+class TestAssignmentTypesDetector:
+    def test_title_under_header(self):
+        text = "Assignments\nHomework\nWeekly problem sets due Fridays.\n"
+        assert assignment_types_detector.detect(text) == {'found': True, 'content': 'Homework'}
+
+    def test_no_titles(self):
+        assert assignment_types_detector.detect("Nothing relevant.") == {'found': False, 'content': ''}
+
+    def test_header_dispatched_by_keyword(self):
+        text = "Lab Assignments (10%)\nChapters 1-3\n"
+        assert assignment_types_detector.detect(text) == {'found': True, 'content': 'Lab Assignments'}
+
+    def test_pattern_keys_are_header_keywords(self):
+        # A key outside HEADER_KEYWORDS would leave its pattern unreachable
+        for tier in KEYED_TIERS:
+            for key, pattern, _ in tier:
+                assert key in HEADER_KEYWORDS
+                assert re.match(r'\(\?i\)\^\\s\*\(?' + key, pattern.pattern)
+
+
+class TestClassLocationDetector:
+    def test_room_with_building(self):
+        text = "COMP 405 Software Engineering\nClass Location: Kingsbury Hall N129\nOffice: Pandora 141\n"
+        result = class_location_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'Kingsbury Hall N129'
+        assert result['confidence'] == 0.95
+
+    def test_online(self):
+        result = class_location_detector.detect("Time and Location: Tuesday 1:10pm-4pm. Online\n")
+        assert result['found'] is True
+        assert result['content'] == 'Online'
+        assert result['confidence'] == 0.98
+
+    def test_no_location(self):
+        result = class_location_detector.detect("No place is named in this text at all.")
+        assert result['found'] is False
+        assert result['content'] is None
+
+
+class TestLateDetector:
+    def test_content_pattern_with_following_line(self):
+        text = "Course Policies\nLate work will not be accepted after the due date.\nPlease plan ahead.\n"
+        result = late_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'Late work will not be accepted after the due date. Please plan ahead.'
+
+    def test_title_with_following_content(self):
+        text = ("Assignments\nLate assignments lose 10% per day.\n"
+                "Late penalty is 10% per day for each late assignment.\n")
+        result = late_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == ('Late assignments lose 10% per day.\n'
+                                     'Late penalty is 10% per day for each late assignment.')
+
+    def test_exact_title_beats_earlier_partial_title(self):
+        text = ("Late Work Policy: details below\nSome words here.\n\n"
+                "Late Work\nAssignments lose 10% per day.\nGrading\n")
+        result = late_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'Late Work\nAssignments lose 10% per day.'
+
+    def test_dotted_capital_i_uses_ignorecase_fallback(self):
+        text = "İstanbul campus\nLate work will not be accepted after the due date.\n"
+        result = late_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'Late work will not be accepted after the due date.'
+
+    def test_long_s_uses_ignorecase_fallback(self):
+        # str.lower() keeps 'ſ', but re.IGNORECASE matches it against 's'
+        text = "Reminder\nſubmissions will not be accepted after the deadline.\n"
+        result = late_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'ſubmissions will not be accepted after the deadline.'
+
+    def test_no_policy(self):
+        result = late_detector.detect("Welcome to the course. We will read many books.")
+        assert result['found'] is False
+        assert result['content'] is None
+
+
+class TestEmailDetector:
+    def test_email_near_heading(self):
+        result = email_detector.detect("Instructor: Jane Doe\nEmail: jane.doe@unh.edu\nPhone: 555-1234")
+        assert result['found'] is True
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'heading_window'}
+
+    def test_email_on_line_after_heading(self):
+        result = email_detector.detect("Instructor\nprof@unh.edu")
+        assert result['content'] == 'prof@unh.edu'
+        assert result['metadata'] == {'method': 'heading_window'}
+
+    def test_header_address_without_heading(self):
+        result = email_detector.detect("See jane.doe@unh.edu for help")
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'header_any'}
+
+    def test_fallback_past_header(self):
+        result = email_detector.detect("Welcome\n" + "a" * 1300 + " reach jane.doe@unh.edu\n")
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'fallback_any'}
+
+    def test_scan_start_walks_back_over_leading_dot(self):
+        # The local-part run before the domain starts at '.', which
+        # EMAIL_RX cannot start on, so the match begins one character later
+        result = email_detector.detect("See .jane.doe@unh.edu for help")
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'header_any'}
+
+    def test_heading_scan_past_first_prefix(self):
+        # A first line longer than the initial 8192-character prefix
+        text = "x" * 10000 + "\nWelcome\nEmail: jane.doe@unh.edu\n"
+        result = email_detector.detect(text)
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'heading_window'}
+
+    def test_heading_scan_stops_after_leading_lines(self):
+        # Long first line, then the address beyond the scanned lines
+        text = "x" * 10000 + "\nWelcome\n" + "line\n" * 200 + "Email: jane.doe@unh.edu\n"
+        result = email_detector.detect(text)
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'fallback_any'}
+
+    def test_heading_scan_with_many_short_lines(self):
+        # The first prefix already holds more lines than are scanned
+        text = "Welcome\n" + "filler line of text\n" * 600 + "Office: x\nEmail: jane.doe@unh.edu\n"
+        result = email_detector.detect(text)
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'fallback_any'}
+
+    def test_no_address(self):
+        result = email_detector.detect("Email me through Canvas.")
+        assert result['found'] is False
+        assert result['content'] == 'Missing'
+
+
+class TestResponseTimeDetector:
+    def test_within_hours(self):
+        text = "Contact: email me anytime. I respond within 24 hours on weekdays."
+        assert response_time_detector.detect(text) == {'found': True, 'content': 'within 24 hours on weekdays'}
+
+    def test_deadline_is_filtered(self):
+        text = "Assignments must be submitted within 24 hours."
+        assert response_time_detector.detect(text) == {'found': False, 'content': 'Missing'}
+
+    def test_case_mismatch_disables_prefilter(self):
+        text = "Email: I respond within 48 hours. İ"
+        assert response_time_detector.detect(text) == {'found': True, 'content': 'within 48 hours'}
+
+
+class TestPreferredDetector:
+    def test_preferred_contact(self):
+        text = "Contact Information\nPreferred contact: email at jane.doe@unh.edu\n"
+        result = preferred_detector.detect(text)
+        assert result['found'] is True
+        assert result['content'] == 'jane.doe@unh.edu'
+        assert result['metadata'] == {'method': 'heading_window'}
+
+    def test_no_address(self):
+        result = preferred_detector.detect("Preferred contact: office hours")
+        assert result['found'] is False
+
+
+class TestGradingProcessDetector:
+    def test_percent_window_with_heading(self):
+        text = "Course Grading\nHomework 30%\nMidterm Exam 30%\nFinal Project 40%\n\nOther text here."
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': 'Course Grading\nHomework 30%\nMidterm Exam 30%\nFinal Project 40%',
+        }
+
+    def test_points_window(self):
+        text = "EVALUATION\nLabs ........ 100 points\nEssays ........ 200 pts\nParticipation A5 points\n"
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': 'EVALUATION\nLabs ........ 100 points\nEssays ........ 200 pts\nParticipation A5 points',
+        }
+
+    def test_item_line_joins_window(self):
+        # "A5 points" misses points_pattern, so only item_pattern keeps the window whole
+        text = "Breakdown\nLabs 40%\nReading log A5 points\nEssays 60%\n"
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': 'Labs 40%\nReading log A5 points\nEssays 60%',
+        }
+
+    def test_percent_cluster_without_anchor(self):
+        text = "Weights\nLabs 30%\nA: 93 - 100 scale\nEssays 70%\n"
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': 'Weights\nLabs 30%\nA: 93 - 100 scale\nEssays 70%',
+        }
+
+    def test_grading_scale_lines_fall_back_to_cluster(self):
+        text = "A 100% to 94%\nB 93% to 85%\nC 84% to 75%\n"
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': 'A 100% to 94%\nB 93% to 85%\nC 84% to 75%',
+        }
+
+    def test_late_policy_lines_fall_back_to_cluster(self):
+        text = "1 day late 10% penalty\n2 days late 20% penalty\n3 days late 30% penalty\n"
+        assert grading_process_detector.detect(text) == {
+            'found': True,
+            'content': '1 day late 10% penalty\n2 days late 20% penalty\n3 days late 30% penalty',
+        }
+
+    def test_no_grading_info(self):
+        assert grading_process_detector.detect("This syllabus has no grading info") == {'found': False, 'content': ''}